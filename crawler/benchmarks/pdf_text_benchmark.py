@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for PDF page text assembly
+
+Compares the previous approach (``content +=`` per page, then cleaning the
+whole document) with the page-list pipeline in ``pdf_text`` on a large
+document built by repeating an extracted PDF from the knowledge base, and
+checks both produce the same text.
+
+Usage:
+    python benchmarks/pdf_text_benchmark.py [--scale 50] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_text import clean_page_text, join_pages  # noqa: E402
+
+DEFAULT_SOURCE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "knowledge-base",
+    "PDF_Aven-TermsOfService.txt",
+)
+PAGE_MARKER = re.compile(r"^--- Page \d+(?: \(OCR\))? ---$", re.MULTILINE)
+
+
+def legacy_clean_text(text: str) -> str:
+    """PDFProcessor._clean_text before the page-list pipeline"""
+    if not text:
+        return ""
+
+    lines = [line.strip() for line in text.splitlines()]
+    lines = [line for line in lines if line.strip()]
+    cleaned = "\n".join(lines)
+
+    return re.sub(r"(.)\1{4,}", r"\1\1", cleaned)
+
+
+def legacy_assemble(page_texts, page_methods) -> str:
+    """Per-page string concatenation followed by whole-document cleaning"""
+    content = ""
+    for page_num, (text, method) in enumerate(zip(page_texts, page_methods), 1):
+        if text.strip():
+            label = " (OCR)" if method == "OCR" else ""
+            content += f"\n--- Page {page_num}{label} ---\n"
+            content += text
+
+    return legacy_clean_text(content)
+
+
+def page_list_assemble(page_texts, page_methods) -> str:
+    """Per-page cleaning followed by a single join"""
+    return join_pages([clean_page_text(text) for text in page_texts], page_methods)
+
+
+def load_pages(path: str, scale: int):
+    """Split an extracted PDF back into pages and repeat them ``scale`` times"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    body = text.split("=" * 50, 1)[-1]
+    pages = [page for page in PAGE_MARKER.split(body) if page.strip()]
+
+    # Re-indent lines and add leader dots so cleaning has work to do
+    raw_pages = [
+        "\n".join(f"  {line}  " for line in page.splitlines()) + "\n.........\n"
+        for page in pages
+    ]
+    return raw_pages * scale
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=DEFAULT_SOURCE)
+    parser.add_argument("--scale", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page_texts = load_pages(args.source, args.scale)
+    page_methods = ["PyPDF2"] * len(page_texts)
+    size = sum(len(text) for text in page_texts)
+
+    legacy = legacy_assemble(page_texts, page_methods)
+    current = page_list_assemble(page_texts, page_methods)
+    if legacy != current:
+        sys.exit("Outputs differ between legacy and page-list assembly")
+
+    print(f"{len(page_texts)} pages, {size / 1024 / 1024:.1f} MB of raw text")
+    timings = {}
+    for name, func in (("legacy", legacy_assemble), ("page-list", page_list_assemble)):
+        timings[name] = min(
+            timeit.repeat(
+                lambda: func(page_texts, page_methods), number=1, repeat=args.repeat
+            )
+        )
+        print(f"{name:>10}: {timings[name] * 1000:8.1f} ms")
+
+    print(f"   speedup: {timings['legacy'] / timings['page-list']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Browser lifecycle management for long crawls
+"""
+
+import asyncio
+from typing import Optional
+
+from constants import (
+    USER_AGENT,
+    PAGE_RECYCLE_AFTER,
+    PAGE_HEAP_LIMIT_MB,
+    PAGE_PROBE_TIMEOUT,
+)
+from logger_utils import get_crawler_logger
+from resource_blocker import ResourceBlocker
+
+HEAP_USAGE_SCRIPT = "() => performance.memory ? performance.memory.usedJSHeapSize : 0"
+
+
+class BrowserSession:
+    """
+    Owns the Chromium instance shared by all crawl workers
+
+    When the browser crashes or disconnects, the first worker to notice
+    relaunches it; workers still holding pages from the old browser reopen
+    them on the new one.
+    """
+
+    def __init__(
+        self,
+        playwright,
+        isolate_contexts: bool = True,
+        block_service_workers: bool = False,
+    ):
+        self.playwright = playwright
+        self.isolate_contexts = isolate_contexts
+        self.block_service_workers = block_service_workers
+        self.logger = get_crawler_logger()
+
+        self.browser = None
+        self.relaunches = 0
+        self._shared_context = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        self.browser = await self.playwright.chromium.launch(headless=True)
+        self._shared_context = None
+        self.logger.info("Browser launched successfully")
+
+    async def new_context(self):
+        """Context for a worker page, shared unless contexts are isolated"""
+        if self.isolate_contexts:
+            return await self._create_context()
+
+        if self._shared_context is None:
+            self._shared_context = await self._create_context()
+        return self._shared_context
+
+    async def _create_context(self):
+        # Service workers would serve requests past the resource blocker
+        return await self.browser.new_context(
+            user_agent=USER_AGENT,
+            service_workers="block" if self.block_service_workers else "allow",
+        )
+
+    async def relaunch(self, crashed_browser) -> None:
+        """
+        Replace a crashed browser, once, no matter how many workers ask
+
+        Args:
+            crashed_browser: Browser the calling worker saw fail
+        """
+        async with self._lock:
+            if self.browser is not crashed_browser:
+                return
+
+            self.logger.warning("Browser crashed or disconnected, relaunching")
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+
+            await self.start()
+            self.relaunches += 1
+
+    async def close(self) -> None:
+        if self.browser:
+            await self.browser.close()
+            self.logger.info("Browser closed")
+
+
+class PageSlot:
+    """
+    A crawl worker's page, with its context and resource blocker
+
+    The page is recycled after ``PAGE_RECYCLE_AFTER`` navigations or once its
+    JS heap passes ``PAGE_HEAP_LIMIT_MB``, and reopened after a renderer or
+    browser crash, so memory stays flat over long crawls.
+    """
+
+    def __init__(
+        self,
+        session: BrowserSession,
+        blocking_profile: Optional[str] = None,
+        recycle_after: int = PAGE_RECYCLE_AFTER,
+        heap_limit_mb: int = PAGE_HEAP_LIMIT_MB,
+    ):
+        self.session = session
+        self.blocking_profile = blocking_profile
+        self.recycle_after = recycle_after
+        self.heap_limit = heap_limit_mb * 1024 * 1024
+        self.logger = get_crawler_logger()
+
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.blocker: Optional[ResourceBlocker] = None
+        self.navigations = 0
+        self.crashed = False
+        self.recycles = 0
+
+    async def open(self) -> None:
+        self.browser = self.session.browser
+        self.context = await self.session.new_context()
+        self.page = await self.context.new_page()
+        self.page.on("crash", self._on_crash)
+        self.navigations = 0
+        self.crashed = False
+
+        self.blocker = None
+        if self.blocking_profile:
+            self.blocker = ResourceBlocker(default_profile=self.blocking_profile)
+            await self.blocker.attach(self.page)
+
+    def _on_crash(self, _page) -> None:
+        self.crashed = True
+
+    async def close(self) -> None:
+        """Close the page, and its context if it is not shared"""
+        try:
+            if self.page and not self.page.is_closed():
+                await self.page.close()
+            if self.context and self.session.isolate_contexts:
+                await self.context.close()
+        except Exception as e:
+            self.logger.debug("Error closing page: %s", e)
+        finally:
+            self.page = None
+            self.context = None
+
+    async def recycle_reason(self) -> Optional[str]:
+        """Why the page should be replaced before the next navigation, if at all"""
+        if self.crashed:
+            return "renderer crashed"
+        if (
+            not self.browser.is_connected()
+            or self.browser is not self.session.browser
+        ):
+            return "browser disconnected"
+        if self.page.is_closed():
+            return "page closed"
+        if self.navigations >= self.recycle_after:
+            return f"{self.navigations} navigations"
+
+        try:
+            # A hung renderer never answers, so the probe is time boxed
+            heap = await asyncio.wait_for(
+                self.page.evaluate(HEAP_USAGE_SCRIPT), PAGE_PROBE_TIMEOUT
+            )
+        except Exception:
+            return "page unresponsive"
+        if heap > self.heap_limit:
+            return f"JS heap at {heap // (1024 * 1024)} MB"
+
+        return None
+
+    async def recycle(self, reason: str) -> None:
+        """Replace the page, relaunching the browser first if it died"""
+        self.logger.info(f"Recycling page: {reason}")
+
+        browser = self.browser
+        await self.close()
+        if not browser.is_connected() and browser is self.session.browser:
+            await self.session.relaunch(browser)
+
+        await self.open()
+        self.recycles += 1
@@ -26,13 +26,128 @@ AVEN_URLS = [
 DEFAULT_OUTPUT_FOLDER = "../knowledge-base"
 DEFAULT_LOGS_FOLDER = "logs"
 DEFAULT_PDF_FOLDER = "aven-pdfs"
+DEFAULT_MANIFEST_FILENAME = ".crawl_manifest.json"
+DEFAULT_FRONTIER_FILENAME = ".crawl_frontier.json"
+DEFAULT_JOURNAL_FILENAME = ".crawl_journal.jsonl"
+DEFAULT_CORPUS_FILENAME = "corpus.jsonl"
+CORPUS_COMPACT_THRESHOLD = 0.5  # share of superseded corpus lines to compact at
+DEFAULT_PDF_CACHE_FOLDER = ".pdf_cache"
+DEFAULT_FETCH_STATE_FILENAME = ".pdf_fetch_state.json"
 DEFAULT_TIMEOUT = 30000
-DEFAULT_WAIT_TIME = 3000
-DEFAULT_DELAY_BETWEEN_REQUESTS = 2
+DEFAULT_WAIT_TIME = 3000  # cap on waiting for content to become ready (ms)
+NAVIGATION_WAIT_UNTIL = "networkidle"
+
+# Readiness detection: content counts as ready once the main content text
+# length is unchanged and no DOM mutations happened for the quiet window
+READY_QUIET_WINDOW = 500
+READY_POLL_INTERVAL = 100
+
+# Concurrency settings
+DEFAULT_CONCURRENCY = 4  # pages crawled in parallel
+DEFAULT_PER_HOST_CONCURRENCY = 4  # max in-flight pages per host
+DEFAULT_PER_HOST_DELAY = 1.0  # min seconds between request starts per host
+
+# Page recycling and retry settings
+PAGE_RECYCLE_AFTER = 50  # navigations before a worker page is replaced
+PAGE_HEAP_LIMIT_MB = 512  # JS heap size that triggers a page replacement
+PAGE_PROBE_TIMEOUT = 5  # seconds to wait for a page health check
+DEFAULT_MAX_RETRIES = 2  # extra attempts for a URL that errors
+DEFAULT_RETRY_BACKOFF = 2.0  # seconds before the first retry, doubled after
+
+# Duplicate detection: lines on at least BOILERPLATE_MIN_PAGES pages and
+# BOILERPLATE_MIN_FRACTION of all pages are shared, and runs of shared lines
+# are boilerplate when they are a header or footer of BOILERPLATE_MIN_RUN_LINES
+# lines or hold BOILERPLATE_MIN_BLOCK_CHARS characters. Stripping never leaves
+# a page with less than BOILERPLATE_MIN_BODY_CHARS characters. Pages whose
+# MinHash similarity reaches NEAR_DUPLICATE_THRESHOLD are near duplicates
+BOILERPLATE_MIN_PAGES = 3
+BOILERPLATE_MIN_FRACTION = 0.5
+BOILERPLATE_MIN_RUN_LINES = 3
+BOILERPLATE_MIN_BLOCK_CHARS = 200
+BOILERPLATE_MIN_BODY_CHARS = 500
+NEAR_DUPLICATE_THRESHOLD = 0.9
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+SHINGLE_SIZE = 5
+
+# Link-discovery crawl settings
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_MAX_PAGES = 500
+FRONTIER_SAVE_INTERVAL = 10  # pages between frontier state saves
+ROBOTS_USER_AGENT = "*"
+TRACKING_QUERY_PARAMS = ("utm_", "gclid", "fbclid", "mc_cid", "mc_eid")
+SKIPPED_LINK_EXTENSIONS = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".svg",
+    ".webp",
+    ".ico",
+    ".mp4",
+    ".mp3",
+    ".zip",
+    ".css",
+    ".js",
+    ".xml",
+    ".json",
+)
 
 # Browser settings
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 
+# Request blocking profiles for page loads. Only the rendered text is kept,
+# so resources that never contribute to it are aborted before download.
+BLOCKING_PROFILES = {
+    "text-only": {
+        "resource_types": ["image", "media", "font", "texttrack", "manifest"],
+        "block_third_party": True,
+        "allowed_hosts": [],
+        "blocked_hosts": [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "facebook.net",
+            "segment.com",
+            "segment.io",
+            "hotjar.com",
+            "fullstory.com",
+            "intercom.io",
+            "youtube.com",
+            "vimeo.com",
+        ],
+    },
+    "media-only": {
+        "resource_types": ["image", "media", "font"],
+        "block_third_party": False,
+        "allowed_hosts": [],
+        "blocked_hosts": [],
+    },
+    "none": {
+        "resource_types": [],
+        "block_third_party": False,
+        "allowed_hosts": [],
+        "blocked_hosts": [],
+    },
+}
+DEFAULT_BLOCKING_PROFILE = "text-only"
+
+# Per-URL blocking profile overrides, matched by URL prefix
+BLOCKING_PROFILE_OVERRIDES = {
+    # Partner site, may serve page content from third-party hosts
+    "https://www.coastalbank.com/": "media-only",
+}
+
+# Rough transfer size per blocked resource type, used to estimate bytes saved
+BLOCKED_RESOURCE_SIZE_ESTIMATES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "script": 80_000,
+    "stylesheet": 30_000,
+}
+DEFAULT_BLOCKED_RESOURCE_SIZE = 10_000
+
 # Content selectors for finding main content
 MAIN_CONTENT_SELECTORS = [
     "main",
@@ -74,5 +189,33 @@ PDF_URL_MAPPING = {
     "Aven-TermsOfService.pdf": "https://www.aven.com/public/docs/TermsOfService",
 }
 
+# Slowest items listed per stage in the timing summary
+METRICS_SLOWEST_ITEMS = 3
+
+# Downloading the PDFs in PDF_URL_MAPPING
+PDF_FETCH_WORKERS = 4
+PDF_FETCH_TIMEOUT = 60  # seconds
+PDF_FETCH_CHUNK_SIZE = 64 * 1024
+PDF_SIGNATURE_BYTES = 1024  # leading bytes searched for the %PDF- header
+
+# A page's text layer is used instead of OCR when it has at least this many
+# non-whitespace characters, mostly letters and digits
+MIN_PAGE_TEXT_LENGTH = 20
+MIN_PAGE_TEXT_ALNUM_RATIO = 0.5
+
+# OCR rasterization: resolution, grayscale conversion and how many pages are
+# held in memory as images at once
+OCR_DPI = 300
+OCR_GRAYSCALE = True
+OCR_WINDOW_PAGES = 1
+
+# Render tables found on text pages as structured text: "markdown" tables or
+# "rows" of "header: value" pairs, one line per table row
+PDF_DETECT_TABLES = True
+PDF_TABLE_FORMAT = "markdown"
+
+# Pages per OCR task when OCR is spread over a process pool
+OCR_PAGES_PER_TASK = 4
+
 # Minimum content length to consider valid
 MIN_CONTENT_LENGTH = 10
@@ -0,0 +1,179 @@
+"""
+Structured JSON Lines sink for extracted content
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from constants import CORPUS_COMPACT_THRESHOLD
+from logger_utils import get_file_logger
+
+
+class JsonlCorpusSink:
+    """
+    Appends one JSON record per extracted document to a corpus file
+
+    Records carry url, title, content, content hash, crawl time, extraction
+    method, source type and the matching ``.txt`` filename, so ingestion can
+    stream the whole corpus in one sequential read instead of opening and
+    header-parsing every file. The file is append-only: a later record for
+    the same URL supersedes earlier ones, and removed documents get a
+    tombstone record with status "removed". Producers check ``has_current``
+    so documents they leave untouched still get a record once, and call
+    ``compact`` when they finish so superseded records do not pile up.
+    """
+
+    def __init__(self, path: str, compact_threshold: float = CORPUS_COMPACT_THRESHOLD):
+        self.path = path
+        self.compact_threshold = compact_threshold
+        self.file_logger = get_file_logger()
+        self._file = None
+        # url -> (hash, filename) of its latest record, read on first use
+        self._current: Optional[Dict[str, Tuple[str, str]]] = None
+        self._lines = 0  # lines in the file, counted along with _current
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _ensure_open(self) -> None:
+        if not self._file:
+            self._file = open(self.path, "a", encoding="utf-8")
+            self.file_logger.info(f"Appending corpus records to: {self.path}")
+
+    def _append(self, record: Dict[str, any]) -> None:
+        self._ensure_open()
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+        if self._current is not None:
+            self._lines += 1
+            if record["status"] == "ok":
+                self._current[record["url"]] = (record["hash"], record["filename"])
+            else:
+                self._current.pop(record["url"], None)
+
+    def _load_current(self) -> Dict[str, Tuple[str, str]]:
+        if self._current is not None:
+            return self._current
+
+        self._current = {}
+        self._lines = 0
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._lines += 1
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.get("status") == "ok":
+                        self._current[record["url"]] = (
+                            record.get("hash"),
+                            record.get("filename"),
+                        )
+                    else:
+                        self._current.pop(record["url"], None)
+        return self._current
+
+    def has_current(self, url: str, content_hash: str, filename: str) -> bool:
+        """Check whether the latest record for a URL holds this content and file"""
+        return self._load_current().get(url) == (content_hash, filename)
+
+    def write(
+        self,
+        url: str,
+        title: str,
+        content: str,
+        filename: str,
+        method: str,
+        source_type: str = "web",
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """Append a record for an extracted document"""
+        self._append(
+            {
+                "url": url,
+                "title": title,
+                "content": content,
+                "hash": content_hash or self.content_hash(content),
+                "crawled_at": datetime.now().isoformat(timespec="seconds"),
+                "method": method,
+                "source_type": source_type,
+                "filename": filename,
+                "status": "ok",
+            }
+        )
+
+    def remove(self, url: str, filename: str = "") -> None:
+        """Append a tombstone for a document that no longer exists"""
+        self._append(
+            {
+                "url": url,
+                "filename": filename,
+                "crawled_at": datetime.now().isoformat(timespec="seconds"),
+                "status": "removed",
+            }
+        )
+
+    def compact(self) -> bool:
+        """
+        Rewrite the corpus with only the latest record of each live document
+
+        Superseded records and tombstones are dropped. The file is rewritten
+        next to the corpus and swapped in with an atomic ``os.replace``, so
+        readers see either the old or the new corpus. Nothing is done until
+        superseded lines make up ``compact_threshold`` of the file, so a
+        threshold of 0 compacts whenever anything was superseded.
+
+        Returns:
+            True if the corpus was rewritten
+        """
+        self.close()
+        current = self._load_current()
+        superseded = self._lines - len(current)
+        if not superseded or superseded < self.compact_threshold * self._lines:
+            return False
+
+        # Offset of the latest line of every live document
+        latest: Dict[str, int] = {}
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if record and record.get("status") == "ok":
+                    latest[record["url"]] = offset
+                elif record:
+                    latest.pop(record["url"], None)
+                offset += len(line)
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(self.path, "rb") as src, open(tmp_path, "wb") as dst:
+                for offset in sorted(latest.values()):
+                    src.seek(offset)
+                    dst.write(src.readline())
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.file_logger.error(f"Failed to compact corpus {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        self.file_logger.info(
+            f"Compacted corpus {self.path}: dropped {superseded} of "
+            f"{self._lines} records"
+        )
+        self._lines = len(latest)
+        return True
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
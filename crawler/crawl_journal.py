@@ -0,0 +1,134 @@
+"""
+On-disk journal of crawl progress for resuming interrupted crawls
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from constants import DEFAULT_JOURNAL_FILENAME
+from logger_utils import get_file_logger
+
+
+class CrawlJournal:
+    """
+    Append-only record of every URL a crawl has finished
+
+    Each completed or failed URL is written as one JSON line as soon as it is
+    recorded, so the journal survives a crash or Ctrl-C. A resumed crawl reads
+    it back to skip URLs that already succeeded. Pages that are held back
+    until the whole crawl is in (for duplicate detection) are spooled as
+    "crawled" entries carrying their extracted content, so a resumed crawl
+    can reload them instead of losing them. The journal is removed once a
+    crawl completes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file_logger = get_file_logger()
+        self._file = None
+
+    @classmethod
+    def for_output_folder(cls, output_folder: str) -> "CrawlJournal":
+        """Create a journal stored alongside the crawler output"""
+        return cls(os.path.join(output_folder, DEFAULT_JOURNAL_FILENAME))
+
+    def _entries(self) -> Iterator[Dict[str, any]]:
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a truncated last line
+                    continue
+
+    def load(self) -> Dict[str, Dict[str, str]]:
+        """
+        Read the latest journal entry for every URL
+
+        Returns:
+            Dictionary mapping URL to its last recorded entry
+        """
+        entries: Dict[str, Dict[str, str]] = {}
+        for entry in self._entries():
+            entries[entry["url"]] = entry
+
+        self.file_logger.info(
+            f"Loaded crawl journal with {len(entries)} entries: {self.path}"
+        )
+        return entries
+
+    def completed(self) -> Dict[str, Dict[str, str]]:
+        """Entries for URLs that finished successfully"""
+        return {
+            url: entry
+            for url, entry in self.load().items()
+            if entry["status"] == "success"
+        }
+
+    def crawled_pages(self) -> Dict[str, Dict[str, str]]:
+        """
+        Spooled page content for every URL crawled before an interruption
+
+        Returns:
+            Dictionary mapping URL to the page recorded with its latest
+            "crawled" entry, whether or not it was saved afterwards
+        """
+        return {
+            entry["url"]: entry["page"]
+            for entry in self._entries()
+            if entry["status"] == "crawled"
+        }
+
+    def open(self, resume: bool = False) -> None:
+        """Open the journal for appending, truncating it unless resuming"""
+        self.close()
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+
+    def record(
+        self,
+        url: str,
+        status: str,
+        filepath: Optional[str] = None,
+        error: Optional[str] = None,
+        page: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Append the outcome for a URL and flush it to disk
+
+        Args:
+            url: URL that finished
+            status: "success", "failed" or "crawled"
+            filepath: Output file for the URL, if any
+            error: Error message for failed URLs
+            page: Extracted page, for "crawled" entries
+        """
+        if not self._file:
+            return
+
+        entry = {
+            "url": url,
+            "status": status,
+            "file": filepath,
+            "error": error,
+            "time": datetime.now().isoformat(timespec="seconds"),
+        }
+        if page is not None:
+            entry["page"] = page
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def clear(self) -> None:
+        """Remove the journal after a crawl has completed"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
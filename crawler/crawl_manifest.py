@@ -0,0 +1,115 @@
+"""
+Persistent manifest of crawled pages for incremental recrawls
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from constants import DEFAULT_MANIFEST_FILENAME
+from logger_utils import get_file_logger
+
+
+class CrawlManifest:
+    """
+    Tracks what was fetched for each URL on previous crawls
+
+    Each entry maps a URL to its ETag / Last-Modified validators, the hash of
+    the saved content, the output filename and the last crawl time, so
+    unchanged pages can be skipped instead of re-rendered and rewritten.
+    With duplicate detection it also keeps fingerprints of the boilerplate
+    lines stripped from the saved content.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file_logger = get_file_logger()
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.load()
+
+    @classmethod
+    def for_output_folder(cls, output_folder: str) -> "CrawlManifest":
+        """Create a manifest stored alongside the crawler output"""
+        return cls(os.path.join(output_folder, DEFAULT_MANIFEST_FILENAME))
+
+    @staticmethod
+    def content_hash(title: str, content: str) -> str:
+        """Hash the parts of a page that end up in the output file"""
+        digest = hashlib.sha256()
+        digest.update(title.encode("utf-8"))
+        digest.update(b"\n")
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def load(self) -> None:
+        """Load the manifest from disk, starting empty if it is missing"""
+        if not os.path.exists(self.path):
+            self.entries = {}
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("pages", {})
+            self.file_logger.info(
+                f"Loaded crawl manifest with {len(self.entries)} entries: {self.path}"
+            )
+        except Exception as e:
+            self.file_logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Atomically write the manifest to disk"""
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"pages": self.entries}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.file_logger.info(
+                f"Saved crawl manifest with {len(self.entries)} entries: {self.path}"
+            )
+        except Exception as e:
+            self.file_logger.error(f"Failed to save manifest {self.path}: {e}")
+
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        return self.entries.get(url)
+
+    def urls(self) -> List[str]:
+        return list(self.entries.keys())
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a URL"""
+        entry = self.entries.get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(
+        self,
+        url: str,
+        filename: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        boilerplate: Optional[List[int]] = None,
+    ) -> None:
+        """Record a crawl of a URL, keeping previous values for omitted fields"""
+        entry = self.entries.setdefault(url, {})
+        if filename is not None:
+            entry["filename"] = filename
+        if content_hash is not None:
+            entry["content_hash"] = content_hash
+        if etag is not None:
+            entry["etag"] = etag
+        if last_modified is not None:
+            entry["last_modified"] = last_modified
+        if boilerplate is not None:
+            entry["boilerplate"] = boilerplate
+        entry["last_crawled"] = datetime.now().isoformat(timespec="seconds")
+
+    def remove(self, url: str) -> Optional[Dict[str, str]]:
+        return self.entries.pop(url, None)
@@ -7,30 +7,150 @@ import asyncio
 from playwright.async_api import async_playwright
 import os
 import re
+import time
 from urllib.parse import urlparse
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from constants import (
     DEFAULT_OUTPUT_FOLDER,
     DEFAULT_TIMEOUT,
     DEFAULT_WAIT_TIME,
-    DEFAULT_DELAY_BETWEEN_REQUESTS,
-    USER_AGENT,
+    NAVIGATION_WAIT_UNTIL,
+    READY_QUIET_WINDOW,
+    READY_POLL_INTERVAL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_BLOCKING_PROFILE,
+    DEFAULT_FRONTIER_FILENAME,
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_MAX_PAGES,
+    FRONTIER_SAVE_INTERVAL,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
     MAIN_CONTENT_SELECTORS,
     ELEMENTS_TO_REMOVE,
     MIN_CONTENT_LENGTH,
 )
+from browser_session import BrowserSession, PageSlot
+from crawl_journal import CrawlJournal
+from crawl_manifest import CrawlManifest
+from corpus_sink import JsonlCorpusSink
+from dedup import DuplicateDetector, fingerprints
+from frontier import CrawlFrontier
+from host_limiter import HostRateLimiter
 from logger_utils import get_crawler_logger, get_content_logger, get_file_logger
+from metrics import get_stage_metrics
+
+
+# Status of a page whose text was all removed as boilerplate
+BOILERPLATE_ONLY = "boilerplate only"
+
+# Resolves once the main content text is stable and the DOM has been quiet for
+# the quiet window, or when the cap is reached
+READINESS_SCRIPT = """
+async ({ selectors, quietMs, capMs, pollMs }) => {
+    const start = performance.now();
+    const pick = () => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element) return element;
+        }
+        return document.body;
+    };
+
+    let lastMutation = start;
+    const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+    if (document.body) {
+        observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    }
+
+    let lastLength = -1;
+    let stableSince = start;
+    try {
+        while (performance.now() - start < capMs) {
+            const element = pick();
+            const length = element ? element.innerText.length : 0;
+            const now = performance.now();
+            if (length !== lastLength) {
+                lastLength = length;
+                stableSince = now;
+            } else if (length > 0 && now - Math.max(stableSince, lastMutation) >= quietMs) {
+                return { ready: true, elapsed: now - start, length };
+            }
+            await new Promise(resolve => setTimeout(resolve, pollMs));
+        }
+        return { ready: false, elapsed: performance.now() - start, length: lastLength };
+    } finally {
+        observer.disconnect();
+    }
+}
+"""
+
+# Removes unwanted elements, picks the main content element and falls back to
+# the body when it is too short, returning everything in one round-trip
+EXTRACTION_SCRIPT = """
+({ removeSelectors, contentSelectors, minLength, collectLinks }) => {
+    // Links are collected first, navigation and footers are removed below
+    const links = collectLinks
+        ? Array.from(document.querySelectorAll("a[href]"), a => a.href)
+        : [];
+
+    for (const selector of removeSelectors) {
+        try {
+            document.querySelectorAll(selector).forEach(el => el.remove());
+        } catch (e) {}
+    }
+
+    let text = "";
+    let selector = "";
+    for (const candidate of contentSelectors) {
+        let element = null;
+        try {
+            element = document.querySelector(candidate);
+        } catch (e) {}
+        if (element) {
+            text = element.innerText || "";
+            selector = candidate;
+            break;
+        }
+    }
+
+    if (!text || text.trim().length < minLength) {
+        text = document.body ? document.body.innerText : "";
+        selector = "body";
+    }
+
+    return { title: document.title, text, selector, links };
+}
+"""
 
 
 class ContentData:
     """Data class for storing webpage content"""
 
-    def __init__(self, url: str, title: str = "", content: str = "", status: str = ""):
+    def __init__(
+        self,
+        url: str,
+        title: str = "",
+        content: str = "",
+        status: str = "",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        stats: Optional[Dict[str, any]] = None,
+        extraction_method: str = "",
+        links: Optional[List[str]] = None,
+        boilerplate: Optional[List[int]] = None,
+    ):
         self.url = url
         self.title = title
         self.content = content
         self.status = status
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stats = stats or {}  # per-page load statistics
+        self.extraction_method = extraction_method  # selector content came from
+        self.links = links or []  # links found on the page, for discovery
+        # Fingerprints of boilerplate lines stripped from the content, if any
+        self.boilerplate = boilerplate
 
     def to_dict(self) -> Dict[str, str]:
         return {
@@ -40,23 +160,62 @@ class ContentData:
             "status": self.status,
         }
 
+    def to_journal(self) -> Dict[str, str]:
+        """Everything needed to save the page later, for the crawl journal"""
+        return dict(
+            self.to_dict(),
+            etag=self.etag,
+            last_modified=self.last_modified,
+            extraction_method=self.extraction_method,
+        )
+
 
 class Crawler:
     """
     JavaScript-enabled web crawler using Playwright
     """
 
-    def __init__(self, output_folder: str = DEFAULT_OUTPUT_FOLDER):
+    def __init__(
+        self,
+        output_folder: str = DEFAULT_OUTPUT_FOLDER,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        isolate_contexts: bool = True,
+        host_limiter: Optional[HostRateLimiter] = None,
+        incremental: bool = True,
+        blocking_profile: Optional[str] = DEFAULT_BLOCKING_PROFILE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        deduplicate: bool = True,
+        corpus_path: Optional[str] = None,
+    ):
         self.output_folder = output_folder
+        self.concurrency = max(1, concurrency)
+        self.blocking_profile = blocking_profile
+        self.isolate_contexts = isolate_contexts
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.duplicate_detector = DuplicateDetector() if deduplicate else None
+        self.corpus_sink = JsonlCorpusSink(corpus_path) if corpus_path else None
+        self.host_limiter = host_limiter or HostRateLimiter()
         self.logger = get_crawler_logger()
         self.content_logger = get_content_logger()
         self.file_logger = get_file_logger()
+        self.metrics = get_stage_metrics()
 
         # Create output folder if it doesn't exist
         self._ensure_output_folder()
 
+        # Journal of finished URLs, used to resume interrupted crawls
+        self.journal = CrawlJournal.for_output_folder(self.output_folder)
+
+        # Manifest of previous crawls, used to skip unchanged pages
+        self.manifest = (
+            CrawlManifest.for_output_folder(self.output_folder) if incremental else None
+        )
+
         self.logger.info(
-            f"Crawler initialized with output folder: {self.output_folder}"
+            f"Crawler initialized with output folder: {self.output_folder}, "
+            f"concurrency: {self.concurrency}"
         )
 
     def _ensure_output_folder(self) -> None:
@@ -91,7 +250,7 @@ class Crawler:
         cleaned = "\n".join(lines)
 
         self.content_logger.debug(
-            f"Cleaned text from {len(text)} to {len(cleaned)} characters"
+            "Cleaned text from %d to %d characters", len(text), len(cleaned)
         )
         return cleaned
 
@@ -122,48 +281,74 @@ class Crawler:
 
         filename = f"{safe_name}.txt"
 
-        self.file_logger.debug(f"Generated filename '{filename}' for URL: {url}")
+        self.file_logger.debug("Generated filename '%s' for URL: %s", filename, url)
         return filename
 
-    async def _extract_content_from_page(self, page, url: str) -> ContentData:
+    async def _extract_content_from_page(
+        self, page, url: str, collect_links: bool = False
+    ) -> ContentData:
         """
         Extract text content from a webpage using Playwright
 
         Args:
             page: Playwright page object
             url: URL being processed
+            collect_links: Also return the page's links for discovery
 
         Returns:
             ContentData object with extracted information
         """
         try:
             self.logger.info(f"Loading page: {url}")
+            started = time.perf_counter()
 
             # Navigate to the page
-            await page.goto(url, wait_until="networkidle", timeout=DEFAULT_TIMEOUT)
-
-            # Wait for dynamic content to load
-            await page.wait_for_timeout(DEFAULT_WAIT_TIME)
+            response = await page.goto(
+                url, wait_until=NAVIGATION_WAIT_UNTIL, timeout=DEFAULT_TIMEOUT
+            )
+            headers = response.headers if response else {}
+            navigated = time.perf_counter()
+
+            # Wait for dynamic content to settle
+            readiness = await self._wait_for_content_ready(page)
+            ready = time.perf_counter()
+            self.metrics.record("crawl.navigate", navigated - started, url)
+            self.metrics.record("crawl.ready", ready - navigated, url)
+
+            stats = {
+                "navigation_ms": round((navigated - started) * 1000),
+                "ready_wait_ms": round((ready - navigated) * 1000),
+                "time_to_ready_ms": round((ready - started) * 1000),
+                "ready_reason": readiness,
+            }
+            self.content_logger.info(
+                f"Content {readiness} after {stats['time_to_ready_ms']} ms: {url}"
+            )
 
-            # Extract title
-            title = await page.title()
+            # Extract title and main content
+            with self.metrics.time("crawl.extract", url):
+                extracted = await self._extract_page_content(page, collect_links)
+            title = extracted["title"]
             self.content_logger.info(f"Page title: {title}")
 
-            # Remove unwanted elements
-            await self._remove_unwanted_elements(page)
-
-            # Extract main content
-            main_content = await self._extract_main_content(page)
-
             # Clean up content
-            cleaned_content = self._clean_text(main_content)
+            with self.metrics.time("crawl.clean", url):
+                cleaned_content = self._clean_text(extracted["text"])
 
             self.content_logger.info(
                 f"Extracted {len(cleaned_content)} characters from {url}"
             )
 
             return ContentData(
-                url=url, title=title, content=cleaned_content, status="success"
+                url=url,
+                title=title,
+                content=cleaned_content,
+                status="success",
+                etag=headers.get("etag"),
+                last_modified=headers.get("last-modified"),
+                stats=stats,
+                extraction_method=extracted["selector"],
+                links=extracted["links"],
             )
 
         except Exception as e:
@@ -171,51 +356,67 @@ class Crawler:
             self.logger.error(error_msg)
             return ContentData(url=url, title="", content="", status=f"error: {str(e)}")
 
-    async def _remove_unwanted_elements(self, page) -> None:
-        """Remove unwanted elements from the page"""
+    async def _wait_for_content_ready(self, page) -> str:
+        """
+        Wait until the main content stops changing, up to DEFAULT_WAIT_TIME
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            "stable" if the content settled, "cap" if the wait timed out
+        """
         try:
-            await page.evaluate(
-                f"""
-                const elementsToRemove = {ELEMENTS_TO_REMOVE};
-                
-                elementsToRemove.forEach(selector => {{
-                    const elements = document.querySelectorAll(selector);
-                    elements.forEach(el => el.remove());
-                }});
-            """
+            result = await page.evaluate(
+                READINESS_SCRIPT,
+                {
+                    "selectors": MAIN_CONTENT_SELECTORS,
+                    "quietMs": READY_QUIET_WINDOW,
+                    "capMs": DEFAULT_WAIT_TIME,
+                    "pollMs": READY_POLL_INTERVAL,
+                },
             )
-            self.content_logger.debug("Removed unwanted elements from page")
+            return "stable" if result.get("ready") else "cap"
         except Exception as e:
-            self.content_logger.warning(f"Failed to remove unwanted elements: {e}")
+            self.content_logger.warning(f"Readiness check failed: {e}")
+            return "error"
 
-    async def _extract_main_content(self, page) -> str:
-        """Extract main content from the page"""
-        main_content = ""
+    async def _extract_page_content(
+        self, page, collect_links: bool = False
+    ) -> Dict[str, any]:
+        """
+        Extract title and main content from the page in a single evaluate call
 
-        # Try to find main content area
-        for selector in MAIN_CONTENT_SELECTORS:
-            try:
-                element = page.locator(selector).first
-                if await element.count() > 0:
-                    main_content = await element.inner_text()
-                    self.content_logger.debug(
-                        f"Found content using selector: {selector}"
-                    )
-                    break
-            except Exception as e:
-                self.content_logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
+        Removes ELEMENTS_TO_REMOVE, takes the first MAIN_CONTENT_SELECTORS
+        match and falls back to the body when it is shorter than
+        MIN_CONTENT_LENGTH. Links are read before anything is removed.
 
-        # Fallback to body content if no main content found
-        if not main_content or len(main_content.strip()) < MIN_CONTENT_LENGTH:
-            try:
-                main_content = await page.locator("body").inner_text()
-                self.content_logger.debug("Used body content as fallback")
-            except Exception as e:
-                self.content_logger.error(f"Failed to extract body content: {e}")
-                main_content = ""
+        Args:
+            page: Playwright page object
+            collect_links: Also return the href of every link on the page
+
+        Returns:
+            Dictionary with title, text, the selector the text came from and
+            the page links
+        """
+        extracted = await page.evaluate(
+            EXTRACTION_SCRIPT,
+            {
+                "removeSelectors": ELEMENTS_TO_REMOVE,
+                "contentSelectors": MAIN_CONTENT_SELECTORS,
+                "minLength": MIN_CONTENT_LENGTH,
+                "collectLinks": collect_links,
+            },
+        )
+
+        if extracted["selector"] == "body":
+            self.content_logger.debug("Used body content as fallback")
+        else:
+            self.content_logger.debug(
+                "Found content using selector: %s", extracted["selector"]
+            )
 
-        return main_content
+        return extracted
 
     def _save_content_to_file(self, content_data: ContentData) -> Optional[str]:
         """
@@ -278,60 +479,787 @@ class Crawler:
 
         return True
 
-    async def crawl_urls(self, urls: List[str]) -> Dict[str, any]:
+    def _is_file_current(self, entry: Optional[Dict[str, str]]) -> bool:
+        """Check that a manifest entry's output file is still on disk"""
+        return bool(
+            entry
+            and entry.get("filename")
+            and os.path.exists(os.path.join(self.output_folder, entry["filename"]))
+        )
+
+    async def _check_not_modified(self, context, url: str) -> bool:
+        """
+        Ask the server whether a previously crawled page changed
+
+        Args:
+            context: Browser context whose request client is used
+            url: URL to check
+
+        Returns:
+            True if the server answered 304 Not Modified
+        """
+        if not self.manifest or not self._is_file_current(self.manifest.get(url)):
+            return False
+
+        headers = self.manifest.conditional_headers(url)
+        if not headers:
+            return False
+
+        try:
+            response = await context.request.get(
+                url, headers=headers, timeout=DEFAULT_TIMEOUT
+            )
+            not_modified = response.status == 304
+            await response.dispose()
+            if not_modified:
+                self.logger.info(f"Not modified since last crawl: {url}")
+            return not_modified
+        except Exception as e:
+            self.logger.debug("Conditional request failed for %s: %s", url, e)
+            return False
+
+    def _record_result(
+        self, results: Dict[str, any], content_data: ContentData
+    ) -> None:
+        """
+        Validate and save extracted content, updating the crawl results
+
+        Pages whose content hash matches the manifest are counted as
+        unchanged and their output file is left untouched. Near duplicates
+        are reported under ``duplicates`` and pages that held nothing but
+        boilerplate under ``boilerplate_only``; neither is saved, and an
+        earlier copy is removed.
+
+        Args:
+            results: Crawl results dictionary to update
+            content_data: ContentData extracted for a URL
+        """
+        url = content_data.url
+        entry = self.manifest.get(url) if self.manifest else None
+
+        if content_data.stats:
+            results["page_stats"][url] = content_data.stats
+
+        if content_data.status == "not_modified":
+            filepath = os.path.join(self.output_folder, entry["filename"])
+            if self.corpus_sink:
+                self._backfill_corpus_record(url, filepath, entry["filename"])
+            results["successful"] += 1
+            results["unchanged"] += 1
+            results["delta"]["unchanged"].append(filepath)
+            self.manifest.update(url)
+            self.journal.record(url, "success", filepath)
+            return
+
+        if content_data.status.startswith("duplicate of "):
+            original = content_data.status[len("duplicate of ") :]
+            results["duplicates"][url] = original
+            self._drop_saved_page(url, entry)
+            self.journal.record(url, "success")
+            self.logger.info(f"Skipped near duplicate of {original}: {url}")
+            return
+
+        if content_data.status == BOILERPLATE_ONLY:
+            results["boilerplate_only"].append(url)
+            self._drop_saved_page(url, entry)
+            self.journal.record(url, "success")
+            self.logger.info(f"Skipped page with only boilerplate: {url}")
+            return
+
+        if not self._is_content_valid(content_data):
+            results["failed"] += 1
+            error_msg = f"Invalid content for {url}: {content_data.status}"
+            results["errors"].append(error_msg)
+            self.logger.warning(error_msg)
+            self.journal.record(url, "failed", error=error_msg)
+            return
+
+        content_hash = CrawlManifest.content_hash(
+            content_data.title, content_data.content
+        )
+        filename = self._generate_safe_filename(url, content_data.title)
+
+        if (
+            entry
+            and entry.get("content_hash") == content_hash
+            and entry.get("filename") == filename
+            and self._is_file_current(entry)
+        ):
+            filepath = os.path.join(self.output_folder, filename)
+            self._write_corpus_record(content_data, filename, content_hash)
+            results["successful"] += 1
+            results["unchanged"] += 1
+            results["delta"]["unchanged"].append(filepath)
+            self.manifest.update(
+                url,
+                etag=content_data.etag,
+                last_modified=content_data.last_modified,
+                boilerplate=content_data.boilerplate,
+            )
+            self.journal.record(url, "success", filepath)
+            self.logger.info(f"Content unchanged, skipped rewrite: {url}")
+            return
+
+        with self.metrics.time("crawl.save", url):
+            filepath = self._save_content_to_file(content_data)
+        if not filepath:
+            error_msg = f"Failed to save content for {url}"
+            results["failed"] += 1
+            results["errors"].append(error_msg)
+            self.journal.record(url, "failed", error=error_msg)
+            return
+
+        self._write_corpus_record(content_data, filename, content_hash)
+
+        change = "updated" if entry else "new"
+        results["successful"] += 1
+        results[change] += 1
+        results["files_created"].append(filepath)
+        results["delta"][change].append(filepath)
+
+        if self.manifest:
+            # Title changes rename the output file, drop the stale one
+            if entry and entry.get("filename") not in (None, filename):
+                self._remove_output_file(entry["filename"])
+            self.manifest.update(
+                url,
+                filename=filename,
+                content_hash=content_hash,
+                etag=content_data.etag or "",
+                last_modified=content_data.last_modified or "",
+                boilerplate=content_data.boilerplate,
+            )
+
+        self.journal.record(url, "success", filepath)
+        self.logger.info(f"Successfully processed ({change}): {url}")
+
+    def _drop_saved_page(self, url: str, entry: Optional[Dict[str, str]]) -> None:
+        """Forget a page that is no longer saved and remove its earlier copy"""
+        if not entry:
+            return
+
+        # Keep the output file if another page now saves to the same name
+        self.manifest.remove(url)
+        if entry.get("filename") not in {
+            other.get("filename") for other in self.manifest.entries.values()
+        }:
+            self._remove_output_file(entry["filename"])
+        if self.corpus_sink:
+            self.corpus_sink.remove(url, entry.get("filename", ""))
+
+    def _write_corpus_record(
+        self, content_data: ContentData, filename: str, content_hash: str
+    ) -> None:
+        """Append a corpus record unless the corpus already holds this content"""
+        if self.corpus_sink and not self.corpus_sink.has_current(
+            content_data.url, content_hash, filename
+        ):
+            self.corpus_sink.write(
+                content_data.url,
+                content_data.title,
+                content_data.content,
+                filename,
+                method=content_data.extraction_method,
+                content_hash=content_hash,
+            )
+
+    def _backfill_corpus_record(self, url: str, filepath: str, filename: str) -> None:
+        """
+        Write a corpus record for a not-modified page from its saved file
+
+        A 304 carries no content, so pages saved before the corpus was enabled
+        are read back from their output file instead.
+        """
+        content_data = self._read_output_file(url, filepath)
+        if content_data:
+            self._write_corpus_record(
+                content_data,
+                filename,
+                CrawlManifest.content_hash(content_data.title, content_data.content),
+            )
+
+    def _read_output_file(self, url: str, filepath: str) -> Optional[ContentData]:
+        """
+        Read a saved page back from its output file
+
+        Args:
+            url: URL the file was saved for
+            filepath: Output file to read
+
+        Returns:
+            ContentData with the saved title and content, or None if the
+            file cannot be read
+        """
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                saved = f.read()
+        except OSError as e:
+            self.file_logger.error(f"Error reading saved page {filepath}: {e}")
+            return None
+
+        header, separator, content = saved.partition("=" * 50 + "\n\n")
+        title_match = re.search(r"^Title: (.*)$", header, re.MULTILINE)
+        if not separator or not title_match:
+            self.file_logger.warning(f"Unrecognized output file format: {filepath}")
+            return None
+
+        return ContentData(
+            url=url,
+            title=title_match.group(1),
+            content=content,
+            status="not_modified",
+            extraction_method="saved_file",
+        )
+
+    def _remove_output_file(self, filename: str) -> None:
+        """Delete an output file that no longer corresponds to a crawled page"""
+        filepath = os.path.join(self.output_folder, filename)
+        try:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+                self.file_logger.info(f"Removed stale output file: {filename}")
+        except Exception as e:
+            self.file_logger.error(f"Error removing {filename}: {e}")
+
+    def _prune_removed_urls(self, results: Dict[str, any], urls: List[str]) -> None:
+        """
+        Drop manifest entries for URLs that are no longer crawled
+
+        Args:
+            results: Crawl results dictionary to update
+            urls: URLs that make up the current crawl
+        """
+        crawled = set(urls)
+        for url in self.manifest.urls():
+            if url in crawled:
+                continue
+
+            entry = self.manifest.remove(url)
+            results["removed"] += 1
+            if self.corpus_sink:
+                self.corpus_sink.remove(url, (entry or {}).get("filename", ""))
+            if entry and entry.get("filename"):
+                self._remove_output_file(entry["filename"])
+                results["delta"]["removed"].append(
+                    os.path.join(self.output_folder, entry["filename"])
+                )
+            self.logger.info(f"URL no longer crawled, removed: {url}")
+
+    async def _crawl_worker(
+        self,
+        worker_id: int,
+        session: BrowserSession,
+        queue: asyncio.Queue,
+        progress: Dict[str, int],
+        results: Dict[str, any],
+        frontier: Optional[CrawlFrontier] = None,
+        deferred: Optional[List[ContentData]] = None,
+    ) -> None:
+        """
+        Pull URLs off the shared queue and crawl them with a dedicated page
+
+        Args:
+            worker_id: Worker number, used for logging
+            session: Browser session the worker opens its page in
+            queue: Queue of (url, depth) items
+            progress: Shared counters of started and scheduled URLs
+            results: Shared crawl results dictionary
+            frontier: Frontier receiving discovered links, if link discovery is on
+            deferred: Collects pages to save after duplicate detection
+        """
+        slot = PageSlot(session, blocking_profile=self.blocking_profile)
+        await slot.open()
+
+        try:
+            while True:
+                url, depth = await queue.get()
+                try:
+                    progress["started"] += 1
+                    self.logger.info(
+                        f"Worker {worker_id} processing "
+                        f"[{progress['started']}/{progress['scheduled']}]: {url}"
+                    )
+                    await self._crawl_one(
+                        slot, url, depth, queue, progress, results, frontier, deferred
+                    )
+                except Exception as e:
+                    error_msg = f"Error processing {url}: {str(e)}"
+                    results["failed"] += 1
+                    results["errors"].append(error_msg)
+                    self.journal.record(url, "failed", error=error_msg)
+                    self.logger.error(f"Worker {worker_id} failed on {url}: {e}")
+                finally:
+                    queue.task_done()
+        finally:
+            results["page_recycles"] += slot.recycles
+            await slot.close()
+
+    async def _fetch_page(
+        self, slot: PageSlot, url: str, collect_links: bool
+    ) -> ContentData:
+        """Load a URL in the worker's page unless the server reports it unchanged"""
+        async with self.host_limiter.slot(url):
+            if await self._check_not_modified(slot.context, url):
+                return ContentData(url=url, status="not_modified")
+
+            if slot.blocker:
+                slot.blocker.start_page(url)
+            slot.navigations += 1
+            content_data = await self._extract_content_from_page(
+                slot.page, url, collect_links=collect_links
+            )
+            if slot.blocker:
+                content_data.stats.update(slot.blocker.stats())
+
+        return content_data
+
+    async def _fetch_with_retries(
+        self, slot: PageSlot, url: str, collect_links: bool
+    ) -> ContentData:
+        """
+        Fetch a URL, retrying errors with exponential backoff
+
+        Before every attempt the worker's page is recycled if it crashed,
+        lost its browser or is due for replacement.
+
+        Args:
+            slot: Worker page slot
+            url: URL to fetch
+            collect_links: Also collect the page's links for discovery
+
+        Returns:
+            ContentData from the last attempt
+        """
+        for attempt in range(self.max_retries + 1):
+            reason = await slot.recycle_reason()
+            if reason:
+                await slot.recycle(reason)
+
+            content_data = await self._fetch_page(slot, url, collect_links)
+            content_data.stats["attempts"] = attempt + 1
+
+            if not content_data.status.startswith("error"):
+                break
+
+            if attempt < self.max_retries:
+                delay = self.retry_backoff * (2**attempt)
+                self.logger.warning(
+                    f"Attempt {attempt + 1} failed for {url}, retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+        return content_data
+
+    async def _crawl_one(
+        self,
+        slot: PageSlot,
+        url: str,
+        depth: int,
+        queue: asyncio.Queue,
+        progress: Dict[str, int],
+        results: Dict[str, any],
+        frontier: Optional[CrawlFrontier],
+        deferred: Optional[List[ContentData]],
+    ) -> None:
+        """Crawl a single URL and schedule the links discovered on it"""
+        if frontier:
+            allowed = await frontier.is_allowed(url, slot.context.request)
+            delay = frontier.crawl_delay(url)
+            if delay:
+                self.host_limiter.set_min_interval(url, delay)
+            if not allowed:
+                frontier.mark_visited(url)
+                results["skipped"].append(url)
+                self.logger.info(f"Disallowed by robots.txt, skipped: {url}")
+                return
+
+        with self.metrics.time("crawl.page", url):
+            content_data = await self._fetch_with_retries(
+                slot, url, collect_links=frontier is not None
+            )
+
+        if deferred is not None and content_data.status in ("success", "not_modified"):
+            # Spool the page before its URL counts as visited, so an
+            # interrupted crawl can reload it instead of losing it
+            self.journal.record(url, "crawled", page=content_data.to_journal())
+            deferred.append(content_data)
+        else:
+            self._record_result(results, content_data)
+
+        if frontier:
+            for link in content_data.links:
+                next_url = frontier.add(link, depth + 1, base=url)
+                if next_url:
+                    progress["scheduled"] += 1
+                    queue.put_nowait((next_url, depth + 1))
+
+            frontier.mark_visited(url)
+            if len(frontier.visited) % FRONTIER_SAVE_INTERVAL == 0:
+                frontier.save_state()
+
+    def _record_deduplicated(
+        self, results: Dict[str, any], pages: List[ContentData]
+    ) -> None:
+        """
+        Strip cross-page boilerplate and drop near duplicates, then save pages
+
+        Pages are compared in URL order, so the page a near duplicate is
+        attributed to is the same on every crawl. Pages that were not
+        modified take part with the content saved for them on an earlier
+        crawl, and the boilerplate stripped from it then still counts as
+        shared; their saved file is left as it is.
+
+        Args:
+            results: Crawl results dictionary to update
+            pages: ContentData for every crawled page
+        """
+        pages = sorted(pages, key=lambda content_data: content_data.url)
+        texts = {}
+        removed = {}
+        for content_data in pages:
+            if content_data.status == "success":
+                texts[content_data.url] = content_data.content
+            elif content_data.status == "not_modified":
+                entry = self.manifest.get(content_data.url)
+                saved = self._read_output_file(
+                    content_data.url,
+                    os.path.join(self.output_folder, entry["filename"]),
+                )
+                if saved:
+                    texts[content_data.url] = saved.content
+                    removed[content_data.url] = set(entry.get("boilerplate", []))
+
+        stripped = self.duplicate_detector.strip_boilerplate(texts, removed)
+        duplicates = self.duplicate_detector.find_duplicates(
+            {url: page.body for url, page in stripped.items()}
+        )
+
+        for content_data in pages:
+            page = stripped.get(content_data.url)
+            if page and content_data.status == "success":
+                results["boilerplate_chars_removed"] += len(
+                    content_data.content
+                ) - len(page.text)
+                if content_data.content.strip() and not page.text.strip():
+                    content_data.status = BOILERPLATE_ONLY
+                content_data.boilerplate = sorted(
+                    fingerprints(content_data.content) - fingerprints(page.text)
+                )
+                content_data.content = page.text
+            if content_data.url in duplicates:
+                content_data.status = f"duplicate of {duplicates[content_data.url]}"
+
+            self._record_result(results, content_data)
+
+    @staticmethod
+    def _new_results() -> Dict[str, any]:
+        """Empty crawl results dictionary"""
+        return {
+            "successful": 0,
+            "failed": 0,
+            "files_created": [],
+            "errors": [],
+            "new": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "removed": 0,
+            "delta": {"new": [], "updated": [], "unchanged": [], "removed": []},
+            "page_stats": {},
+            "skipped": [],
+            "resumed": 0,
+            "page_recycles": 0,
+            "browser_relaunches": 0,
+            "duplicates": {},
+            "boilerplate_only": [],
+            "boilerplate_chars_removed": 0,
+        }
+
+    async def _run_crawl(
+        self,
+        items: List[Tuple[str, int]],
+        frontier: Optional[CrawlFrontier] = None,
+        resumed: Optional[Dict[str, Dict[str, str]]] = None,
+        spooled: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> Dict[str, any]:
+        """
+        Crawl queued URLs with a pool of concurrent pages
+
+        With duplicate detection, pages are spooled to the journal as they
+        are crawled and saved once the whole crawl is in.
+
+        Args:
+            items: Initial (url, depth) items to crawl
+            frontier: Frontier that discovered links are fed back into
+            resumed: Journal entries of URLs completed by an earlier run
+            spooled: Pages an earlier run crawled but may not have saved
+
+        Returns:
+            Dictionary with crawling results
+        """
+        results = self._new_results()
+
+        # Carry over URLs finished before the crawl was interrupted
+        for url, entry in (resumed or {}).items():
+            results["successful"] += 1
+            results["resumed"] += 1
+            if entry.get("file"):
+                results["files_created"].append(entry["file"])
+
+        if not items and not spooled:
+            return results
+
+        deferred = [] if self.duplicate_detector else None
+        try:
+            # Pages spooled by the interrupted run are already in the journal
+            for page in (spooled or {}).values():
+                content_data = ContentData(**page)
+                results["resumed"] += 1
+                if deferred is None:
+                    self._record_result(results, content_data)
+                else:
+                    deferred.append(content_data)
+
+            if items:
+                await self._crawl_queue(items, frontier, results, deferred)
+
+            if deferred is not None:
+                self._record_deduplicated(results, deferred)
+        finally:
+            self.journal.close()
+            if self.corpus_sink:
+                self.corpus_sink.close()
+            if self.manifest:
+                self.manifest.save()
+            if frontier:
+                frontier.save_state()
+
+        return results
+
+    async def _crawl_queue(
+        self,
+        items: List[Tuple[str, int]],
+        frontier: Optional[CrawlFrontier],
+        results: Dict[str, any],
+        deferred: Optional[List[ContentData]],
+    ) -> None:
+        """Run the worker pool until the queue of URLs is drained"""
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        progress = {"started": 0, "scheduled": len(items)}
+
+        worker_count = (
+            self.concurrency if frontier else min(self.concurrency, len(items))
+        )
+
+        async with async_playwright() as p:
+            session = BrowserSession(
+                p,
+                isolate_contexts=self.isolate_contexts,
+                block_service_workers=bool(self.blocking_profile),
+            )
+            await session.start()
+            self.logger.info(f"Crawling with {worker_count} worker(s)")
+
+            workers = [
+                asyncio.create_task(
+                    self._crawl_worker(
+                        worker_id,
+                        session,
+                        queue,
+                        progress,
+                        results,
+                        frontier,
+                        deferred,
+                    )
+                )
+                for worker_id in range(1, worker_count + 1)
+            ]
+            drained = asyncio.create_task(queue.join())
+
+            try:
+                # Workers only finish early if they fail outright
+                await asyncio.wait(
+                    [drained, *workers], return_when=asyncio.FIRST_COMPLETED
+                )
+                for worker in workers:
+                    if worker.done() and worker.exception():
+                        raise worker.exception()
+            finally:
+                drained.cancel()
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(drained, *workers, return_exceptions=True)
+
+                results["browser_relaunches"] = session.relaunches
+                await session.close()
+
+    def _log_results(self, results: Dict[str, any]) -> None:
+        self.logger.info(
+            f"Crawl completed - Success: {results['successful']}, Failed: {results['failed']}, "
+            f"New: {results['new']}, Updated: {results['updated']}, "
+            f"Unchanged: {results['unchanged']}, Removed: {results['removed']}"
+        )
+
+    def _load_journal(
+        self, resume: bool, urls: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Dict[str, str]]]:
+        """
+        Read back what an interrupted crawl finished
+
+        Args:
+            resume: Whether the crawl is resumed, nothing is read otherwise
+            urls: Only keep these URLs, defaults to all
+
+        Returns:
+            Tuple of (completed journal entries, spooled pages). A spooled
+            page is returned only as a page, even if it was saved, so it goes
+            through duplicate detection again with the rest of the crawl.
+        """
+        if not resume:
+            return {}, {}
+
+        spooled = self.journal.crawled_pages()
+        completed = {
+            url: entry
+            for url, entry in self.journal.completed().items()
+            if url not in spooled
+        }
+        if urls is not None:
+            wanted = set(urls)
+            spooled = {url: page for url, page in spooled.items() if url in wanted}
+            completed = {
+                url: entry for url, entry in completed.items() if url in wanted
+            }
+
+        if completed or spooled:
+            self.logger.info(
+                f"Resuming crawl, skipping {len(completed)} completed URLs "
+                f"and reloading {len(spooled)} crawled pages"
+            )
+        return completed, spooled
+
+    async def crawl_urls(
+        self, urls: List[str], resume: bool = False
+    ) -> Dict[str, any]:
         """
         Crawl a list of URLs and save content
 
+        Up to ``concurrency`` pages are crawled at once, each in its own
+        browser context unless ``isolate_contexts`` is disabled. Requests to
+        the same host are throttled by the host limiter. When incremental
+        crawling is enabled, unchanged pages are not rewritten and the
+        results report new/updated/unchanged/removed counts plus the
+        affected files under ``delta``. Per-page load statistics, such as
+        requests blocked by the resource blocking profile, are collected
+        under ``page_stats``. Boilerplate repeated across pages is stripped
+        and near-duplicate pages are skipped before anything is saved.
+
+        Every finished URL is checkpointed to the crawl journal, and pages
+        held back for duplicate detection are spooled there with their
+        content. With ``resume``, URLs the journal records as successful or
+        spooled are not crawled again and are counted under ``resumed``.
+
         Args:
             urls: List of URLs to crawl
+            resume: Continue an interrupted crawl from the journal
 
         Returns:
             Dictionary with crawling results
         """
         self.logger.info(f"Starting crawl of {len(urls)} URLs")
 
-        results = {"successful": 0, "failed": 0, "files_created": [], "errors": []}
+        completed, spooled = self._load_journal(resume, urls)
 
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(user_agent=USER_AGENT)
-            page = await context.new_page()
-
-            self.logger.info("Browser launched successfully")
-
-            for i, url in enumerate(urls, 1):
-                self.logger.info(f"Processing [{i}/{len(urls)}]: {url}")
-
-                # Extract content
-                content_data = await self._extract_content_from_page(page, url)
-
-                # Validate and save content
-                if self._is_content_valid(content_data):
-                    filepath = self._save_content_to_file(content_data)
-                    if filepath:
-                        results["successful"] += 1
-                        results["files_created"].append(filepath)
-                        self.logger.info(f"Successfully processed: {url}")
-                    else:
-                        results["failed"] += 1
-                        results["errors"].append(f"Failed to save content for {url}")
-                else:
-                    results["failed"] += 1
-                    error_msg = f"Invalid content for {url}: {content_data.status}"
-                    results["errors"].append(error_msg)
-                    self.logger.warning(error_msg)
+        self.journal.open(resume=resume)
+        results = await self._run_crawl(
+            [(url, 0) for url in urls if url not in completed and url not in spooled],
+            resumed=completed,
+            spooled=spooled,
+        )
 
-                # Delay between requests
-                if i < len(urls):
-                    await asyncio.sleep(DEFAULT_DELAY_BETWEEN_REQUESTS)
+        if self.manifest and urls:
+            self._prune_removed_urls(results, urls)
+            self.manifest.save()
 
-            await browser.close()
-            self.logger.info("Browser closed")
+        self.journal.clear()
+        if self.corpus_sink:
+            self.corpus_sink.compact()
 
         # Log final results
+        self._log_results(results)
+
+        return results
+
+    async def crawl_site(
+        self,
+        seeds: List[str],
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        allowed_hosts: Optional[List[str]] = None,
+        respect_robots: bool = True,
+        resume: bool = False,
+    ) -> Dict[str, any]:
+        """
+        Crawl a site by following links from seed URLs
+
+        Same-host links found on each page are normalized, deduplicated and
+        scheduled through the same worker pool as ``crawl_urls``, up to
+        ``max_depth`` links away from the seeds and ``max_pages`` pages in
+        total. Linked PDFs are reported under ``discovered_pdfs`` rather than
+        rendered. Visited and pending URLs are persisted as the crawl runs,
+        and with ``resume`` an interrupted crawl picks up where it stopped.
+
+        Args:
+            seeds: URLs to start from
+            max_depth: Maximum link depth from the seeds
+            max_pages: Maximum number of pages to crawl
+            allowed_hosts: Hosts links may point to, defaults to the seed hosts
+            respect_robots: Skip URLs disallowed by robots.txt
+            resume: Continue an interrupted crawl from the saved frontier
+
+        Returns:
+            Dictionary with crawling results
+        """
+        frontier = CrawlFrontier(
+            seeds,
+            max_depth=max_depth,
+            max_pages=max_pages,
+            allowed_hosts=allowed_hosts,
+            state_path=os.path.join(self.output_folder, DEFAULT_FRONTIER_FILENAME),
+            respect_robots=respect_robots,
+        )
+        resumed = resume and frontier.load_state()
+        completed, spooled = self._load_journal(resumed)
+
         self.logger.info(
-            f"Crawl completed - Success: {results['successful']}, Failed: {results['failed']}"
+            f"Starting site crawl from {len(frontier.seeds)} seed(s), "
+            f"max depth {max_depth}, max pages {max_pages}"
+        )
+
+        # The frontier state is saved only every few pages, so the journal
+        # can be ahead of it: skip URLs it already finished
+        finished = completed.keys() | spooled.keys()
+        for url in finished:
+            frontier.mark_visited(url)
+        items = [item for item in frontier.seed_items() if item[0] not in finished]
+
+        self.journal.open(resume=resumed)
+        results = await self._run_crawl(
+            items, frontier, resumed=completed, spooled=spooled
         )
+        results["discovered_pdfs"] = sorted(frontier.pdf_links)
+
+        # Only prune when the whole site was covered, a budget-limited crawl
+        # says nothing about pages it never reached
+        if self.manifest and not frontier.truncated:
+            self._prune_removed_urls(results, list(frontier.visited))
+            self.manifest.save()
+
+        frontier.clear_state()
+        self.journal.clear()
+        if self.corpus_sink:
+            self.corpus_sink.compact()
+        self._log_results(results)
 
         return results
@@ -0,0 +1,261 @@
+"""
+Cross-page boilerplate removal and near-duplicate page detection
+"""
+
+import random
+import re
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set
+
+from constants import (
+    BOILERPLATE_MIN_PAGES,
+    BOILERPLATE_MIN_FRACTION,
+    BOILERPLATE_MIN_RUN_LINES,
+    BOILERPLATE_MIN_BLOCK_CHARS,
+    BOILERPLATE_MIN_BODY_CHARS,
+    NEAR_DUPLICATE_THRESHOLD,
+    MINHASH_PERMUTATIONS,
+    MINHASH_BANDS,
+    SHINGLE_SIZE,
+)
+from logger_utils import get_content_logger
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _normalize_block(block: str) -> str:
+    return " ".join(block.lower().split())
+
+
+def line_fingerprint(line: str) -> Optional[int]:
+    """Fingerprint of a line's normalized text, None for a blank line"""
+    block = _normalize_block(line)
+    return zlib.crc32(block.encode("utf-8")) if block else None
+
+
+def fingerprints(text: str) -> Set[int]:
+    """Fingerprints of the distinct non-blank lines of a text"""
+    return {line_fingerprint(line) for line in text.splitlines()} - {None}
+
+
+class StrippedPage(NamedTuple):
+    text: str
+    body: str
+
+
+class DuplicateDetector:
+    """
+    Strips boilerplate shared across pages and flags near-duplicate pages
+
+    Works on the cleaned, line-oriented text of a whole crawl:
+
+    * A line that appears on at least ``min_pages`` pages and on at least
+      ``min_fraction`` of all pages is shared. Shared lines are only removed
+      as blocks: a run of consecutive shared lines is boilerplate (footers,
+      disclosures, navigation that survived ``ELEMENTS_TO_REMOVE``) when it
+      is a header or footer of at least ``min_run_lines`` lines, or holds at
+      least ``min_block_chars`` characters anywhere on the page. A lone
+      shared line inside the body, such as a one-word heading, is kept.
+    * Boilerplate is removed from every page, except a page that would be
+      left with less than ``min_body_chars`` characters keeps its text as
+      is. A page that is little more than the shared text, such as a
+      disclosures page, so still holds that text.
+    * Pages are then compared with MinHash signatures of the word shingles
+      of their bodies without any boilerplate, so pages kept whole are not
+      mistaken for duplicates of each other. Signatures are bucketed with
+      LSH banding, and a page whose estimated Jaccard similarity with an
+      earlier page reaches ``duplicate_threshold`` is reported as a
+      duplicate of it.
+    """
+
+    def __init__(
+        self,
+        min_pages: int = BOILERPLATE_MIN_PAGES,
+        min_fraction: float = BOILERPLATE_MIN_FRACTION,
+        min_run_lines: int = BOILERPLATE_MIN_RUN_LINES,
+        min_block_chars: int = BOILERPLATE_MIN_BLOCK_CHARS,
+        min_body_chars: int = BOILERPLATE_MIN_BODY_CHARS,
+        duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        num_perm: int = MINHASH_PERMUTATIONS,
+        bands: int = MINHASH_BANDS,
+        shingle_size: int = SHINGLE_SIZE,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.min_pages = min_pages
+        self.min_fraction = min_fraction
+        self.min_run_lines = min_run_lines
+        self.min_block_chars = min_block_chars
+        self.min_body_chars = min_body_chars
+        self.duplicate_threshold = duplicate_threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.content_logger = get_content_logger()
+
+        # Fixed seed so signatures are comparable between runs
+        rng = random.Random(num_perm)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def find_boilerplate(
+        self,
+        texts: Dict[str, str],
+        removed: Optional[Dict[str, Set[int]]] = None,
+    ) -> Set[int]:
+        """
+        Find lines repeated across enough pages to be shared
+
+        Args:
+            texts: Page text keyed by URL
+            removed: Fingerprints of lines already stripped from some of the
+                texts, e.g. saved pages that were not modified, counted as
+                if they were still there
+
+        Returns:
+            Set of shared line fingerprints
+        """
+        removed = removed or {}
+        document_frequency = Counter()
+        for url, text in texts.items():
+            document_frequency.update(fingerprints(text) | removed.get(url, set()))
+
+        cutoff = max(self.min_pages, self.min_fraction * len(texts))
+        return {
+            fingerprint
+            for fingerprint, count in document_frequency.items()
+            if count >= cutoff
+        }
+
+    def _boilerplate_lines(self, lines: List[str], shared: Set[int]) -> Set[int]:
+        """Indexes of the lines that belong to boilerplate blocks"""
+        content = [i for i, line in enumerate(lines) if line.strip()]
+        dropped: Set[int] = set()
+
+        start = 0
+        while start < len(content):
+            if line_fingerprint(lines[content[start]]) not in shared:
+                start += 1
+                continue
+
+            end = start
+            while end < len(content) and (
+                line_fingerprint(lines[content[end]]) in shared
+            ):
+                end += 1
+
+            run = content[start:end]
+            at_edge = start == 0 or end == len(content)
+            chars = sum(len(lines[i].strip()) for i in run)
+            if (at_edge and len(run) >= self.min_run_lines) or (
+                chars >= self.min_block_chars
+            ):
+                dropped.update(run)
+            start = end
+
+        return dropped
+
+    def strip_boilerplate(
+        self,
+        texts: Dict[str, str],
+        removed: Optional[Dict[str, Set[int]]] = None,
+    ) -> Dict[str, StrippedPage]:
+        """
+        Remove boilerplate blocks from every page
+
+        Args:
+            texts: Page text keyed by URL
+            removed: Fingerprints of lines already stripped from some of the
+                texts, see ``find_boilerplate``
+
+        Returns:
+            StrippedPage keyed by URL: the text to keep, and the body without
+            any boilerplate to compare pages on
+        """
+        shared = self.find_boilerplate(texts, removed)
+
+        stripped = {}
+        for url, text in texts.items():
+            lines = text.splitlines()
+            dropped = self._boilerplate_lines(lines, shared) if shared else set()
+            if not dropped:
+                stripped[url] = StrippedPage(text, text)
+                continue
+
+            body = "\n".join(line for i, line in enumerate(lines) if i not in dropped)
+            # Pages that are mostly shared text are kept whole
+            kept = text if len(body.strip()) < self.min_body_chars else body
+            stripped[url] = StrippedPage(kept, body)
+
+        self.content_logger.info(
+            f"Found {len(shared)} shared lines across {len(texts)} pages"
+        )
+        return stripped
+
+    def _shingles(self, text: str) -> Set[int]:
+        words = _WORD_PATTERN.findall(text.lower())
+        size = min(self.shingle_size, len(words)) or 1
+        return {
+            zlib.crc32(" ".join(words[i : i + size]).encode("utf-8"))
+            for i in range(max(1, len(words) - size + 1))
+        }
+
+    def signature(self, text: str) -> List[int]:
+        """MinHash signature of the text's word shingles"""
+        shingles = self._shingles(text)
+        return [
+            min((a * s + b) % _MERSENNE_PRIME for s in shingles)
+            for a, b in self._perms
+        ]
+
+    @staticmethod
+    def similarity(left: List[int], right: List[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+    def find_duplicates(self, texts: Dict[str, str]) -> Dict[str, str]:
+        """
+        Find pages that are near duplicates of an earlier page
+
+        Args:
+            texts: Page text keyed by URL, in crawl order
+
+        Returns:
+            Dictionary mapping each duplicate URL to the URL it duplicates
+        """
+        signatures: Dict[str, List[int]] = {}
+        order: Dict[str, int] = {}
+        buckets: Dict[tuple, List[str]] = defaultdict(list)
+        duplicates: Dict[str, str] = {}
+
+        for url, text in texts.items():
+            signature = self.signature(text)
+            band_keys = [
+                (band, tuple(signature[band * self.rows : (band + 1) * self.rows]))
+                for band in range(self.bands)
+            ]
+
+            candidates = {other for key in band_keys for other in buckets[key]}
+            for other in sorted(candidates, key=order.get):
+                similarity = self.similarity(signature, signatures[other])
+                if similarity >= self.duplicate_threshold:
+                    duplicates[url] = other
+                    self.content_logger.info(
+                        f"Near duplicate ({similarity:.2f}): {url} of {other}"
+                    )
+                    break
+
+            # Only originals are indexed, so duplicates chain to the first page
+            if url not in duplicates:
+                order[url] = len(order)
+                signatures[url] = signature
+                for key in band_keys:
+                    buckets[key].append(url)
+
+        return duplicates
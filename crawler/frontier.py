@@ -0,0 +1,297 @@
+"""
+Crawl frontier for link-discovery crawls
+"""
+
+import asyncio
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
+
+from constants import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_MAX_PAGES,
+    DEFAULT_TIMEOUT,
+    PDF_URL_MAPPING,
+    ROBOTS_USER_AGENT,
+    SKIPPED_LINK_EXTENSIONS,
+    TRACKING_QUERY_PARAMS,
+)
+from logger_utils import get_crawler_logger
+
+
+def _remove_dot_segments(path: str) -> str:
+    """
+    Resolve "." and ".." segments of an absolute URL path (RFC 3986, 5.2.4)
+
+    Unlike ``posixpath.normpath``, empty segments and a trailing slash are
+    kept, since servers may treat them as different paths.
+    """
+    segments = path.split("/")[1:]
+    resolved: List[str] = []
+    for segment in segments:
+        if segment == "..":
+            if resolved:
+                resolved.pop()
+        elif segment != ".":
+            resolved.append(segment)
+
+    # A final "." or ".." refers to a directory
+    if segments and segments[-1] in (".", ".."):
+        resolved.append("")
+    return "/" + "/".join(resolved)
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """
+    Normalize a URL so equivalent links deduplicate to the same string
+
+    Resolves relative links against ``base``, lowercases scheme and host,
+    removes dot segments from the path, drops default ports, fragments and
+    tracking parameters, and sorts the query string.
+
+    Args:
+        url: URL or relative link to normalize
+        base: URL of the page the link was found on
+
+    Returns:
+        Normalized URL, or None for non-HTTP links
+    """
+    if not url:
+        return None
+
+    try:
+        parts = urlsplit(urljoin(base, url.strip()) if base else url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if scheme not in ("http", "https") or not host:
+        return None
+
+    netloc = host
+    if port and not (
+        (scheme == "http" and port == 80) or (scheme == "https" and port == 443)
+    ):
+        netloc = f"{host}:{port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(TRACKING_QUERY_PARAMS)
+        )
+    )
+
+    path = _remove_dot_segments(parts.path) if parts.path else "/"
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def is_pdf_url(url: str) -> bool:
+    """Check whether a URL points at a PDF document"""
+    return (
+        urlsplit(url).path.lower().endswith(".pdf")
+        or url in PDF_URL_MAPPING.values()
+    )
+
+
+class CrawlFrontier:
+    """
+    Schedules URLs for a link-discovery crawl
+
+    Starting from seed URLs, discovered links are normalized, deduplicated
+    and admitted only if they stay on an allowed host, are within the depth
+    limit and fit in the page budget. Linked PDFs are collected separately
+    instead of being rendered. Visited and pending URLs can be persisted so
+    an interrupted crawl resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        seeds: Iterable[str],
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        allowed_hosts: Optional[Iterable[str]] = None,
+        state_path: Optional[str] = None,
+        respect_robots: bool = True,
+    ):
+        self.logger = get_crawler_logger()
+        self.seeds = [u for u in (normalize_url(s) for s in seeds) if u]
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        if allowed_hosts:
+            self.allowed_hosts = {host.lower() for host in allowed_hosts}
+        else:
+            self.allowed_hosts = {urlsplit(seed).hostname for seed in self.seeds}
+        self.state_path = state_path
+        self.respect_robots = respect_robots
+
+        self.visited: Set[str] = set()
+        self.pending: Dict[str, int] = {}  # url -> depth, scheduled not visited
+        self.pdf_links: Set[str] = set()
+        self.truncated = False  # links were dropped because of the budget
+
+        self._robots: Dict[str, Optional[RobotFileParser]] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+
+    @property
+    def scheduled_count(self) -> int:
+        return len(self.visited) + len(self.pending)
+
+    def in_scope(self, url: str) -> bool:
+        return urlsplit(url).hostname in self.allowed_hosts
+
+    def add(self, url: str, depth: int, base: Optional[str] = None) -> Optional[str]:
+        """
+        Admit a URL into the frontier
+
+        Args:
+            url: URL or relative link
+            depth: Link depth from the seeds
+            base: URL of the page the link was found on
+
+        Returns:
+            The normalized URL if it should be crawled, None otherwise
+        """
+        normalized = normalize_url(url, base)
+        if not normalized or not self.in_scope(normalized):
+            return None
+
+        if is_pdf_url(normalized):
+            self.pdf_links.add(normalized)
+            return None
+
+        if urlsplit(normalized).path.lower().endswith(SKIPPED_LINK_EXTENSIONS):
+            return None
+
+        if normalized in self.visited or normalized in self.pending:
+            return None
+
+        if depth > self.max_depth:
+            return None
+
+        if self.scheduled_count >= self.max_pages:
+            self.truncated = True
+            return None
+
+        self.pending[normalized] = depth
+        return normalized
+
+    def seed_items(self) -> List[Tuple[str, int]]:
+        """Items to start the crawl with: resumed pending URLs, else the seeds"""
+        if not self.pending:
+            for seed in self.seeds:
+                self.add(seed, 0)
+        return list(self.pending.items())
+
+    def mark_visited(self, url: str) -> None:
+        self.pending.pop(url, None)
+        self.visited.add(url)
+
+    async def is_allowed(self, url: str, request_context) -> bool:
+        """
+        Check robots.txt for a URL, fetching it once per origin
+
+        Args:
+            url: URL about to be crawled
+            request_context: Playwright APIRequestContext used for the fetch
+
+        Returns:
+            True if robots.txt allows the URL or could not be fetched
+        """
+        if not self.respect_robots:
+            return True
+
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        lock = self._robots_locks.setdefault(origin, asyncio.Lock())
+
+        async with lock:
+            if origin not in self._robots:
+                self._robots[origin] = await self._fetch_robots(
+                    origin, request_context
+                )
+
+        parser = self._robots[origin]
+        return parser is None or parser.can_fetch(ROBOTS_USER_AGENT, url)
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        """Crawl-delay from robots.txt for the URL's origin, if any"""
+        parts = urlsplit(url)
+        parser = self._robots.get(f"{parts.scheme}://{parts.netloc}")
+        return parser.crawl_delay(ROBOTS_USER_AGENT) if parser else None
+
+    async def _fetch_robots(
+        self, origin: str, request_context
+    ) -> Optional[RobotFileParser]:
+        robots_url = f"{origin}/robots.txt"
+        try:
+            response = await request_context.get(robots_url, timeout=DEFAULT_TIMEOUT)
+            status = response.status
+            body = await response.text() if status == 200 else ""
+            await response.dispose()
+        except Exception as e:
+            self.logger.warning(f"Could not fetch {robots_url}: {e}")
+            return None
+
+        if status != 200:
+            self.logger.info(f"No robots.txt at {origin} (HTTP {status})")
+            return None
+
+        parser = RobotFileParser(robots_url)
+        parser.parse(body.splitlines())
+        self.logger.info(f"Loaded robots.txt for {origin}")
+        return parser
+
+    def load_state(self) -> bool:
+        """
+        Restore visited and pending URLs from a previous, unfinished crawl
+
+        Returns:
+            True if state was restored
+        """
+        if not self.state_path or not os.path.exists(self.state_path):
+            return False
+
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable frontier state: {e}")
+            return False
+
+        self.visited = set(state.get("visited", []))
+        self.pending = {url: depth for url, depth in state.get("pending", [])}
+        self.pdf_links = set(state.get("pdf_links", []))
+        self.logger.info(
+            f"Resumed frontier: {len(self.visited)} visited, {len(self.pending)} pending"
+        )
+        return True
+
+    def save_state(self) -> None:
+        """Atomically persist visited and pending URLs"""
+        if not self.state_path:
+            return
+
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "visited": sorted(self.visited),
+                        "pending": sorted(self.pending.items()),
+                        "pdf_links": sorted(self.pdf_links),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            self.logger.error(f"Failed to save frontier state: {e}")
+
+    def clear_state(self) -> None:
+        """Remove persisted state once the crawl has finished"""
+        if self.state_path and os.path.exists(self.state_path):
+            os.remove(self.state_path)
@@ -0,0 +1,66 @@
+"""
+Per-host politeness limiter for concurrent crawling
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict
+from urllib.parse import urlparse
+
+from constants import DEFAULT_PER_HOST_DELAY, DEFAULT_PER_HOST_CONCURRENCY
+
+
+class HostRateLimiter:
+    """
+    Limits how hard the crawler hits any single host
+
+    Each host gets its own concurrency cap and a minimum interval between
+    request starts, so pages on different hosts never wait on each other.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_PER_HOST_DELAY,
+        max_concurrent: int = DEFAULT_PER_HOST_CONCURRENCY,
+    ):
+        self.min_interval = min_interval
+        self.max_concurrent = max(1, max_concurrent)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_allowed: Dict[str, float] = {}
+        self._host_intervals: Dict[str, float] = {}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def set_min_interval(self, url: str, seconds: float) -> None:
+        """Override the request interval for a URL's host, e.g. from Crawl-delay"""
+        self._host_intervals[self._host(url)] = seconds
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """
+        Wait until a request to the URL's host is allowed, then hold a slot
+
+        Args:
+            url: URL about to be requested
+        """
+        host = self._host(url)
+        semaphore = self._semaphores.setdefault(
+            host, asyncio.Semaphore(self.max_concurrent)
+        )
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with semaphore:
+            # Space out request starts for this host
+            async with lock:
+                loop = asyncio.get_running_loop()
+                wait = self._next_allowed.get(host, 0.0) - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_allowed[host] = loop.time() + self._host_intervals.get(
+                    host, self.min_interval
+                )
+
+            yield
@@ -2,18 +2,54 @@
 Logging utilities for the web crawler
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
 from constants import DEFAULT_LOGS_FOLDER
 
 
+class _RoutingHandler(logging.Handler):
+    """Hands each queued record to the handlers of the logger that emitted it"""
+
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, List[logging.Handler]] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+# One queue and one listener thread for every logger, so records keep their
+# order across loggers
+_log_queue = queue.SimpleQueue()
+_router = _RoutingHandler()
+_listener: Optional[QueueListener] = None
+
+# Set in worker processes, whose records go back to the parent instead
+_worker_handler: Optional[logging.Handler] = None
+
+
 def setup_logger(
     name: str, log_file: str = None, level: int = logging.INFO
 ) -> logging.Logger:
     """
     Set up a logger with both file and console handlers
 
+    The logger itself only gets a ``QueueHandler``; a background
+    ``QueueListener`` thread formats records and does the file and console
+    writes, so logging calls never block on I/O. Setup is idempotent: later
+    calls for the same name return the configured logger without reopening
+    its log file. In a process set up with ``route_logs_to``, the logger
+    writes to that handler only.
+
     Args:
         name: Logger name
         log_file: Log file name (optional)
@@ -22,11 +58,19 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    global _listener
+
+    logger = logging.getLogger(name)
+    if _worker_handler is not None:
+        logger.setLevel(level)
+        logger.handlers = [_worker_handler]
+        return logger
+    if name in _router.routes:
+        return logger
+
     # Create logs directory if it doesn't exist
     os.makedirs(DEFAULT_LOGS_FOLDER, exist_ok=True)
 
-    # Create logger
-    logger = logging.getLogger(name)
     logger.setLevel(level)
 
     # Clear existing handlers
@@ -47,18 +91,56 @@ def setup_logger(
     file_handler = logging.FileHandler(file_path, encoding="utf-8")
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Console handler (only for INFO and above)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_formatter = logging.Formatter("%(levelname)s - %(message)s")
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+
+    _router.routes[name] = [file_handler, console_handler]
+    logger.addHandler(QueueHandler(_log_queue))
+
+    if _listener is None:
+        _listener = QueueListener(_log_queue, _router)
+        _listener.start()
 
     return logger
 
 
+def route_logs_to(handler: logging.Handler) -> None:
+    """
+    Send every logger's records to one handler, for pool worker processes
+
+    Workers neither open log files nor start a listener thread; the handler
+    collects their records for the parent process to replay.
+
+    Args:
+        handler: Handler that receives the records
+    """
+    global _worker_handler
+
+    _worker_handler = handler
+    for name in _router.routes:
+        logging.getLogger(name).handlers = [handler]
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and stop the listener thread"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    for handlers in _router.routes.values():
+        for handler in handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_crawler_logger() -> logging.Logger:
     """Get the main crawler logger"""
     return setup_logger("crawler", "crawler.log")
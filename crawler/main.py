@@ -3,14 +3,28 @@
 Main entry point for the web crawler application
 """
 
+import argparse
 import asyncio
 import os
 import sys
 from datetime import datetime
 
 from crawler import Crawler
-from constants import AVEN_URLS, DEFAULT_OUTPUT_FOLDER, DEFAULT_PDF_FOLDER
+from corpus_sink import JsonlCorpusSink
+from constants import (
+    AVEN_URLS,
+    DEFAULT_OUTPUT_FOLDER,
+    DEFAULT_PDF_FOLDER,
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_MAX_PAGES,
+    DEFAULT_CORPUS_FILENAME,
+    DEFAULT_LOGS_FOLDER,
+    OCR_DPI,
+    OCR_GRAYSCALE,
+)
 from logger_utils import get_crawler_logger
+from metrics import get_stage_metrics
+from pdf_fetcher import PDFFetcher
 from pdf_processor import PDFProcessor
 
 
@@ -34,6 +48,32 @@ def print_results(results: dict):
     print(f"Successful: {results['successful']}")
     print(f"Failed: {results['failed']}")
     print(f"Files created: {len(results['files_created'])}")
+    if results.get("resumed"):
+        print(f"Resumed from previous run: {results['resumed']}")
+    print(
+        f"New: {results.get('new', 0)}, Updated: {results.get('updated', 0)}, "
+        f"Unchanged: {results.get('unchanged', 0)}, Removed: {results.get('removed', 0)}"
+    )
+
+    if results.get("duplicates") or results.get("boilerplate_chars_removed"):
+        print(
+            f"Near duplicates skipped: {len(results.get('duplicates', {}))}, "
+            f"Boilerplate-only pages skipped: "
+            f"{len(results.get('boilerplate_only', []))}, "
+            f"Boilerplate removed: {results.get('boilerplate_chars_removed', 0)} chars"
+        )
+
+    if results.get("page_recycles") or results.get("browser_relaunches"):
+        print(
+            f"Page recycles: {results.get('page_recycles', 0)}, "
+            f"Browser relaunches: {results.get('browser_relaunches', 0)}"
+        )
+
+    page_stats = results.get("page_stats", {}).values()
+    blocked = sum(stats.get("requests_blocked", 0) for stats in page_stats)
+    if blocked:
+        saved_kb = sum(stats.get("estimated_bytes_saved", 0) for stats in page_stats)
+        print(f"Requests blocked: {blocked} (~{saved_kb // 1024} KB saved)")
 
     if results["files_created"]:
         print(f"\nFiles created:")
@@ -41,6 +81,11 @@ def print_results(results: dict):
             filename = os.path.basename(filepath)
             print(f"   • {filename}")
 
+    if results.get("discovered_pdfs"):
+        print(f"\nPDFs discovered:")
+        for pdf_url in results["discovered_pdfs"]:
+            print(f"   • {pdf_url}")
+
     if results["errors"]:
         print(f"\n Errors encountered:")
         for error in results["errors"]:
@@ -69,6 +114,19 @@ def print_pdf_results(results: dict):
     print(f"Failed: {results['failed']}")
     print(f"Files processed: {results['files_processed']}")
     print(f"Text files created: {len(results['files_created'])}")
+    if "cached" in results:
+        print(f"Served from extraction cache: {results['cached']}")
+        print(f"Unchanged (not rewritten): {results['unchanged']}")
+    if results.get("tables"):
+        print(f"Tables rendered as structured text: {results['tables']}")
+
+    if results.get("page_methods"):
+        print(f"\nPages by extraction method:")
+        for filename, counts in results["page_methods"].items():
+            summary = ", ".join(
+                f"{method or 'none'}: {count}" for method, count in counts.items()
+            )
+            print(f"   • {filename}: {summary}")
 
     if results["files_created"]:
         print(f"\nFiles created:")
@@ -82,20 +140,99 @@ def print_pdf_results(results: dict):
             print(f"   • {error}")
 
 
-async def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Aven Website Content Crawler")
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="Follow links from AVEN_URLS instead of crawling only that list",
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=DEFAULT_MAX_DEPTH,
+        help="Maximum link depth from the seed URLs when discovering",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=DEFAULT_MAX_PAGES,
+        help="Maximum number of pages to crawl when discovering",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted crawl from its journal instead of starting over",
+    )
+    parser.add_argument(
+        "--corpus",
+        action="store_true",
+        help=f"Also append records to {DEFAULT_CORPUS_FILENAME} in the output folder",
+    )
+    parser.add_argument(
+        "--compact-corpus",
+        action="store_true",
+        help="Rewrite the corpus with only current records once processing ends",
+    )
+    parser.add_argument(
+        "--skip-pdf-fetch",
+        action="store_true",
+        help="Use the PDFs already in the PDF folder instead of downloading them",
+    )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for PDF extraction and OCR (1 processes serially)",
+    )
+    parser.add_argument(
+        "--ocr-dpi",
+        type=int,
+        default=OCR_DPI,
+        help="Resolution pages are rasterized at for OCR",
+    )
+    parser.add_argument(
+        "--ocr-color",
+        action="store_true",
+        help="OCR pages in color instead of converting them to grayscale",
+    )
+    return parser.parse_args(argv)
+
+
+def get_corpus_path(args: argparse.Namespace):
+    """Path of the structured corpus file, or None when it is disabled"""
+    if not args.corpus:
+        return None
+    return os.path.join(DEFAULT_OUTPUT_FOLDER, DEFAULT_CORPUS_FILENAME)
+
+
+async def main(args: argparse.Namespace = None):
     """Main application entry point"""
     logger = get_crawler_logger()
+    args = args or parse_args([])
 
     try:
         print_banner()
 
         # Initialize crawler
         logger.info("Initializing crawler")
-        crawler = Crawler(output_folder=DEFAULT_OUTPUT_FOLDER)
+        crawler = Crawler(
+            output_folder=DEFAULT_OUTPUT_FOLDER, corpus_path=get_corpus_path(args)
+        )
 
         # Start crawling
-        logger.info(f"Starting to crawl {len(AVEN_URLS)} URLs")
-        results = await crawler.crawl_urls(AVEN_URLS)
+        if args.discover:
+            logger.info(f"Starting site crawl from {len(AVEN_URLS)} seed URLs")
+            results = await crawler.crawl_site(
+                AVEN_URLS,
+                max_depth=args.max_depth,
+                max_pages=args.max_pages,
+                resume=args.resume,
+            )
+        else:
+            logger.info(f"Starting to crawl {len(AVEN_URLS)} URLs")
+            results = await crawler.crawl_urls(AVEN_URLS, resume=args.resume)
 
         # Print results
         print_results(results)
@@ -112,6 +249,7 @@ async def main():
 
     except KeyboardInterrupt:
         print("\n⏹️  Crawling interrupted by user")
+        print("Run again with --resume to continue where it stopped")
         logger.info("Crawling interrupted by user")
         return 1
 
@@ -123,14 +261,38 @@ async def main():
 
 def run_crawler():
     """Entry point for running the crawler and PDF processor"""
+    args = parse_args()
+
     try:
         # Run web crawler
         print("Web Content Crawling")
-        crawler_exit_code = asyncio.run(main())
+        try:
+            crawler_exit_code = asyncio.run(main(args))
+        except KeyboardInterrupt:
+            # asyncio.run cancels the crawl, progress is kept in the journal
+            print("\n⏹️  Crawling interrupted by user")
+            print("Run again with --resume to continue where it stopped")
+            sys.exit(1)
+
+        # Download new or changed PDFs
+        if not args.skip_pdf_fetch:
+            print("\nPDF Download")
+            run_pdf_fetch()
 
         # Run PDF processor
         print("\nPDF Content Processing")
-        pdf_success = run_pdf_processor()
+        pdf_success = run_pdf_processor(
+            get_corpus_path(args),
+            args.pdf_workers,
+            ocr_dpi=args.ocr_dpi,
+            ocr_grayscale=not args.ocr_color,
+        )
+
+        corpus_path = get_corpus_path(args)
+        if args.compact_corpus and corpus_path and os.path.exists(corpus_path):
+            JsonlCorpusSink(corpus_path, compact_threshold=0).compact()
+
+        write_stage_timings()
 
         # Determine overall exit code
         if crawler_exit_code == 0 or pdf_success:
@@ -148,7 +310,50 @@ def run_crawler():
         sys.exit(1)
 
 
-def run_pdf_processor():
+def write_stage_timings():
+    """Print the per-stage timing summary and save it next to the logs"""
+    timings = get_stage_metrics().to_json()
+
+    print("\nStage Timings")
+    print(timings)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timings_path = os.path.join(DEFAULT_LOGS_FOLDER, f"stage_timings_{timestamp}.json")
+    try:
+        os.makedirs(DEFAULT_LOGS_FOLDER, exist_ok=True)
+        with open(timings_path, "w", encoding="utf-8") as f:
+            f.write(timings)
+        print(f"Stage timings saved to: {timings_path}")
+    except Exception as e:
+        get_crawler_logger().error(f"Failed to save stage timings: {e}")
+
+
+def run_pdf_fetch():
+    """Download new or changed PDFs from PDF_URL_MAPPING"""
+    logger = get_crawler_logger()
+
+    try:
+        results = PDFFetcher().fetch_all()
+
+        print(f"Downloaded (new or changed): {len(results['downloaded'])}")
+        print(f"Unchanged: {len(results['unchanged'])}")
+        print(f"Failed: {results['failed']}")
+        for error in results["errors"]:
+            print(f"   • {error}")
+        return results["failed"] == 0
+
+    except Exception as e:
+        print(f"PDF download error: {str(e)}")
+        logger.error(f"PDF download error: {str(e)}")
+        return False
+
+
+def run_pdf_processor(
+    corpus_path: str = None,
+    workers: int = 1,
+    ocr_dpi: int = OCR_DPI,
+    ocr_grayscale: bool = OCR_GRAYSCALE,
+):
     """Run PDF processor"""
     logger = get_crawler_logger()
 
@@ -175,11 +380,13 @@ def run_pdf_processor():
 
         # Initialize PDF processor
         logger.info("Initializing PDF processor")
-        pdf_processor = PDFProcessor()
+        pdf_processor = PDFProcessor(
+            corpus_path=corpus_path, ocr_dpi=ocr_dpi, ocr_grayscale=ocr_grayscale
+        )
 
         # Process PDFs
         logger.info(f"Starting to process {len(pdf_files)} PDF files")
-        results = pdf_processor.process_pdfs()
+        results = pdf_processor.process_pdfs(workers=workers)
 
         # Print results
         print_pdf_results(results)
@@ -0,0 +1,90 @@
+"""
+Stage timing metrics for crawling and PDF extraction
+"""
+
+import json
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+from constants import METRICS_SLOWEST_ITEMS
+
+
+class StageMetrics:
+    """
+    Collects how long each named stage took, per item
+
+    Stages are free-form names such as "crawl.navigate" or "pdf.ocr_page";
+    each sample keeps the item it was measured on (a URL, a PDF filename, a
+    page) so the summary can point at the slowest ones.
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float, item: str = "") -> None:
+        self.samples[stage].append((seconds, item))
+
+    @contextmanager
+    def time(self, stage: str, item: str = ""):
+        """Time the body of a with block as one sample of a stage"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started, item)
+
+    def drain(self) -> Dict[str, List[Tuple[float, str]]]:
+        """Return the samples collected so far and start over"""
+        samples, self.samples = dict(self.samples), defaultdict(list)
+        return samples
+
+    def merge(self, samples: Dict[str, List[Tuple[float, str]]]) -> None:
+        """Add samples collected elsewhere, e.g. in a worker process"""
+        for stage, stage_samples in samples.items():
+            self.samples[stage].extend(stage_samples)
+
+    @staticmethod
+    def _percentile(durations: List[float], fraction: float) -> float:
+        """Nearest-rank percentile of sorted durations"""
+        rank = max(1, math.ceil(fraction * len(durations)))
+        return durations[rank - 1]
+
+    def summary(self) -> Dict[str, Dict[str, any]]:
+        """
+        Summarize every stage
+
+        Returns:
+            Dictionary mapping stage name to its count, total, p50, p95 and
+            max in milliseconds, plus the slowest items
+        """
+        summary = {}
+        for stage in sorted(self.samples):
+            samples = sorted(self.samples[stage], key=lambda sample: sample[0])
+            durations = [seconds for seconds, _ in samples]
+            summary[stage] = {
+                "count": len(durations),
+                "total_ms": round(sum(durations) * 1000, 1),
+                "p50_ms": round(self._percentile(durations, 0.5) * 1000, 1),
+                "p95_ms": round(self._percentile(durations, 0.95) * 1000, 1),
+                "max_ms": round(durations[-1] * 1000, 1),
+                "slowest": [
+                    {"item": item, "ms": round(seconds * 1000, 1)}
+                    for seconds, item in reversed(samples[-METRICS_SLOWEST_ITEMS:])
+                    if item
+                ],
+            }
+        return summary
+
+    def to_json(self) -> str:
+        return json.dumps(self.summary(), indent=2)
+
+
+_stage_metrics = StageMetrics()
+
+
+def get_stage_metrics() -> StageMetrics:
+    """Get the process-wide stage metrics"""
+    return _stage_metrics
@@ -0,0 +1,110 @@
+"""
+Content-addressed cache of PDF extraction results
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+from constants import DEFAULT_PDF_CACHE_FOLDER
+from logger_utils import get_file_logger
+
+# Bump whenever a change to extraction would produce different text
+PDF_EXTRACTOR_VERSION = "1"
+
+
+class PDFExtractionCache:
+    """
+    Stores extracted PDF content keyed by what produced it
+
+    A key combines the SHA-256 of the PDF bytes, ``PDF_EXTRACTOR_VERSION``
+    and the extraction settings (OCR DPI, grayscale, ...), so a cached entry
+    is only reused for an identical file extracted the same way. Each entry
+    is a JSON file holding the per-page texts and methods, named by its key.
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.file_logger = get_file_logger()
+        os.makedirs(self.folder, exist_ok=True)
+
+    @classmethod
+    def for_output_folder(cls, output_folder: str) -> "PDFExtractionCache":
+        """Create a cache stored alongside the processor output"""
+        return cls(os.path.join(output_folder, DEFAULT_PDF_CACHE_FOLDER))
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        """SHA-256 of a file's bytes"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(file_hash: str, settings: Dict[str, any]) -> str:
+        """
+        Cache key for a PDF extracted with the given settings
+
+        Args:
+            file_hash: SHA-256 of the PDF bytes
+            settings: Extraction settings that affect the output
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        fingerprint = json.dumps(
+            {"pdf": file_hash, "version": PDF_EXTRACTOR_VERSION, **settings},
+            sort_keys=True,
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.folder, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        """Cached extraction for a key, or None on a miss"""
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            self.file_logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def put(self, key: str, entry: Dict[str, any]) -> None:
+        """Atomically store an extraction under a key"""
+        path = self._entry_path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.file_logger.error(f"Failed to write cache entry {path}: {e}")
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """
+        Delete entries other than the given keys
+
+        Args:
+            keep: Keys still in use
+
+        Returns:
+            Number of entries removed
+        """
+        keep = {f"{key}.json" for key in keep}
+        removed = 0
+        for name in os.listdir(self.folder):
+            if name.endswith(".json") and name not in keep:
+                os.remove(os.path.join(self.folder, name))
+                removed += 1
+
+        if removed:
+            self.file_logger.info(f"Pruned {removed} stale PDF cache entries")
+        return removed
@@ -0,0 +1,106 @@
+"""
+Shared, single-open view of a PDF for the extraction methods
+"""
+
+import mmap
+from typing import Optional
+
+import PyPDF2
+import pdfplumber
+from pdf2image import pdfinfo_from_path
+
+from logger_utils import get_content_logger
+
+
+class ParsedPDF:
+    """
+    A PDF opened once and shared by every extraction method
+
+    The file is memory-mapped read-only and both parsers read from that map,
+    so its bytes are read from disk once. The PyPDF2 reader and the
+    pdfplumber document are created on first use and kept, so a fallback or
+    a second pass (e.g. table detection) reuses the parse instead of opening
+    the file again. OCR still rasterizes from the path, since pdftoppm runs
+    in its own process.
+
+    Use as a context manager so the parsers and the map are released.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise ValueError(f"Empty PDF file: {path}")
+
+        self._reader = None
+        self._plumber = None
+        self._page_count: Optional[int] = None
+
+    def __enter__(self) -> "ParsedPDF":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        return len(self._map)
+
+    @property
+    def reader(self) -> "PyPDF2.PdfReader":
+        """PyPDF2 reader, parsed on first use"""
+        if self._reader is None:
+            self._map.seek(0)
+            self._reader = PyPDF2.PdfReader(self._map)
+        return self._reader
+
+    @property
+    def plumber(self) -> "pdfplumber.PDF":
+        """pdfplumber document, parsed on first use"""
+        if self._plumber is None:
+            self._map.seek(0)
+            self._plumber = pdfplumber.open(self._map)
+        return self._plumber
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages, from whichever parser can read the file"""
+        if self._page_count is None:
+            for count in (
+                lambda: len(self.reader.pages),
+                lambda: len(self.plumber.pages),
+                lambda: pdfinfo_from_path(self.path)["Pages"],
+            ):
+                try:
+                    self._page_count = count()
+                    break
+                except Exception as e:
+                    get_content_logger().debug(
+                        "Page count failed for %s: %s", self.path, e
+                    )
+            else:
+                self._page_count = 0
+
+        return self._page_count
+
+    def close(self) -> None:
+        if self._plumber is not None:
+            try:
+                self._plumber.close()
+            except Exception:
+                pass
+            self._plumber = None
+
+        self._reader = None
+        if not self._map.closed:
+            try:
+                self._map.close()
+            except BufferError:
+                # A parser still holds a view into the map, let GC release it
+                pass
+        self._file.close()
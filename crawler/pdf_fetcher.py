@@ -0,0 +1,246 @@
+"""
+Conditional, concurrent download of the source PDFs
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import (
+    DEFAULT_PDF_FOLDER,
+    DEFAULT_FETCH_STATE_FILENAME,
+    PDF_URL_MAPPING,
+    PDF_FETCH_WORKERS,
+    PDF_FETCH_TIMEOUT,
+    PDF_FETCH_CHUNK_SIZE,
+    PDF_SIGNATURE_BYTES,
+    USER_AGENT,
+)
+from logger_utils import get_file_logger
+
+
+class PDFFetcher:
+    """
+    Downloads the PDFs in ``PDF_URL_MAPPING`` into the PDF folder
+
+    Requests go through one pooled ``requests.Session`` from a thread pool and
+    carry If-None-Match / If-Modified-Since from the previous download, so an
+    unchanged PDF costs a 304. Bodies are streamed to a temporary file while
+    being hashed, and the PDF on disk is only replaced when its bytes
+    changed; the extraction cache then skips re-extracting everything else.
+    """
+
+    def __init__(
+        self,
+        pdf_folder: str = DEFAULT_PDF_FOLDER,
+        url_mapping: Optional[Dict[str, str]] = None,
+        max_workers: int = PDF_FETCH_WORKERS,
+        timeout: float = PDF_FETCH_TIMEOUT,
+    ):
+        self.pdf_folder = pdf_folder
+        self.url_mapping = PDF_URL_MAPPING if url_mapping is None else url_mapping
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.state_path = os.path.join(pdf_folder, DEFAULT_FETCH_STATE_FILENAME)
+        self.file_logger = get_file_logger()
+
+        os.makedirs(self.pdf_folder, exist_ok=True)
+        self.state: Dict[str, Dict[str, str]] = self._load_state()
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=Retry(
+                total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _load_state(self) -> Dict[str, Dict[str, str]]:
+        if not os.path.exists(self.state_path):
+            return {}
+
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("files", {})
+        except Exception as e:
+            self.file_logger.warning(
+                f"Ignoring unreadable fetch state {self.state_path}: {e}"
+            )
+            return {}
+
+    def _save_state(self) -> None:
+        """Atomically write the download validators to disk"""
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"files": self.state}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            self.file_logger.error(f"Failed to save fetch state {self.state_path}: {e}")
+
+    @staticmethod
+    def _file_hash(path: str) -> Optional[str]:
+        if not os.path.exists(path):
+            return None
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(PDF_FETCH_CHUNK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _check_pdf_header(head: bytes) -> None:
+        """
+        Reject a response without a PDF header in its first bytes
+
+        Readers accept the header anywhere in the first kilobyte, after
+        e.g. a byte order mark. Catches HTML error or login pages served
+        with a 200.
+        """
+        if b"%PDF-" not in head[:PDF_SIGNATURE_BYTES]:
+            raise ValueError("response is not a PDF")
+
+    def _conditional_headers(self, filename: str) -> Dict[str, str]:
+        entry = self.state.get(filename)
+        if not entry or not os.path.exists(os.path.join(self.pdf_folder, filename)):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _fetch(self, filename: str, url: str) -> Dict[str, str]:
+        """
+        Download one PDF unless the server reports it unchanged
+
+        Args:
+            filename: Name of the PDF in the PDF folder
+            url: Source URL
+
+        Returns:
+            Dictionary with the outcome ("downloaded", "unchanged",
+            "not_modified" or "failed") and the new validators
+        """
+        path = os.path.join(self.pdf_folder, filename)
+        part_path = f"{path}.part"
+        outcome = {"filename": filename, "url": url}
+
+        try:
+            with self.session.get(
+                url,
+                headers=self._conditional_headers(filename),
+                stream=True,
+                timeout=self.timeout,
+            ) as response:
+                if response.status_code == 304:
+                    outcome["status"] = "not_modified"
+                    return outcome
+                response.raise_for_status()
+
+                digest = hashlib.sha256()
+                head = b""
+                checked = False
+                with open(part_path, "wb") as f:
+                    for block in response.iter_content(PDF_FETCH_CHUNK_SIZE):
+                        if not checked:
+                            # Chunks can be shorter than the bytes to check
+                            head += block
+                            if len(head) < PDF_SIGNATURE_BYTES:
+                                continue
+                            self._check_pdf_header(head)
+                            block, checked = head, True
+                        digest.update(block)
+                        f.write(block)
+                    if not checked:
+                        self._check_pdf_header(head)
+                        digest.update(head)
+                        f.write(head)
+
+                outcome["etag"] = response.headers.get("ETag", "")
+                outcome["last_modified"] = response.headers.get("Last-Modified", "")
+
+            outcome["sha256"] = digest.hexdigest()
+            if outcome["sha256"] == self._file_hash(path):
+                os.remove(part_path)
+                outcome["status"] = "unchanged"
+            else:
+                os.replace(part_path, path)
+                outcome["status"] = "downloaded"
+
+        except Exception as e:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            outcome["status"] = "failed"
+            outcome["error"] = str(e)
+
+        return outcome
+
+    def fetch_all(self) -> Dict[str, any]:
+        """
+        Fetch every PDF in the URL mapping concurrently
+
+        Returns:
+            Dictionary with downloaded, unchanged and failed files
+        """
+        results = {
+            "downloaded": [],
+            "unchanged": [],
+            "failed": 0,
+            "errors": [],
+        }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            outcomes = list(
+                pool.map(lambda item: self._fetch(*item), self.url_mapping.items())
+            )
+
+        for outcome in outcomes:
+            filename = outcome["filename"]
+            status = outcome["status"]
+
+            if status == "failed":
+                results["failed"] += 1
+                error_msg = f"Failed to fetch {outcome['url']}: {outcome['error']}"
+                results["errors"].append(error_msg)
+                self.file_logger.error(error_msg)
+                continue
+
+            if status == "downloaded":
+                results["downloaded"].append(filename)
+                self.file_logger.info(f"Downloaded new or changed PDF: {filename}")
+            else:
+                results["unchanged"].append(filename)
+                self.file_logger.info(f"PDF unchanged ({status}): {filename}")
+
+            if status != "not_modified":
+                self.state[filename] = {
+                    "url": outcome["url"],
+                    "etag": outcome["etag"],
+                    "last_modified": outcome["last_modified"],
+                    "sha256": outcome["sha256"],
+                    "fetched_at": datetime.now().isoformat(timespec="seconds"),
+                }
+
+        self._save_state()
+        self.session.close()
+
+        self.file_logger.info(
+            f"PDF fetch completed - Downloaded: {len(results['downloaded'])}, "
+            f"Unchanged: {len(results['unchanged'])}, Failed: {results['failed']}"
+        )
+        return results
@@ -3,9 +3,13 @@
 PDF Content Processor with OCR capabilities
 """
 
+import logging
+import multiprocessing
 import os
 import re
-from typing import List, Dict, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -25,8 +29,24 @@ from constants import (
     DEFAULT_OUTPUT_FOLDER,
     MIN_CONTENT_LENGTH,
     PDF_URL_MAPPING,
+    OCR_PAGES_PER_TASK,
+    MIN_PAGE_TEXT_LENGTH,
+    MIN_PAGE_TEXT_ALNUM_RATIO,
+    OCR_DPI,
+    OCR_GRAYSCALE,
+    OCR_WINDOW_PAGES,
+    PDF_DETECT_TABLES,
+    PDF_TABLE_FORMAT,
 )
-from logger_utils import get_content_logger, get_file_logger
+from corpus_sink import JsonlCorpusSink
+from pdf_cache import PDFExtractionCache
+from pdf_document import ParsedPDF
+from pdf_text import clean_page_text, join_pages, render_table
+from logger_utils import get_content_logger, get_file_logger, route_logs_to
+from metrics import get_stage_metrics
+
+# Page extraction methods, in the order they are tried
+EXTRACTION_METHODS = ("PyPDF2", "pdfplumber", "OCR")
 
 
 class PDFContentData:
@@ -40,13 +60,23 @@ class PDFContentData:
         method: str = "",
         pages: int = 0,
         status: str = "",
+        page_texts: Optional[List[str]] = None,
+        page_methods: Optional[List[str]] = None,
+        tables: int = 0,
     ):
         self.filename = filename
         self.title = title
         self.content = content
-        self.method = method  # extraction method used
+        self.method = method  # extraction methods used, joined with "+"
         self.pages = pages
         self.status = status
+        self.page_texts = page_texts or []  # cleaned text per page once finalized
+        self.page_methods = page_methods or []  # method per page, "" for none
+        self.tables = tables  # tables rendered as structured text
+
+    def method_counts(self) -> Dict[str, int]:
+        """Number of pages served by each extraction method"""
+        return dict(Counter(self.page_methods))
 
     def to_dict(self) -> Dict[str, any]:
         return {
@@ -56,8 +86,15 @@ class PDFContentData:
             "method": self.method,
             "pages": self.pages,
             "status": self.status,
+            "page_texts": self.page_texts,
+            "page_methods": self.page_methods,
+            "tables": self.tables,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> "PDFContentData":
+        return cls(**data)
+
 
 class PDFProcessor:
     """
@@ -68,15 +105,33 @@ class PDFProcessor:
         self,
         pdf_folder: str = DEFAULT_PDF_FOLDER,
         output_folder: str = DEFAULT_OUTPUT_FOLDER,
+        corpus_path: Optional[str] = None,
+        ocr_dpi: int = OCR_DPI,
+        ocr_grayscale: bool = OCR_GRAYSCALE,
+        ocr_window: int = OCR_WINDOW_PAGES,
+        use_cache: bool = True,
+        detect_tables: bool = PDF_DETECT_TABLES,
+        table_format: str = PDF_TABLE_FORMAT,
     ):
         self.pdf_folder = pdf_folder
         self.output_folder = output_folder
+        self.ocr_dpi = ocr_dpi
+        self.ocr_grayscale = ocr_grayscale
+        self.ocr_window = max(1, ocr_window)
+        self.detect_tables = detect_tables
+        self.table_format = table_format
+        self.corpus_sink = JsonlCorpusSink(corpus_path) if corpus_path else None
         self.content_logger = get_content_logger()
         self.file_logger = get_file_logger()
+        self.metrics = get_stage_metrics()
 
         # Ensure folders exist
         self._ensure_folders()
 
+        self.cache = (
+            PDFExtractionCache.for_output_folder(output_folder) if use_cache else None
+        )
+
         self.content_logger.info(f"PDF Processor initialized")
         self.content_logger.info(f"PDF folder: {self.pdf_folder}")
         self.content_logger.info(f"Output folder: {self.output_folder}")
@@ -93,24 +148,6 @@ class PDFProcessor:
             self.file_logger.error(f"Failed to create folders: {e}")
             raise
 
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text content"""
-        if not text:
-            return ""
-
-        # Remove extra whitespace and normalize
-        lines = [line.strip() for line in text.splitlines()]
-        lines = [line for line in lines if line.strip()]
-        cleaned = "\n".join(lines)
-
-        # Remove excessive repeated characters
-        cleaned = re.sub(r"(.)\1{4,}", r"\1\1", cleaned)
-
-        self.content_logger.debug(
-            f"Cleaned text from {len(text)} to {len(cleaned)} characters"
-        )
-        return cleaned
-
     def _generate_safe_filename(self, pdf_filename: str) -> str:
         """Generate a safe filename for output"""
         # Remove extension and clean name
@@ -122,168 +159,403 @@ class PDFProcessor:
         output_filename = f"PDF_{safe_name}.txt"
 
         self.file_logger.debug(
-            f"Generated filename '{output_filename}' for PDF: {pdf_filename}"
+            "Generated filename '%s' for PDF: %s", output_filename, pdf_filename
         )
         return output_filename
 
-    def _extract_with_pypdf2(self, pdf_path: str) -> PDFContentData:
-        """Extract text using PyPDF2"""
-        try:
-            content = ""
-            page_count = 0
-
-            with open(pdf_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                page_count = len(pdf_reader.pages)
-
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            content += f"\n--- Page {page_num + 1} ---\n"
-                            content += page_text
-                    except Exception as e:
-                        self.content_logger.warning(
-                            f"Failed to extract page {page_num + 1}: {e}"
-                        )
+    def _is_page_text_usable(self, text: str) -> bool:
+        """Check whether a page's text layer is worth keeping over OCR"""
+        compact = "".join(text.split())
+        if len(compact) < MIN_PAGE_TEXT_LENGTH:
+            return False
 
-            cleaned_content = self._clean_text(content)
+        # Broken font encodings extract as mostly symbols
+        alnum = sum(1 for char in compact if char.isalnum())
+        return alnum / len(compact) >= MIN_PAGE_TEXT_ALNUM_RATIO
 
-            return PDFContentData(
-                filename=os.path.basename(pdf_path),
-                content=cleaned_content,
-                method="PyPDF2",
-                pages=page_count,
-                status="success" if cleaned_content else "no_text_found",
-            )
+    def _pypdf2_page_texts(self, document: ParsedPDF) -> List[str]:
+        """Extract the text of every page using PyPDF2"""
+        filename = os.path.basename(document.path)
+        page_texts = []
+
+        with self.metrics.time("pdf.parse", filename):
+            pages = document.reader.pages
+
+        with self.metrics.time("pdf.extract.PyPDF2", filename):
+            for page_num, page in enumerate(pages, 1):
+                try:
+                    page_texts.append(page.extract_text() or "")
+                except Exception as e:
+                    self.content_logger.warning(
+                        f"Failed to extract page {page_num}: {e}"
+                    )
+                    page_texts.append("")
 
+        return page_texts
+
+    def _pdfplumber_page_texts(
+        self, document: ParsedPDF, page_numbers: Optional[List[int]] = None
+    ) -> Dict[int, str]:
+        """
+        Extract page text using pdfplumber
+
+        Args:
+            document: Parsed PDF to read
+            page_numbers: 1-based pages to extract, defaults to all pages
+
+        Returns:
+            Dictionary mapping page number to text
+        """
+        page_texts = {}
+
+        filename = os.path.basename(document.path)
+
+        with self.metrics.time("pdf.extract.pdfplumber", filename):
+            pages = document.plumber.pages
+
+            for page_num in page_numbers or range(1, len(pages) + 1):
+                try:
+                    page_texts[page_num] = pages[page_num - 1].extract_text() or ""
+                except Exception as e:
+                    self.content_logger.warning(
+                        f"Failed to extract page {page_num}: {e}"
+                    )
+                    page_texts[page_num] = ""
+
+        return page_texts
+
+    def _extract_text_layer(self, document: ParsedPDF) -> PDFContentData:
+        """
+        Extract each page's text layer, falling back per page
+
+        Every page is read with PyPDF2 first; only pages without usable text
+        are read again with pdfplumber. Pages that still have no usable text
+        are left with an empty method for OCR. Both parsers share the
+        document's single open of the file.
+        """
+        pdf_path = document.path
+
+        try:
+            page_texts = self._pypdf2_page_texts(document)
         except Exception as e:
             self.content_logger.error(f"PyPDF2 extraction failed for {pdf_path}: {e}")
-            return PDFContentData(
-                filename=os.path.basename(pdf_path),
-                method="PyPDF2",
-                status=f"error: {str(e)}",
+            page_texts = []
+
+        page_methods = [
+            "PyPDF2" if self._is_page_text_usable(text) else "" for text in page_texts
+        ]
+        retry_pages = [num for num, method in enumerate(page_methods, 1) if not method]
+
+        if retry_pages or not page_texts:
+            self.content_logger.info(
+                f"PyPDF2 insufficient for {len(retry_pages) or 'all'} pages, "
+                f"trying pdfplumber..."
             )
+            try:
+                plumber_texts = self._pdfplumber_page_texts(document, retry_pages)
+            except Exception as e:
+                self.content_logger.error(
+                    f"pdfplumber extraction failed for {pdf_path}: {e}"
+                )
+                plumber_texts = {}
+
+            if not page_texts:
+                page_texts = [""] * len(plumber_texts)
+                page_methods = [""] * len(plumber_texts)
+
+            for page_num, text in plumber_texts.items():
+                if self._is_page_text_usable(text):
+                    page_texts[page_num - 1] = text
+                    page_methods[page_num - 1] = "pdfplumber"
+
+        if not page_texts:
+            # Neither parser could read the text, OCR every page
+            page_texts = [""] * document.page_count
+            page_methods = [""] * document.page_count
+
+        content_data = PDFContentData(
+            filename=os.path.basename(pdf_path),
+            pages=len(page_texts),
+            page_texts=page_texts,
+            page_methods=page_methods,
+        )
+
+        if self.detect_tables and any(page_methods):
+            with self.metrics.time("pdf.tables", content_data.filename):
+                self._extract_tables(document, content_data)
+
+        return content_data
+
+    def _extract_tables(
+        self, document: ParsedPDF, content_data: PDFContentData
+    ) -> None:
+        """
+        Replace the text of pages that contain tables with table-aware text
 
-    def _extract_with_pdfplumber(self, pdf_path: str) -> PDFContentData:
-        """Extract text using pdfplumber"""
+        Flattened table text reads as run-on lines, so pages served by a text
+        layer are checked for tables with pdfplumber. Each table is rendered
+        one row per line (Markdown or "header: value" rows) in its reading
+        position among the rest of the page text.
+        """
         try:
-            content = ""
-            page_count = 0
-
-            with pdfplumber.open(pdf_path) as pdf:
-                page_count = len(pdf.pages)
-
-                for page_num, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            content += f"\n--- Page {page_num + 1} ---\n"
-                            content += page_text
-                    except Exception as e:
-                        self.content_logger.warning(
-                            f"Failed to extract page {page_num + 1}: {e}"
-                        )
+            pages = document.plumber.pages
+        except Exception as e:
+            self.content_logger.warning(
+                f"Table detection unavailable for {document.path}: {e}"
+            )
+            return
+
+        for page_num, method in enumerate(content_data.page_methods, 1):
+            if not method:
+                continue
 
-            cleaned_content = self._clean_text(content)
+            try:
+                page = pages[page_num - 1]
+                tables = page.find_tables()
+                if not tables:
+                    continue
 
-            return PDFContentData(
-                filename=os.path.basename(pdf_path),
-                content=cleaned_content,
-                method="pdfplumber",
-                pages=page_count,
-                status="success" if cleaned_content else "no_text_found",
+                content_data.page_texts[page_num - 1] = self._page_text_with_tables(
+                    page, tables
+                )
+                content_data.page_methods[page_num - 1] = "pdfplumber"
+                content_data.tables += len(tables)
+            except Exception as e:
+                self.content_logger.warning(
+                    f"Table extraction failed for page {page_num}: {e}"
+                )
+
+        if content_data.tables:
+            self.content_logger.info(
+                f"Rendered {content_data.tables} tables from {content_data.filename}"
             )
 
-        except Exception as e:
-            self.content_logger.error(
-                f"pdfplumber extraction failed for {pdf_path}: {e}"
+    def _page_text_with_tables(self, page, tables) -> str:
+        """Page text with each table rendered in place of its flattened text"""
+        tables = sorted(tables, key=lambda table: table.bbox[1])
+        bboxes = [table.bbox for table in tables]
+
+        def outside_tables(obj) -> bool:
+            x = (obj["x0"] + obj["x1"]) / 2
+            y = (obj["top"] + obj["bottom"]) / 2
+            return not any(
+                x0 <= x <= x1 and top <= y <= bottom for x0, top, x1, bottom in bboxes
             )
-            return PDFContentData(
-                filename=os.path.basename(pdf_path),
-                method="pdfplumber",
-                status=f"error: {str(e)}",
+
+        text_only = page.filter(outside_tables)
+        x0, page_top, x1, page_bottom = page.bbox
+
+        # Text above each table, then the table; text beside a table lands
+        # in the band that follows it
+        parts = []
+        band_top = page_top
+        for table in tables:
+            table_top = max(band_top, table.bbox[1])
+            if table_top > band_top:
+                parts.append(
+                    text_only.crop((x0, band_top, x1, table_top)).extract_text() or ""
+                )
+            parts.append(render_table(table.extract(), self.table_format))
+            band_top = table_top
+
+        if page_bottom > band_top:
+            parts.append(
+                text_only.crop((x0, band_top, x1, page_bottom)).extract_text() or ""
             )
 
-    def _extract_with_ocr(self, pdf_path: str) -> PDFContentData:
-        """Extract text using OCR (Tesseract)"""
-        try:
-            self.content_logger.info(f"Starting OCR extraction for {pdf_path}")
+        return "\n".join(part for part in parts if part)
 
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=300)
-            content = ""
-            page_count = len(images)
+    def _pages_needing_ocr(self, content_data: PDFContentData) -> List[int]:
+        """1-based pages the text layer could not serve"""
+        return [
+            page_num
+            for page_num, method in enumerate(content_data.page_methods, 1)
+            if not method
+        ]
 
-            for page_num, image in enumerate(images):
+    def _ocr_pages(self, pdf_path: str, page_numbers: List[int]) -> Dict[int, str]:
+        """
+        OCR the given pages
+
+        Pages are rasterized ``ocr_window`` at a time and each image is closed
+        as soon as it has been read, so memory use does not grow with the
+        number of pages.
+
+        Args:
+            pdf_path: PDF to rasterize
+            page_numbers: 1-based pages to OCR
+
+        Returns:
+            Dictionary mapping page number to OCR text
+        """
+        filename = os.path.basename(pdf_path)
+        page_texts = {}
+
+        for first_page, last_page in _contiguous_ranges(page_numbers, self.ocr_window):
+            # Convert only the pages in this window to images
+            with self.metrics.time(
+                "pdf.rasterize", f"{filename} pages {first_page}-{last_page}"
+            ):
+                images = convert_from_path(
+                    pdf_path,
+                    dpi=self.ocr_dpi,
+                    grayscale=self.ocr_grayscale,
+                    first_page=first_page,
+                    last_page=last_page,
+                )
+
+            for page_num, image in enumerate(images, first_page):
                 try:
                     # Perform OCR on the image
-                    page_text = pytesseract.image_to_string(image, lang="eng")
-                    if page_text.strip():
-                        content += f"\n--- Page {page_num + 1} (OCR) ---\n"
-                        content += page_text
+                    with self.metrics.time(
+                        "pdf.ocr_page", f"{filename} page {page_num}"
+                    ):
+                        page_texts[page_num] = pytesseract.image_to_string(
+                            image, lang="eng"
+                        )
 
-                    self.content_logger.debug(f"OCR completed for page {page_num + 1}")
+                    self.content_logger.debug("OCR completed for page %d", page_num)
                 except Exception as e:
-                    self.content_logger.warning(
-                        f"OCR failed for page {page_num + 1}: {e}"
-                    )
-
-            cleaned_content = self._clean_text(content)
-
-            return PDFContentData(
-                filename=os.path.basename(pdf_path),
-                content=cleaned_content,
-                method="OCR",
-                pages=page_count,
-                status="success" if cleaned_content else "no_text_found",
+                    self.content_logger.warning(f"OCR failed for page {page_num}: {e}")
+                finally:
+                    image.close()
+
+            del images
+
+        return page_texts
+
+    def _apply_ocr(
+        self, content_data: PDFContentData, ocr_texts: Dict[int, str]
+    ) -> None:
+        """Use OCR text for pages where OCR found any"""
+        for page_num, text in ocr_texts.items():
+            if text.strip():
+                content_data.page_texts[page_num - 1] = text
+                content_data.page_methods[page_num - 1] = "OCR"
+
+    def _finalize_content(self, content_data: PDFContentData) -> PDFContentData:
+        """Clean each page, join them once and summarize the methods used"""
+        with self.metrics.time("pdf.clean", content_data.filename):
+            content_data.page_texts = [
+                clean_page_text(text) for text in content_data.page_texts
+            ]
+            content_data.content = join_pages(
+                content_data.page_texts, content_data.page_methods
             )
+        content_data.method = "+".join(
+            method
+            for method in EXTRACTION_METHODS
+            if method in content_data.page_methods
+        )
+        content_data.status = "success" if content_data.content else "no_text_found"
 
-        except Exception as e:
-            self.content_logger.error(f"OCR extraction failed for {pdf_path}: {e}")
-            return PDFContentData(
-                filename=os.path.basename(pdf_path),
-                method="OCR",
-                status=f"error: {str(e)}",
-            )
+        summary = ", ".join(
+            f"{method or 'none'}: {count}"
+            for method, count in content_data.method_counts().items()
+        )
+        self.content_logger.info(
+            f"Extracted {len(content_data.content)} chars from "
+            f"{content_data.filename} ({summary})"
+        )
+        return content_data
 
     def _extract_pdf_content(self, pdf_path: str) -> PDFContentData:
         """
-        Extract content from PDF using multiple methods
-        Tries PyPDF2 first, then pdfplumber, then OCR as fallback
+        Extract content from PDF choosing a method per page
+        Tries PyPDF2 first, then pdfplumber, then OCR, each only on the pages
+        the previous method could not read
         """
         self.content_logger.info(
             f"Extracting content from: {os.path.basename(pdf_path)}"
         )
 
-        # Try PyPDF2 first (fastest)
-        result = self._extract_with_pypdf2(pdf_path)
-        if result.status == "success" and len(result.content) > MIN_CONTENT_LENGTH:
-            self.content_logger.info(
-                f"Successfully extracted with PyPDF2: {len(result.content)} chars"
-            )
-            return result
+        with ParsedPDF(pdf_path) as document:
+            content_data = self._extract_text_layer(document)
 
-        # Try pdfplumber (more accurate)
-        self.content_logger.info("PyPDF2 insufficient, trying pdfplumber...")
-        result = self._extract_with_pdfplumber(pdf_path)
-        if result.status == "success" and len(result.content) > MIN_CONTENT_LENGTH:
+        ocr_pages = self._pages_needing_ocr(content_data)
+        if ocr_pages:
             self.content_logger.info(
-                f"Successfully extracted with pdfplumber: {len(result.content)} chars"
+                f"OCR needed for {len(ocr_pages)} of {content_data.pages} pages"
             )
-            return result
+            try:
+                self._apply_ocr(content_data, self._ocr_pages(pdf_path, ocr_pages))
+            except Exception as e:
+                self.content_logger.error(f"OCR extraction failed for {pdf_path}: {e}")
 
-        # Fall back to OCR (for scanned PDFs)
-        self.content_logger.info("Text extraction insufficient, trying OCR...")
-        result = self._extract_with_ocr(pdf_path)
-        if result.status == "success":
-            self.content_logger.info(
-                f"Successfully extracted with OCR: {len(result.content)} chars"
-            )
-        else:
-            self.content_logger.warning("All extraction methods failed")
+        return self._finalize_content(content_data)
 
-        return result
+    def _extraction_settings(self) -> Dict[str, any]:
+        """Settings that change extracted text, part of the cache key"""
+        return {
+            "ocr_dpi": self.ocr_dpi,
+            "ocr_grayscale": self.ocr_grayscale,
+            "min_page_text_length": MIN_PAGE_TEXT_LENGTH,
+            "min_page_text_alnum_ratio": MIN_PAGE_TEXT_ALNUM_RATIO,
+            "tables": self.table_format if self.detect_tables else None,
+        }
+
+    def _load_cached(
+        self, pdf_files: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, PDFContentData]]:
+        """
+        Look up every PDF in the extraction cache
+
+        Returns:
+            Cache key per PDF path, and the cached content of the hits
+        """
+        keys, hits = {}, {}
+        settings = self._extraction_settings()
+
+        for pdf_path in pdf_files:
+            try:
+                key = self.cache.key(self.cache.file_hash(pdf_path), settings)
+            except OSError as e:
+                self.file_logger.warning(f"Could not hash {pdf_path}: {e}")
+                continue
+
+            keys[pdf_path] = key
+            entry = self.cache.get(key)
+            if entry:
+                hits[pdf_path] = PDFContentData.from_dict(entry)
+
+        return keys, hits
+
+    def _render_output(self, content_data: PDFContentData) -> str:
+        """Text written to a PDF's output file"""
+        # Get the URL mapping for this PDF
+        pdf_url = PDF_URL_MAPPING.get(content_data.filename, content_data.filename)
+
+        return f"URL: {pdf_url}\n" + "=" * 50 + "\n\n" + content_data.content
+
+    def _is_output_current(self, content_data: PDFContentData) -> bool:
+        """Check whether the output file already holds this content"""
+        output_filename = self._generate_safe_filename(content_data.filename)
+        output_path = os.path.join(self.output_folder, output_filename)
+
+        try:
+            with open(output_path, "r", encoding="utf-8") as f:
+                return f.read() == self._render_output(content_data)
+        except OSError:
+            return False
+
+    def _write_corpus_record(self, content_data: PDFContentData) -> None:
+        """Append a corpus record unless the corpus already holds this content"""
+        if not self.corpus_sink:
+            return
+
+        pdf_url = PDF_URL_MAPPING.get(content_data.filename, content_data.filename)
+        output_filename = self._generate_safe_filename(content_data.filename)
+        content_hash = self.corpus_sink.content_hash(content_data.content)
+        if not self.corpus_sink.has_current(pdf_url, content_hash, output_filename):
+            self.corpus_sink.write(
+                pdf_url,
+                content_data.title or Path(content_data.filename).stem,
+                content_data.content,
+                output_filename,
+                method=content_data.method,
+                source_type="pdf",
+                content_hash=content_hash,
+            )
 
     def _save_content_to_file(self, content_data: PDFContentData) -> Optional[str]:
         """Save extracted content to a text file"""
@@ -292,14 +564,9 @@ class PDFProcessor:
 
         try:
             with open(output_path, "w", encoding="utf-8") as f:
-                # Get the URL mapping for this PDF
-                pdf_url = PDF_URL_MAPPING.get(
-                    content_data.filename, content_data.filename
-                )
+                f.write(self._render_output(content_data))
 
-                f.write(f"URL: {pdf_url}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(content_data.content)
+            self._write_corpus_record(content_data)
 
             self.file_logger.info(f"Saved PDF content to: {output_filename}")
             return output_path
@@ -343,10 +610,114 @@ class PDFProcessor:
 
         return True
 
-    def process_pdfs(self) -> Dict[str, any]:
+    def _extract_serially(self, pdf_files: List[str]) -> Iterator[PDFContentData]:
+        """Extract PDFs one after another in this process"""
+        for i, pdf_path in enumerate(pdf_files, 1):
+            filename = os.path.basename(pdf_path)
+            self.content_logger.info(f"Processing [{i}/{len(pdf_files)}]: {filename}")
+
+            try:
+                with self.metrics.time("pdf.file", filename):
+                    content_data = self._extract_pdf_content(pdf_path)
+                yield content_data
+            except Exception as e:
+                self.content_logger.error(f"Error processing {filename}: {e}")
+                yield PDFContentData(filename=filename, status=f"error: {str(e)}")
+
+    def _extract_in_pool(
+        self, pdf_files: List[str], workers: int
+    ) -> Iterator[PDFContentData]:
+        """
+        Extract PDFs in a process pool
+
+        Text-layer extraction runs one task per PDF. The pages of each PDF
+        that need OCR are split into batches of ``OCR_PAGES_PER_TASK`` pages
+        that run as separate tasks on the same pool. Log records produced in
+        the workers are replayed here file by file, in input order, and their
+        stage timings are merged into this process's metrics. Workers are
+        spawned rather than forked, since forking while the logging
+        listener thread holds a lock can deadlock the child.
+        """
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pdf_worker,
+            initargs=(
+                self.pdf_folder,
+                self.output_folder,
+                self.ocr_dpi,
+                self.ocr_grayscale,
+                self.ocr_window,
+                self.detect_tables,
+                self.table_format,
+            ),
+        ) as pool:
+            text_jobs = [pool.submit(_extract_text_task, path) for path in pdf_files]
+
+            # Schedule OCR as soon as each text extraction comes back
+            ocr_jobs = []
+            for pdf_path, job in zip(pdf_files, text_jobs):
+                try:
+                    content_data, _, _ = job.result()
+                except Exception:
+                    ocr_jobs.append([])
+                    continue
+
+                ocr_pages = self._pages_needing_ocr(content_data)
+                ocr_jobs.append(
+                    [
+                        pool.submit(
+                            _ocr_pages_task,
+                            pdf_path,
+                            ocr_pages[start : start + OCR_PAGES_PER_TASK],
+                        )
+                        for start in range(0, len(ocr_pages), OCR_PAGES_PER_TASK)
+                    ]
+                )
+
+            for i, (pdf_path, text_job, page_jobs) in enumerate(
+                zip(pdf_files, text_jobs, ocr_jobs), 1
+            ):
+                filename = os.path.basename(pdf_path)
+                self.content_logger.info(
+                    f"Processing [{i}/{len(pdf_files)}]: {filename}"
+                )
+
+                try:
+                    content_data, records, samples = text_job.result()
+                    _replay_log_records(records)
+                    self.metrics.merge(samples)
+
+                    if page_jobs:
+                        self.content_logger.info(
+                            f"OCR needed for {len(self._pages_needing_ocr(content_data))} "
+                            f"of {content_data.pages} pages, in {len(page_jobs)} task(s)"
+                        )
+                    for page_job in page_jobs:
+                        try:
+                            ocr_texts, records, samples = page_job.result()
+                        except Exception as e:
+                            self.content_logger.error(
+                                f"OCR extraction failed for {pdf_path}: {e}"
+                            )
+                            continue
+                        _replay_log_records(records)
+                        self.metrics.merge(samples)
+                        self._apply_ocr(content_data, ocr_texts)
+
+                    yield self._finalize_content(content_data)
+                except Exception as e:
+                    self.content_logger.error(f"Error processing {filename}: {e}")
+                    yield PDFContentData(filename=filename, status=f"error: {str(e)}")
+
+    def process_pdfs(self, workers: int = 1) -> Dict[str, any]:
         """
         Process all PDFs in the PDF folder
 
+        Args:
+            workers: Number of worker processes; above 1, PDFs and the OCR
+                pages of large scanned PDFs are spread over a process pool
+
         Returns:
             Dictionary with processing results
         """
@@ -371,20 +742,54 @@ class PDFProcessor:
             "files_processed": len(pdf_files),
             "files_created": [],
             "errors": [],
+            "page_methods": {},
+            "cached": 0,
+            "unchanged": 0,
+            "tables": 0,
         }
 
-        # Process each PDF
-        for i, pdf_path in enumerate(pdf_files, 1):
-            filename = os.path.basename(pdf_path)
-            self.content_logger.info(f"Processing [{i}/{len(pdf_files)}]: {filename}")
+        # Unchanged PDFs are served from the cache without being opened
+        cache_keys, cached = self._load_cached(pdf_files) if self.cache else ({}, {})
+        to_extract = [path for path in pdf_files if path not in cached]
 
-            try:
-                # Extract content
-                content_data = self._extract_pdf_content(pdf_path)
+        if workers > 1:
+            extracted = self._extract_in_pool(to_extract, workers)
+        else:
+            extracted = self._extract_serially(to_extract)
+
+        # Validate and save each PDF's content
+        for pdf_path in pdf_files:
+            if pdf_path in cached:
+                content_data = cached[pdf_path]
+                results["cached"] += 1
+                self.content_logger.info(
+                    f"Using cached extraction for: {content_data.filename}"
+                )
+            else:
+                content_data = next(extracted)
+                if pdf_path in cache_keys and content_data.status == "success":
+                    self.cache.put(cache_keys[pdf_path], content_data.to_dict())
+
+            filename = content_data.filename
+            if content_data.page_methods:
+                results["page_methods"][filename] = content_data.method_counts()
+            results["tables"] += content_data.tables
 
-                # Validate and save content
-                if self._is_content_valid(content_data):
-                    output_path = self._save_content_to_file(content_data)
+            try:
+                if self._is_content_valid(content_data) and self._is_output_current(
+                    content_data
+                ):
+                    output_path = os.path.join(
+                        self.output_folder, self._generate_safe_filename(filename)
+                    )
+                    self._write_corpus_record(content_data)
+                    results["successful"] += 1
+                    results["unchanged"] += 1
+                    results["files_created"].append(output_path)
+                    self.content_logger.info(f"Unchanged, not rewritten: {filename}")
+                elif self._is_content_valid(content_data):
+                    with self.metrics.time("pdf.save", filename):
+                        output_path = self._save_content_to_file(content_data)
                     if output_path:
                         results["successful"] += 1
                         results["files_created"].append(output_path)
@@ -405,9 +810,108 @@ class PDFProcessor:
                 results["errors"].append(error_msg)
                 self.content_logger.error(error_msg)
 
+        extracted.close()
+        if self.cache:
+            self.cache.prune(cache_keys.values())
+
+        if self.corpus_sink:
+            self.corpus_sink.compact()
+
         # Log final results
         self.content_logger.info(
             f"PDF processing completed - Success: {results['successful']}, Failed: {results['failed']}"
         )
 
         return results
+
+
+class _LogRecordCollector(logging.Handler):
+    """Buffers log records in a worker process so the parent can replay them"""
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Render the message now so the record pickles cleanly
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+    def drain(self) -> List[logging.LogRecord]:
+        records, self.records = self.records, []
+        return records
+
+
+# Per-process state for pool workers
+_worker_processor: Optional[PDFProcessor] = None
+_worker_collector: Optional[_LogRecordCollector] = None
+
+
+def _init_pdf_worker(
+    pdf_folder: str,
+    output_folder: str,
+    ocr_dpi: int,
+    ocr_grayscale: bool,
+    ocr_window: int,
+    detect_tables: bool,
+    table_format: str,
+) -> None:
+    """Route the worker's logs into a buffer and create its processor"""
+    global _worker_processor, _worker_collector
+
+    _worker_collector = _LogRecordCollector()
+    route_logs_to(_worker_collector)
+    _worker_processor = PDFProcessor(
+        pdf_folder,
+        output_folder,
+        ocr_dpi=ocr_dpi,
+        ocr_grayscale=ocr_grayscale,
+        ocr_window=ocr_window,
+        use_cache=False,
+        detect_tables=detect_tables,
+        table_format=table_format,
+    )
+
+
+def _extract_text_task(
+    pdf_path: str,
+) -> Tuple[PDFContentData, List[logging.LogRecord], Dict[str, list]]:
+    """Worker task: text-layer extraction, leaving OCR to separate tasks"""
+    _worker_processor.content_logger.info(
+        f"Extracting content from: {os.path.basename(pdf_path)}"
+    )
+    with ParsedPDF(pdf_path) as document:
+        content_data = _worker_processor._extract_text_layer(document)
+    return content_data, _worker_collector.drain(), get_stage_metrics().drain()
+
+
+def _ocr_pages_task(
+    pdf_path: str, page_numbers: List[int]
+) -> Tuple[Dict[int, str], List[logging.LogRecord], Dict[str, list]]:
+    """Worker task: OCR a batch of pages"""
+    page_texts = _worker_processor._ocr_pages(pdf_path, page_numbers)
+    return page_texts, _worker_collector.drain(), get_stage_metrics().drain()
+
+
+def _replay_log_records(records: List[logging.LogRecord]) -> None:
+    for record in records:
+        logging.getLogger(record.name).handle(record)
+
+
+def _contiguous_ranges(
+    page_numbers: List[int], max_length: int
+) -> List[Tuple[int, int]]:
+    """Group sorted page numbers into inclusive (first, last) runs, max_length long"""
+    ranges = []
+    for page_num in page_numbers:
+        if (
+            ranges
+            and ranges[-1][1] == page_num - 1
+            and page_num - ranges[-1][0] < max_length
+        ):
+            ranges[-1] = (ranges[-1][0], page_num)
+        else:
+            ranges.append((page_num, page_num))
+    return ranges
@@ -0,0 +1,122 @@
+"""
+Page text cleaning and assembly for PDF extraction
+"""
+
+import re
+from typing import List, Optional, Sequence
+
+# Runs of 5+ of the same character (leader dots, underscores, ...). Same
+# matches as r"(.)\1{4,}", but the unrolled form is much cheaper for the
+# regex engine to try at every position.
+_REPEATED_CHARS = re.compile(r"(.)\1\1\1\1+")
+
+
+def clean_page_text(text: str) -> str:
+    """
+    Clean and normalize one page of text
+
+    Strips every line, drops blank lines and collapses runs of repeated
+    characters to two. Runs never span lines, so cleaning page by page gives
+    the same result as cleaning the joined document.
+    """
+    if not text:
+        return ""
+
+    lines = [line.strip() for line in text.splitlines()]
+    cleaned = "\n".join(line for line in lines if line)
+
+    return _REPEATED_CHARS.sub(r"\1\1", cleaned)
+
+
+def page_label(page_num: int, method: str) -> str:
+    """Marker line written before a page's text"""
+    if method == "OCR":
+        return f"--- Page {page_num} (OCR) ---"
+    return f"--- Page {page_num} ---"
+
+
+def join_pages(page_texts: Sequence[str], page_methods: Sequence[str]) -> str:
+    """
+    Join cleaned page texts into a document in a single pass
+
+    Args:
+        page_texts: Cleaned text of every page, "" for pages without text
+        page_methods: Extraction method of every page
+
+    Returns:
+        Document text with a marker line before each non-empty page
+    """
+    parts: List[str] = []
+    for page_num, (text, method) in enumerate(zip(page_texts, page_methods), 1):
+        if text:
+            parts.append(page_label(page_num, method))
+            parts.append(text)
+
+    return "\n".join(parts)
+
+
+def _table_rows(rows: Sequence[Sequence[Optional[str]]]) -> List[List[str]]:
+    """Normalize cells, drop empty rows and columns, pad rows to one width"""
+    cleaned = [
+        [" ".join(str(cell).split()) if cell else "" for cell in row] for row in rows
+    ]
+    cleaned = [row for row in cleaned if any(row)]
+    width = max((len(row) for row in cleaned), default=0)
+    cleaned = [row + [""] * (width - len(row)) for row in cleaned]
+
+    used = [col for col in range(width) if any(row[col] for row in cleaned)]
+    return [[row[col] for col in used] for row in cleaned]
+
+
+def table_to_markdown(rows: Sequence[Sequence[Optional[str]]]) -> str:
+    """
+    Render extracted table rows as a Markdown table
+
+    Args:
+        rows: Table rows as returned by pdfplumber, first row used as header
+
+    Returns:
+        Markdown table, one line per row, or "" for an empty table
+    """
+    rows = [[cell.replace("|", "\\|") for cell in row] for row in _table_rows(rows)]
+    if not rows:
+        return ""
+
+    lines = ["| " + " | ".join(rows[0]) + " |"]
+    lines.append("|" + " --- |" * len(rows[0]))
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
+
+
+def table_to_row_text(rows: Sequence[Sequence[Optional[str]]]) -> str:
+    """
+    Render extracted table rows as one "header: value; ..." line per row
+
+    Args:
+        rows: Table rows as returned by pdfplumber, first row used as header
+
+    Returns:
+        Row-wise text, or "" for an empty table
+    """
+    rows = _table_rows(rows)
+    if not rows:
+        return ""
+    if len(rows) == 1:
+        return "; ".join(cell for cell in rows[0] if cell)
+
+    header = rows[0]
+    return "\n".join(
+        "; ".join(
+            f"{name}: {cell}" if name else cell
+            for name, cell in zip(header, row)
+            if cell
+        )
+        for row in rows[1:]
+    )
+
+
+def render_table(rows: Sequence[Sequence[Optional[str]]], table_format: str) -> str:
+    """Render table rows as "markdown" or "rows" text"""
+    if table_format == "rows":
+        return table_to_row_text(rows)
+    return table_to_markdown(rows)
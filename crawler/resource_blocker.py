@@ -0,0 +1,142 @@
+"""
+Request interception that skips resources irrelevant to text extraction
+"""
+
+from collections import defaultdict
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from constants import (
+    BLOCKING_PROFILES,
+    DEFAULT_BLOCKING_PROFILE,
+    BLOCKING_PROFILE_OVERRIDES,
+    BLOCKED_RESOURCE_SIZE_ESTIMATES,
+    DEFAULT_BLOCKED_RESOURCE_SIZE,
+)
+from logger_utils import get_crawler_logger
+
+
+def _site(host: str) -> str:
+    """Reduce a hostname to its last two labels (www.aven.com -> aven.com)"""
+    labels = host.lower().split(".")
+    return ".".join(labels[-2:])
+
+
+def _host_matches(host: str, patterns) -> bool:
+    """Check whether a host equals or is a subdomain of any pattern"""
+    host = host.lower()
+    return any(host == p or host.endswith("." + p) for p in patterns)
+
+
+class ResourceBlocker:
+    """
+    Aborts requests for resource types and hosts that a profile blocks
+
+    One blocker is attached per crawler page. The profile is chosen per URL
+    (``BLOCKING_PROFILE_OVERRIDES`` first, then the default) each time a new
+    page load starts, and counters are reset so they describe that load only.
+    """
+
+    def __init__(
+        self,
+        default_profile: str = DEFAULT_BLOCKING_PROFILE,
+        overrides: Optional[Dict[str, str]] = None,
+    ):
+        if default_profile not in BLOCKING_PROFILES:
+            raise ValueError(
+                f"Unknown blocking profile '{default_profile}'. "
+                f"Available profiles: {list(BLOCKING_PROFILES.keys())}"
+            )
+        self.default_profile = default_profile
+        self.overrides = (
+            BLOCKING_PROFILE_OVERRIDES if overrides is None else overrides
+        )
+        self.logger = get_crawler_logger()
+
+        self.profile_name = default_profile
+        self.profile = BLOCKING_PROFILES[default_profile]
+        self.page_site = ""
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+        self.bytes_loaded = 0
+        self.estimated_bytes_saved = 0
+        self.blocked_by_type: Dict[str, int] = defaultdict(int)
+
+    def profile_for(self, url: str) -> str:
+        """Pick the blocking profile for a URL, longest override prefix wins"""
+        matches = [prefix for prefix in self.overrides if url.startswith(prefix)]
+        if matches:
+            return self.overrides[max(matches, key=len)]
+        return self.default_profile
+
+    async def attach(self, page) -> None:
+        """Install the route handler and response listener on a page"""
+        await page.route("**/*", self._handle_route)
+        page.on("response", self._on_response)
+
+    def start_page(self, url: str) -> None:
+        """Select the profile for the URL about to load and reset counters"""
+        self.profile_name = self.profile_for(url)
+        self.profile = BLOCKING_PROFILES[self.profile_name]
+        self.page_site = _site(urlparse(url).hostname or "")
+        self._reset_counters()
+
+    def _should_block(self, request) -> bool:
+        resource_type = request.resource_type
+
+        # Never block the top-level document being crawled
+        try:
+            if resource_type == "document" and request.frame.parent_frame is None:
+                return False
+        except Exception:
+            pass
+
+        host = urlparse(request.url).hostname or ""
+        if not host:
+            return False
+
+        if _host_matches(host, self.profile["allowed_hosts"]):
+            return False
+        if _host_matches(host, self.profile["blocked_hosts"]):
+            return True
+        if resource_type in self.profile["resource_types"]:
+            return True
+        if self.profile["block_third_party"] and _site(host) != self.page_site:
+            return True
+
+        return False
+
+    async def _handle_route(self, route) -> None:
+        request = route.request
+
+        if self._should_block(request):
+            resource_type = request.resource_type
+            self.requests_blocked += 1
+            self.blocked_by_type[resource_type] += 1
+            self.estimated_bytes_saved += BLOCKED_RESOURCE_SIZE_ESTIMATES.get(
+                resource_type, DEFAULT_BLOCKED_RESOURCE_SIZE
+            )
+            await route.abort("blockedbyclient")
+        else:
+            self.requests_allowed += 1
+            await route.continue_()
+
+    def _on_response(self, response) -> None:
+        try:
+            self.bytes_loaded += int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            pass
+
+    def stats(self) -> Dict[str, any]:
+        """Counters for the current page load"""
+        return {
+            "blocking_profile": self.profile_name,
+            "requests_allowed": self.requests_allowed,
+            "requests_blocked": self.requests_blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "bytes_loaded": self.bytes_loaded,
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+        }
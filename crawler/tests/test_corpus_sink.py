@@ -0,0 +1,61 @@
+"""
+Tests for the JSON Lines corpus sink and its compaction
+
+Run from the crawler folder:
+    python -m pytest tests
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus_sink import JsonlCorpusSink  # noqa: E402
+
+
+def read_corpus(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def write(sink, url, content):
+    sink.write(url, f"Title of {url}", content, f"{url[-1]}.txt", method="main")
+
+
+def test_compaction_keeps_the_latest_record_of_live_documents(tmp_path):
+    path = str(tmp_path / "corpus.jsonl")
+    sink = JsonlCorpusSink(path)
+    write(sink, "https://example.com/a", "old")
+    write(sink, "https://example.com/b", "café")
+    write(sink, "https://example.com/c", "gone")
+    write(sink, "https://example.com/a", "new")
+    sink.remove("https://example.com/c", "c.txt")
+
+    assert sink.compact()
+
+    records = read_corpus(path)
+    assert [(r["url"], r["content"]) for r in records] == [
+        ("https://example.com/b", "café"),
+        ("https://example.com/a", "new"),
+    ]
+    assert not os.path.exists(path + ".tmp")
+
+    # The sink keeps working on the compacted file
+    write(sink, "https://example.com/b", "café")
+    assert sink.has_current("https://example.com/a", records[1]["hash"], "a.txt")
+    assert len(read_corpus(path)) == 3
+
+
+def test_compaction_waits_for_the_threshold(tmp_path):
+    path = str(tmp_path / "corpus.jsonl")
+    sink = JsonlCorpusSink(path)
+    for name in "abc":
+        write(sink, f"https://example.com/{name}", "first")
+    write(sink, "https://example.com/a", "second")
+
+    assert not sink.compact()
+    assert len(read_corpus(path)) == 4
+
+    assert JsonlCorpusSink(path, compact_threshold=0).compact()
+    assert len(read_corpus(path)) == 3
@@ -0,0 +1,252 @@
+"""
+Tests for the crawler's incremental saving, duplicate handling and resume
+
+Run from the crawler folder:
+    python -m pytest tests
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("playwright.async_api")
+
+import crawler as crawler_module  # noqa: E402
+from constants import DEFAULT_FRONTIER_FILENAME  # noqa: E402
+from crawler import ContentData, Crawler  # noqa: E402
+from dedup import DuplicateDetector  # noqa: E402
+
+FOOTER = "\n".join(
+    [
+        "Home",
+        "About",
+        "Careers",
+        "Example Inc, 1 Main Street, Springfield. All rights reserved.",
+    ]
+)
+
+
+def page(url, body):
+    return ContentData(
+        url, title=f"Title of {url}", content=f"{body}\n{FOOTER}", status="success"
+    )
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+    async def dispose(self):
+        pass
+
+
+class FakeRequest:
+    """Request client answering 304 when the page's ETag is still current"""
+
+    def __init__(self, etags):
+        self.etags = etags
+
+    async def get(self, url, headers=None, timeout=None):
+        current = (headers or {}).get("If-None-Match") == self.etags.get(url)
+        return FakeResponse(304 if current else 200)
+
+
+class FakeBrowserPage:
+    def on(self, event, handler):
+        pass
+
+    def is_closed(self):
+        return False
+
+    async def evaluate(self, script, arg=None):
+        return 0
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, etags):
+        self.request = FakeRequest(etags)
+
+    async def new_page(self):
+        return FakeBrowserPage()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, etags):
+        self.etags = etags
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **kwargs):
+        return FakeContext(self.etags)
+
+    async def close(self):
+        pass
+
+
+class FakePlaywright:
+    """Just enough of Playwright for the crawler's browser session"""
+
+    def __init__(self, etags):
+        self.chromium = self
+        self.etags = etags
+
+    async def launch(self, **kwargs):
+        return FakeBrowser(self.etags)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+@pytest.fixture
+def site(monkeypatch):
+    """
+    Serve pages through a fake browser
+
+    Pages are rendered from ``site.bodies`` and carry ``site.etags``, and
+    every URL rendered is appended to ``site.rendered``.
+    """
+
+    class Site:
+        bodies = {}
+        etags = {}
+        rendered = []
+
+    async def render(self, browser_page, url, collect_links=False):
+        Site.rendered.append(url)
+        content_data = page(url, Site.bodies[url])
+        content_data.etag = Site.etags.get(url, "")
+        return content_data
+
+    monkeypatch.setattr(
+        crawler_module, "async_playwright", lambda: FakePlaywright(Site.etags)
+    )
+    monkeypatch.setattr(Crawler, "_extract_content_from_page", render)
+    return Site
+
+
+def read_corpus(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_page_left_empty_by_stripping_is_removed(tmp_path):
+    crawler = Crawler(
+        output_folder=str(tmp_path), corpus_path=str(tmp_path / "c.jsonl")
+    )
+    crawler.duplicate_detector = DuplicateDetector(min_body_chars=0)
+    urls = [f"https://example.com/{name}" for name in ("a", "b", "c", "d")]
+    bodies = {url: f"Only {url} says this, at some length." for url in urls}
+
+    # First crawl: every page has a body of its own
+    results = crawler._new_results()
+    crawler._record_deduplicated(results, [page(url, bodies[url]) for url in urls])
+    filename = crawler.manifest.get(urls[0])["filename"]
+    assert os.path.exists(tmp_path / filename)
+
+    # Second crawl: the first page lost its body, only the footer is left
+    bodies[urls[0]] = ""
+    results = crawler._new_results()
+    crawler._record_deduplicated(results, [page(url, bodies[url]) for url in urls])
+    crawler.corpus_sink.close()
+
+    assert results["boilerplate_only"] == [urls[0]]
+    assert crawler.manifest.get(urls[0]) is None
+    assert not os.path.exists(tmp_path / filename)
+    tombstone = read_corpus(tmp_path / "c.jsonl")[-1]
+    assert (tombstone["url"], tombstone["status"]) == (urls[0], "removed")
+
+
+def test_dedup_crawl_skips_rendering_unchanged_pages(tmp_path, site):
+    urls = [f"https://example.com/{name}" for name in ("a", "b", "c", "d")]
+    site.bodies.update({url: f"Only {url} says this, at some length." for url in urls})
+    site.etags.update({url: '"v1"' for url in urls})
+
+    def crawl():
+        crawler = Crawler(output_folder=str(tmp_path), blocking_profile=None)
+        crawler.duplicate_detector = DuplicateDetector(min_body_chars=0)
+        return crawler, asyncio.run(crawler.crawl_urls(urls))
+
+    crawl()
+    assert sorted(site.rendered) == urls
+
+    # Nothing changed: every page answers 304 and none is rendered
+    site.rendered.clear()
+    _, results = crawl()
+    assert site.rendered == []
+    assert results["unchanged"] == len(urls)
+
+    # One page changed: its footer is still stripped, although the other
+    # pages' saved text no longer has it
+    site.rendered.clear()
+    site.bodies[urls[0]] = f"Only {urls[0]} says this, and now a little more."
+    site.etags[urls[0]] = '"v2"'
+    crawler, results = crawl()
+    assert site.rendered == [urls[0]]
+    assert results["updated"] == 1
+    with open(tmp_path / crawler.manifest.get(urls[0])["filename"]) as f:
+        saved = f.read()
+    assert "a little more" in saved
+    assert "All rights reserved" not in saved
+
+
+def test_resumed_crawl_skips_finished_and_spooled_urls(tmp_path, site):
+    urls = [f"https://example.com/{name}" for name in ("a", "b", "c")]
+    site.bodies.update({url: f"Only {url} says this." for url in urls})
+    crawler = Crawler(output_folder=str(tmp_path), blocking_profile=None)
+
+    # The interrupted run saved the first page and spooled the second
+    crawler.journal.open()
+    crawler.journal.record(urls[0], "success", str(tmp_path / "a.txt"))
+    crawler.journal.record(
+        urls[1], "crawled", page=page(urls[1], site.bodies[urls[1]]).to_journal()
+    )
+    crawler.journal.close()
+
+    results = asyncio.run(crawler.crawl_urls(urls, resume=True))
+
+    assert site.rendered == [urls[2]]
+    assert results["resumed"] == 2
+    assert results["successful"] == 3
+    assert not os.path.exists(crawler.journal.path)
+
+
+def test_site_crawl_resumes_when_the_frontier_is_behind_the_journal(
+    tmp_path, site
+):
+    seed = "https://example.com/"
+    urls = [f"{seed}{name}" for name in ("a", "b", "c")]
+    site.bodies.update({url: f"Only {url} says this." for url in urls})
+    crawler = Crawler(
+        output_folder=str(tmp_path), blocking_profile=None, deduplicate=False
+    )
+
+    # The frontier was last saved before any of the pending pages finished,
+    # while the journal already records the first as done
+    with open(tmp_path / DEFAULT_FRONTIER_FILENAME, "w") as f:
+        json.dump({"visited": [seed], "pending": [[url, 1] for url in urls]}, f)
+    crawler.journal.open()
+    crawler.journal.record(urls[0], "success", str(tmp_path / "a.txt"))
+    crawler.journal.close()
+
+    results = asyncio.run(
+        crawler.crawl_site([seed], respect_robots=False, resume=True)
+    )
+
+    assert sorted(site.rendered) == urls[1:]
+    assert results["resumed"] == 1
+    assert results["successful"] == 3
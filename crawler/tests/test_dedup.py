@@ -0,0 +1,131 @@
+"""
+Tests for boilerplate stripping and near-duplicate detection
+
+The fixtures are pages from the knowledge base as the crawler saved them
+before boilerplate stripping, each ending in the site's navigation and
+disclosure footer.
+
+Run from the crawler folder:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedup import DuplicateDetector, fingerprints  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FOOTER_LINE = "548 Market St #99555"
+DISCLOSURE_LINE = "You are not required to sign up for AutoPay."
+
+
+def load_pages():
+    """Page text keyed by URL, from the saved page fixtures"""
+    pages = {}
+    folder = os.path.join(FIXTURES, "pages")
+    for filename in sorted(os.listdir(folder)):
+        with open(os.path.join(folder, filename), "r", encoding="utf-8") as f:
+            header, _, content = f.read().partition("=" * 50 + "\n\n")
+        pages[header.splitlines()[0][len("URL: ") :]] = content
+    return dict(sorted(pages.items()))
+
+
+def test_footer_is_stripped_from_content_pages():
+    pages = load_pages()
+
+    stripped = DuplicateDetector().strip_boilerplate(pages)
+
+    for url in ("https://www.aven.com/about", "https://www.aven.com/careers"):
+        assert FOOTER_LINE in pages[url]
+        assert FOOTER_LINE not in stripped[url].text
+        assert DISCLOSURE_LINE not in stripped[url].text
+    assert "Our mission is" in stripped["https://www.aven.com/about"].text
+
+
+def test_only_the_footer_is_removed():
+    pages = load_pages()
+    url = "https://www.aven.com/about"
+
+    stripped = DuplicateDetector().strip_boilerplate(pages)[url].text
+
+    footer_start = pages[url].index("\nAVEN\nCard\n")
+    assert pages[url][:footer_start].strip() in stripped
+
+
+def test_pages_that_are_mostly_footer_are_kept_whole():
+    pages = load_pages()
+
+    stripped = DuplicateDetector().strip_boilerplate(pages)
+
+    for url in ("https://www.aven.com/disclosures", "https://www.aven.com/app"):
+        assert stripped[url].text == pages[url]
+        assert DISCLOSURE_LINE in stripped[url].text
+        assert FOOTER_LINE not in stripped[url].body
+
+
+def test_stripping_never_leaves_less_than_the_minimum_body():
+    pages = load_pages()
+    detector = DuplicateDetector()
+
+    for url, page in detector.strip_boilerplate(pages).items():
+        assert page.text == pages[url] or (
+            len(page.text.strip()) >= detector.min_body_chars
+        )
+
+
+def test_lone_shared_lines_inside_the_body_are_kept():
+    footer = "\n".join(["Home", "About", "Careers", "© 2025 Example"])
+    pages = {
+        f"https://example.com/{i}": (
+            f"Page {i} introduction\nApply now\nDetails only page {i} has\n"
+            f"{footer}"
+        )
+        for i in range(4)
+    }
+
+    stripped = DuplicateDetector(min_body_chars=0).strip_boilerplate(pages)
+
+    for page in stripped.values():
+        assert "Apply now" in page.text
+        assert "© 2025 Example" not in page.text
+
+
+def test_pages_kept_whole_are_not_duplicates_of_each_other():
+    pages = load_pages()
+    detector = DuplicateDetector()
+
+    stripped = detector.strip_boilerplate(pages)
+
+    assert detector.find_duplicates({u: p.body for u, p in stripped.items()}) == {}
+
+
+def test_near_duplicate_page_is_detected():
+    pages = load_pages()
+    original = "https://www.aven.com/about"
+    pages["https://www.aven.com/about-us"] = pages[original].replace(
+        "Loved by thousands", "Loved by many"
+    )
+    detector = DuplicateDetector()
+
+    stripped = detector.strip_boilerplate(pages)
+    duplicates = detector.find_duplicates({u: p.body for u, p in stripped.items()})
+
+    assert duplicates == {"https://www.aven.com/about-us": original}
+
+
+def test_removed_lines_of_saved_pages_still_count_as_shared():
+    pages = load_pages()
+    detector = DuplicateDetector()
+    stripped = detector.strip_boilerplate(pages)
+    shared = detector.find_boilerplate(pages)
+
+    # Pages saved stripped by an earlier crawl, with what was removed
+    saved = {url: page.text for url, page in stripped.items()}
+    removed = {
+        url: fingerprints(pages[url]) - fingerprints(saved[url]) for url in pages
+    }
+
+    assert detector.find_boilerplate(saved, removed) == shared
+    assert detector.find_boilerplate(saved) != shared
@@ -0,0 +1,106 @@
+"""
+Tests for URL normalization and the link-discovery crawl frontier
+
+Run from the crawler folder:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontier import CrawlFrontier, normalize_url  # noqa: E402
+
+SEED = "https://example.com/"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("HTTPS://Example.COM:443/a", "https://example.com/a"),
+        ("http://example.com:8080", "http://example.com:8080/"),
+        ("https://example.com/a#section", "https://example.com/a"),
+        (
+            "https://example.com/a?utm_source=x&b=2&a=1&gclid=y",
+            "https://example.com/a?a=1&b=2",
+        ),
+        ("https://example.com/a/b/../c", "https://example.com/a/c"),
+        ("https://example.com/a/./b/", "https://example.com/a/b/"),
+        ("https://example.com/a/b/..", "https://example.com/a/"),
+        ("https://example.com/../../a", "https://example.com/a"),
+        ("https://example.com/a//b/", "https://example.com/a//b/"),
+        ("mailto:team@example.com", None),
+        ("javascript:void(0)", None),
+        ("", None),
+    ],
+)
+def test_normalize_url(url, expected):
+    assert normalize_url(url) == expected
+
+
+def test_relative_links_resolve_against_the_page():
+    base = "https://example.com/docs/guide/intro"
+
+    assert normalize_url("../faq/", base) == "https://example.com/docs/faq/"
+    assert normalize_url("./setup#top", base) == "https://example.com/docs/guide/setup"
+    assert normalize_url("/about", base) == "https://example.com/about"
+
+
+def test_equivalent_links_are_scheduled_once():
+    frontier = CrawlFrontier([SEED])
+    frontier.seed_items()
+
+    assert frontier.add("/a/b/../c?utm_medium=mail", 1, base=SEED)
+    assert frontier.add("https://EXAMPLE.com/a/c#top", 1) is None
+    assert frontier.add("/a/./c", 1, base=SEED) is None
+    assert list(frontier.pending) == [SEED, "https://example.com/a/c"]
+
+
+def test_links_off_host_or_to_files_are_not_scheduled():
+    frontier = CrawlFrontier([SEED])
+
+    assert frontier.add("https://other.com/page", 1) is None
+    assert frontier.add("/logo.png", 1, base=SEED) is None
+    assert frontier.add("/docs/terms.pdf", 1, base=SEED) is None
+    assert frontier.pdf_links == {"https://example.com/docs/terms.pdf"}
+    assert frontier.pending == {}
+
+
+def test_links_beyond_the_max_depth_are_dropped():
+    frontier = CrawlFrontier([SEED], max_depth=2)
+
+    assert frontier.add("/two", 2, base=SEED)
+    assert frontier.add("/three", 3, base=SEED) is None
+    assert not frontier.truncated
+
+
+def test_page_budget_counts_visited_and_pending_urls():
+    frontier = CrawlFrontier([SEED], max_pages=3)
+    frontier.seed_items()
+    frontier.mark_visited(SEED)
+
+    assert frontier.add("/a", 1, base=SEED)
+    assert frontier.add("/b", 1, base=SEED)
+    assert frontier.add("/c", 1, base=SEED) is None
+    assert frontier.truncated
+    assert frontier.scheduled_count == 3
+
+
+def test_state_round_trips_for_resume(tmp_path):
+    path = str(tmp_path / "frontier.json")
+    frontier = CrawlFrontier([SEED], state_path=path)
+    frontier.seed_items()
+    frontier.mark_visited(SEED)
+    frontier.add("/a", 1, base=SEED)
+    frontier.add("/b.pdf", 1, base=SEED)
+    frontier.save_state()
+
+    resumed = CrawlFrontier([SEED], state_path=path)
+
+    assert resumed.load_state()
+    assert resumed.visited == {SEED}
+    assert resumed.seed_items() == [("https://example.com/a", 1)]
+    assert resumed.pdf_links == {"https://example.com/b.pdf"}
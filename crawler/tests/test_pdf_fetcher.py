@@ -0,0 +1,129 @@
+"""
+Tests for conditional PDF downloads against a local HTTP server
+
+Run from the crawler folder:
+    python -m pytest tests
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("requests")
+
+from constants import DEFAULT_FETCH_STATE_FILENAME  # noqa: E402
+from pdf_fetcher import PDFFetcher  # noqa: E402
+
+PDF = b"%PDF-1.7\n" + b"0" * 200_000 + b"\n%%EOF\n"
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves the paths in ``server.files`` as (etag, body) pairs"""
+
+    def do_GET(self):
+        etag, body = self.server.files[self.path]
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.server.statuses.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.server.statuses.append(200)
+        self.send_response(200)
+        if etag:
+            self.send_header("ETag", etag)
+        if self.path == "/truncated.pdf":
+            # Promise more than is sent, then hang up
+            self.send_header("Content-Length", str(len(body) * 2))
+            self.end_headers()
+            self.wfile.write(body)
+            self.close_connection = True
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.files = {}
+    httpd.statuses = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def fetch(folder, server, *paths):
+    fetcher = PDFFetcher(
+        str(folder), url_mapping={p.strip("/"): server.url + p for p in paths}
+    )
+    return fetcher.fetch_all()
+
+
+def test_unchanged_pdf_is_not_downloaded_again(tmp_path, server):
+    server.files["/doc.pdf"] = ('"v1"', PDF)
+
+    assert fetch(tmp_path, server, "/doc.pdf")["downloaded"] == ["doc.pdf"]
+    mtime = os.path.getmtime(tmp_path / "doc.pdf")
+
+    results = fetch(tmp_path, server, "/doc.pdf")
+
+    assert server.statuses == [200, 304]
+    assert results["unchanged"] == ["doc.pdf"]
+    assert os.path.getmtime(tmp_path / "doc.pdf") == mtime
+    with open(tmp_path / "doc.pdf", "rb") as f:
+        assert f.read() == PDF
+
+
+def test_same_bytes_without_validators_keep_the_file(tmp_path, server):
+    server.files["/doc.pdf"] = ("", PDF)
+    fetch(tmp_path, server, "/doc.pdf")
+    mtime = os.path.getmtime(tmp_path / "doc.pdf")
+
+    results = fetch(tmp_path, server, "/doc.pdf")
+
+    assert server.statuses == [200, 200]
+    assert results["unchanged"] == ["doc.pdf"]
+    assert os.path.getmtime(tmp_path / "doc.pdf") == mtime
+    assert not os.path.exists(tmp_path / "doc.pdf.part")
+
+
+def test_html_served_as_pdf_is_rejected(tmp_path, server):
+    server.files["/login.pdf"] = ("", b"<!doctype html><title>Sign in</title>")
+
+    results = fetch(tmp_path, server, "/login.pdf")
+
+    assert results["failed"] == 1
+    assert "not a PDF" in results["errors"][0]
+    assert os.listdir(tmp_path) == [DEFAULT_FETCH_STATE_FILENAME]
+
+
+def test_pdf_header_after_leading_bytes_is_accepted(tmp_path, server):
+    server.files["/bom.pdf"] = ("", b"\xef\xbb\xbf\r\n" + PDF)
+
+    assert fetch(tmp_path, server, "/bom.pdf")["downloaded"] == ["bom.pdf"]
+
+
+def test_failed_download_leaves_the_previous_pdf(tmp_path, server):
+    server.files["/truncated.pdf"] = ("", PDF)
+    with open(tmp_path / "truncated.pdf", "wb") as f:
+        f.write(b"%PDF-1.4 previous")
+
+    results = fetch(tmp_path, server, "/truncated.pdf")
+
+    assert results["failed"] == 1
+    assert not os.path.exists(tmp_path / "truncated.pdf.part")
+    with open(tmp_path / "truncated.pdf", "rb") as f:
+        assert f.read() == b"%PDF-1.4 previous"
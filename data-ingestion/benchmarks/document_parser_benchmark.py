@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for knowledge base header parsing
+
+Compares the previous per-field searches and substitutions of
+``KnowledgeBaseProcessor`` with the single-pass ``parse_document`` over the
+files of the knowledge base, repeated to make a larger corpus, and checks
+both give the same source info, title and body for every file.
+
+Usage:
+    python benchmarks/document_parser_benchmark.py [--scale 50] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from document_parser import parse_document  # noqa: E402
+
+DEFAULT_FOLDER = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "knowledge-base"
+)
+
+
+def legacy_extract_source_info(filename: str, content: str):
+    """KnowledgeBaseProcessor.extract_source_info before the single-pass parser"""
+    if filename.startswith("PDF_"):
+        url_match = re.search(r"URL: (https?://[^\n]+)", content)
+        if url_match:
+            return "pdf", url_match.group(1)
+        else:
+            pdf_match = re.match(r"PDF_(.+?)_[a-f0-9]+\.txt", filename)
+            if pdf_match:
+                pdf_name = pdf_match.group(1)
+                return "pdf", f"{pdf_name}.pdf"
+            else:
+                return "pdf", filename
+    else:
+        url_match = re.search(r"URL: (https?://[^\n]+)", content)
+        if url_match:
+            return "web", url_match.group(1)
+        else:
+            return "web", filename
+
+
+def legacy_extract_title(content: str) -> str:
+    """KnowledgeBaseProcessor.extract_title before the single-pass parser"""
+    title_match = re.search(r"Title: ([^\n]+)", content)
+    if title_match:
+        return title_match.group(1)
+
+    lines = content.split("\n")
+    for line in lines:
+        line = line.strip()
+        if (
+            line
+            and not line.startswith("URL:")
+            and not line.startswith("Title:")
+            and line != "=" * 50
+        ):
+            return line[:100] + "..." if len(line) > 100 else line
+
+    return "Untitled Document"
+
+
+def legacy_clean_content(content: str) -> str:
+    """KnowledgeBaseProcessor.clean_content before the single-pass parser"""
+    content = re.sub(r"URL: https?://[^\n]+\n", "", content)
+    content = re.sub(r"Title: [^\n]+\n", "", content)
+    content = re.sub(r"Source PDF: [^\n]+\n", "", content)
+    content = re.sub(r"=+\n", "", content)
+    content = re.sub(r"--- Page \d+ ---\n", "", content)
+    content = re.sub(r"\n\s*\n", "\n\n", content)
+    content = content.strip()
+
+    return content
+
+
+def legacy_parse(filename: str, content: str):
+    source_type, source_reference = legacy_extract_source_info(filename, content)
+    return (
+        source_type,
+        source_reference,
+        legacy_extract_title(content),
+        legacy_clean_content(content),
+    )
+
+
+def single_pass_parse(filename: str, content: str):
+    return tuple(parse_document(filename, content))
+
+
+def load_files(folder: str, scale: int):
+    """Read every .txt file in the folder and repeat the list ``scale`` times"""
+    files = []
+    for filename in sorted(os.listdir(folder)):
+        if filename.endswith(".txt"):
+            with open(os.path.join(folder, filename), "r", encoding="utf-8") as f:
+                files.append((filename, f.read()))
+    return files * scale
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--folder", default=DEFAULT_FOLDER)
+    parser.add_argument("--scale", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    files = load_files(args.folder, args.scale)
+    size = sum(len(content) for _, content in files)
+
+    for filename, content in files[: len(files) // args.scale]:
+        if legacy_parse(filename, content) != single_pass_parse(filename, content):
+            sys.exit(f"Outputs differ between legacy and single-pass for {filename}")
+
+    print(f"{len(files)} files, {size / 1024 / 1024:.1f} MB of text")
+    timings = {}
+    for name, func in (("legacy", legacy_parse), ("single-pass", single_pass_parse)):
+        timings[name] = min(
+            timeit.repeat(
+                lambda: [func(filename, content) for filename, content in files],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{name:>11}: {timings[name] * 1000:8.1f} ms, "
+            f"{len(files) / timings[name]:8.0f} files/s"
+        )
+
+    print(f"    speedup: {timings['legacy'] / timings['single-pass']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Document Chunker
+Reads knowledge base files and corpus records and splits them into Document chunks
+
+Kept apart from pinecone_client so chunking worker processes do not import
+torch, sentence-transformers or the Pinecone SDK.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from document_parser import parse_document
+from ingestion_manifest import content_hash
+
+
+class CorpusRecord(NamedTuple):
+    """Where a record sits in a crawler corpus file, so it is read only when chunked"""
+
+    path: str
+    offset: int
+
+    def load(self) -> Dict[str, Any]:
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            return json.loads(f.readline())
+
+
+class DocumentChunker:
+    """Splits knowledge base documents into chunks with source metadata"""
+
+    def __init__(self):
+        # Initialize text splitter for chunking
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=1000,
+            chunk_overlap=200,
+            length_function=len,
+            separators=["\n\n", "\n", " ", ""],
+        )
+
+    def extract_source_info(self, filename: str, content: str) -> Tuple[str, str]:
+        """
+        Extract source information from filename and content
+
+        Args:
+            filename: Name of the file
+            content: Content of the file
+
+        Returns:
+            Tuple of (source_type, source_url_or_name)
+        """
+        parsed = parse_document(filename, content)
+        return parsed.source_type, parsed.source_reference
+
+    def extract_title(self, content: str) -> str:
+        """Extract title from content"""
+        return parse_document("", content).title
+
+    def clean_content(self, content: str) -> str:
+        """Clean content by removing metadata headers"""
+        return parse_document("", content).body
+
+    def process_file(self, filepath: str) -> List[Document]:
+        """
+        Process a single file and return list of Document chunks
+
+        Args:
+            filepath: Path to the file to process
+
+        Returns:
+            List of Document objects with content and metadata
+        """
+        filename = os.path.basename(filepath)
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                content = f.read()
+        except Exception as e:
+            print(f"Error reading file {filename}: {e}")
+            return []
+
+        return self.process_content(filename, content)
+
+    def process_content(self, filename: str, content: str) -> List[Document]:
+        """
+        Chunk the content of a knowledge base file
+
+        Args:
+            filename: Name of the file
+            content: Content of the file
+
+        Returns:
+            List of Document objects with content and metadata
+        """
+        # Source information, title and cleaned content in one scan
+        parsed = parse_document(filename, content)
+
+        return self.build_documents(
+            parsed.body,
+            parsed.source_type,
+            parsed.source_reference,
+            parsed.title,
+            filename,
+        )
+
+    def process_corpus_record(self, record: Dict[str, Any]) -> List[Document]:
+        """
+        Chunk a record from a crawler corpus file
+
+        Records already carry their source and title, so only the body is
+        cleaned, the same way as a .txt file's, e.g. of PDF page markers.
+
+        Args:
+            record: Corpus record with url, title, content and filename
+
+        Returns:
+            List of Document objects with content and metadata
+        """
+        return self.build_documents(
+            self.clean_content(record["content"]),
+            record.get("source_type", "web"),
+            record["url"],
+            record.get("title") or "Untitled Document",
+            record.get("filename", record["url"]),
+        )
+
+    def build_documents(
+        self,
+        cleaned_content: str,
+        source_type: str,
+        source_reference: str,
+        title: str,
+        filename: str,
+    ) -> List[Document]:
+        """
+        Split cleaned content into Document chunks with source metadata
+
+        Args:
+            cleaned_content: Document body without headers
+            source_type: "web" or "pdf"
+            source_reference: Source URL or PDF name
+            title: Document title
+            filename: Knowledge base filename
+
+        Returns:
+            List of Document objects with content and metadata
+        """
+        if not cleaned_content.strip():
+            print(f"Warning: No content found in {filename}")
+            return []
+
+        # Split content into chunks
+        chunks = self.text_splitter.split_text(cleaned_content)
+
+        # Create Document objects with metadata
+        documents = []
+        for i, chunk in enumerate(chunks):
+            metadata = {
+                "source_type": source_type,
+                "source_reference": source_reference,
+                "title": title,
+                "filename": filename,
+                "chunk_index": i,
+                "total_chunks": len(chunks),
+            }
+
+            documents.append(Document(page_content=chunk, metadata=metadata))
+
+        return documents
+
+    def chunk_source(
+        self, name: str, source: Any, recorded_hash: str = None
+    ) -> Tuple[str, str, List[Document]]:
+        """
+        Fingerprint a source and chunk it unless its hash is the recorded one
+
+        Unlike ``process_file``, errors reading a file are raised, so they
+        are not mistaken for a file without content.
+
+        Args:
+            name: Source name
+            source: File path, corpus record or CorpusRecord
+            recorded_hash: Hash from the ingestion manifest, if any
+
+        Returns:
+            Tuple of (name, content hash, Documents or None if unchanged)
+        """
+        if isinstance(source, CorpusRecord):
+            source = source.load()
+        if isinstance(source, dict):
+            # Only what ends up in the chunks, not e.g. the crawl time, so a
+            # recrawl of an unchanged page is not chunked again
+            digest = content_hash(
+                json.dumps([source["url"], source.get("title"), source["content"]])
+            )
+            if digest == recorded_hash:
+                return name, digest, None
+            return name, digest, self.process_corpus_record(source)
+
+        # Hash and decode the same read of the file
+        with open(source, "rb") as f:
+            data = f.read()
+        digest = content_hash(data)
+        if digest == recorded_hash:
+            return name, digest, None
+        return name, digest, self.process_content(name, data.decode("utf-8"))
+
+
+_worker_chunker = None
+
+
+def chunk_source_task(
+    name: str, source: Any, recorded_hash: str = None
+) -> Tuple[str, str, List[Document]]:
+    """Worker task: fingerprint and chunk one source"""
+    global _worker_chunker
+    if _worker_chunker is None:
+        _worker_chunker = DocumentChunker()
+    return _worker_chunker.chunk_source(name, source, recorded_hash)
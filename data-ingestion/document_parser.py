@@ -0,0 +1,121 @@
+"""
+Document Parser
+Single-pass parsing of knowledge base files into source info, title and body
+"""
+
+import re
+from typing import NamedTuple, Optional
+
+# Every piece of markup the knowledge base files carry, in one alternation so
+# a single scan finds the source URL and title and everything to strip. The
+# URL and title are recognized without a trailing newline (last line of the
+# file) but only removed with one, as the separate passes this replaces did.
+# Each branch starts with a literal ("==*" rather than "=+"), which lets the
+# regex engine skip ahead to positions holding one of those characters
+# instead of trying every branch at every position.
+_MARKUP = re.compile(
+    r"URL: (?P<url>https?://[^\n]+)(?P<url_end>\n)?"
+    r"|Title: (?P<title>[^\n]+)(?P<title_end>\n)?"
+    r"|Source PDF: [^\n]+\n"
+    r"|==*\n"
+    r"|--- Page \d+ ---\n"
+)
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_PDF_FILENAME = re.compile(r"PDF_(.+?)_[a-f0-9]+\.txt")
+
+SEPARATOR = "=" * 50
+UNTITLED = "Untitled Document"
+
+
+class ParsedDocument(NamedTuple):
+    source_type: str
+    source_reference: str
+    title: str
+    body: str
+
+
+def source_info(filename: str, url: Optional[str]) -> tuple:
+    """
+    Source type and reference of a file
+
+    Args:
+        filename: Name of the file
+        url: First URL header in the file, if any
+
+    Returns:
+        Tuple of (source_type, source_url_or_name)
+    """
+    if not filename.startswith("PDF_"):
+        return "web", url or filename
+
+    if url:
+        return "pdf", url
+
+    # Fallback: PDF name from a filename like PDF_Aven-CFPBHELOCBooklet_6d37cdde.txt
+    pdf_match = _PDF_FILENAME.match(filename)
+    if pdf_match:
+        return "pdf", f"{pdf_match.group(1)}.pdf"
+    return "pdf", filename
+
+
+def first_line_title(content: str) -> str:
+    """Title for a file without a Title header: its first line of content"""
+    for line in content.split("\n"):
+        line = line.strip()
+        if (
+            line
+            and not line.startswith("URL:")
+            and not line.startswith("Title:")
+            and line != SEPARATOR
+        ):
+            return line[:100] + "..." if len(line) > 100 else line
+
+    return UNTITLED
+
+
+def parse_document(filename: str, content: str) -> ParsedDocument:
+    """
+    Parse a knowledge base file in one scan
+
+    Finds the first URL and Title headers and strips the URL, Title and
+    Source PDF lines, separator lines and page markers in the same pass,
+    then collapses blank lines. The result matches running the individual
+    searches and substitutions one after another, except when markers are
+    run together on a single line.
+
+    Args:
+        filename: Name of the file
+        content: Content of the file
+
+    Returns:
+        ParsedDocument with source type, source reference, title and body
+    """
+    url = title = None
+    pieces = []
+    position = 0
+
+    for match in _MARKUP.finditer(content):
+        if match.group("url") is not None:
+            if url is None:
+                url = match.group("url")
+            if match.group("url_end") is None:
+                continue
+        elif match.group("title") is not None:
+            if title is None:
+                title = match.group("title")
+            if match.group("title_end") is None:
+                continue
+
+        pieces.append(content[position : match.start()])
+        position = match.end()
+
+    pieces.append(content[position:])
+    body = _BLANK_LINES.sub("\n\n", "".join(pieces)).strip()
+
+    source_type, source_reference = source_info(filename, url)
+    return ParsedDocument(
+        source_type,
+        source_reference,
+        title if title is not None else first_line_title(content),
+        body,
+    )
@@ -0,0 +1,170 @@
+"""
+Embedding Pipeline
+Embeds chunks in batches and upserts them to Pinecone while the next batch encodes
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from langchain.schema import Document
+
+from ingestion_manifest import document_vector_id
+
+# Chunks per encode call and per upsert request. At 384 dimensions plus up to
+# ~1000 characters of text metadata this stays well under Pinecone's 2 MB
+# request limit.
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 1.0
+
+
+def build_vector(
+    document: Document, embedding: List[float], vector_id: str, document_name: str
+) -> Dict[str, Any]:
+    """Pinecone vector for a chunk, with its text and source metadata"""
+    return {
+        "id": vector_id,
+        "values": embedding,
+        "metadata": {
+            "document_name": document_name,
+            "text": document.page_content,
+            "source_type": document.metadata.get("source_type", "unknown"),
+            "source_reference": document.metadata.get("source_reference", "unknown"),
+            "title": document.metadata.get("title", "Untitled"),
+            "filename": document.metadata.get("filename", "unknown"),
+            "chunk_index": document.metadata.get("chunk_index", 0),
+        },
+    }
+
+
+class EmbeddingPipeline:
+    """
+    Streams chunks through batched encoding and concurrent upserts
+
+    Chunks are taken from the input in batches of ``batch_size``, encoded on
+    the calling thread and handed to a thread pool for upserting, so the next
+    batch encodes while earlier ones are in flight. At most ``max_in_flight``
+    upserts are pending at a time; when the limit is reached the pipeline
+    waits for the oldest one, which keeps memory bounded however many chunks
+    come in. A failed upsert is retried with exponential backoff before the
+    run is aborted.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], List[List[float]]],
+        index: Any,
+        namespace: str,
+        document_name: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    ):
+        """
+        Args:
+            encode: Function returning one embedding per text
+            index: Pinecone index, or anything with the same upsert()
+            namespace: Namespace to upsert into
+            document_name: Stored in every vector's metadata
+            batch_size: Chunks per encode call and upsert request
+            max_in_flight: Maximum concurrent upsert requests
+            max_retries: Retries per failed upsert before giving up
+            retry_backoff: Delay before the first retry, doubled each time
+        """
+        self.encode = encode
+        self.index = index
+        self.namespace = namespace
+        self.document_name = document_name
+        self.batch_size = max(1, batch_size)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retries = 0
+        self._retries_lock = threading.Lock()
+
+    def _upsert(self, vectors: List[Dict[str, Any]]) -> int:
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.index.upsert(vectors=vectors, namespace=self.namespace)
+                return len(vectors)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2**attempt
+                with self._retries_lock:
+                    self.retries += 1
+                print(
+                    f"  Upsert of {len(vectors)} vectors failed ({e}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+    def run(
+        self, documents: Iterable[Document], ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Embed and upsert every chunk
+
+        Args:
+            documents: Chunks to store, consumed lazily
+            ids: Vector ID for each chunk, in the same order; defaults to
+                IDs derived from each chunk's file and content
+
+        Returns:
+            Dictionary with the number of chunks and batches stored, retries,
+            elapsed seconds and throughput in chunks per second
+        """
+        started = time.perf_counter()
+        documents = iter(documents)
+        ids = iter(ids) if ids is not None else None
+        stored = 0
+        batches = 0
+        pending: deque = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            try:
+                while True:
+                    batch = list(islice(documents, self.batch_size))
+                    if not batch:
+                        break
+                    if ids is None:
+                        batch_ids = [document_vector_id(d) for d in batch]
+                    else:
+                        batch_ids = list(islice(ids, len(batch)))
+                        if len(batch_ids) != len(batch):
+                            raise ValueError("Fewer vector IDs than documents")
+
+                    embeddings = self.encode([d.page_content for d in batch])
+                    vectors = [
+                        build_vector(document, embedding, id_, self.document_name)
+                        for document, embedding, id_ in zip(
+                            batch, embeddings, batch_ids
+                        )
+                    ]
+
+                    if len(pending) >= self.max_in_flight:
+                        stored += pending.popleft().result()
+                    pending.append(pool.submit(self._upsert, vectors))
+                    batches += 1
+
+                while pending:
+                    stored += pending.popleft().result()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        elapsed = time.perf_counter() - started
+        return {
+            "chunks": stored,
+            "batches": batches,
+            "retries": self.retries,
+            "seconds": round(elapsed, 2),
+            "chunks_per_second": round(stored / elapsed, 1) if elapsed else 0.0,
+        }
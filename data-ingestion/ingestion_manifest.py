@@ -0,0 +1,242 @@
+"""
+Ingestion Manifest
+Tracks which chunks of which knowledge base files are already stored in Pinecone
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import quote
+
+from langchain.schema import Document
+
+DEFAULT_MANIFEST_PATH = ".ingestion_manifest.json"
+MANIFEST_VERSION = 1
+
+# Metadata that changes what a chunk means, and therefore its hash.
+# chunk_index and total_chunks are left out so inserting text near the top of
+# a file does not force every later chunk to be re-embedded.
+HASHED_METADATA = ("source_type", "source_reference", "title", "filename")
+
+
+def content_hash(data) -> str:
+    """SHA-256 hex digest of a string or bytes"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_hash(document: Document) -> str:
+    """Hash of a chunk's text and the metadata stored alongside it"""
+    payload = {key: document.metadata.get(key) for key in HASHED_METADATA}
+    payload["text"] = document.page_content
+    return content_hash(json.dumps(payload, sort_keys=True))
+
+
+def vector_id(filename: str, chunk_digest: str) -> str:
+    """
+    Stable vector ID for a chunk of a file
+
+    The ID depends only on the file and the chunk's content, so it survives
+    other files being added or removed and re-upserting a chunk overwrites
+    its vector. Pinecone IDs must be ASCII, so the filename is percent-encoded;
+    every ID of a file shares the prefix "<filename>#".
+    """
+    return f"{quote(filename, safe='')}#{chunk_digest[:32]}"
+
+
+def document_vector_id(document: Document) -> str:
+    """Stable vector ID of a chunk, from its filename metadata and content"""
+    return vector_id(document.metadata.get("filename", "unknown"), chunk_hash(document))
+
+
+def list_vector_ids(index, namespace: str, prefix: Optional[str] = None) -> Set[str]:
+    """IDs of every vector in a namespace, optionally only those with a prefix"""
+    ids = set()
+    # list() pages through the IDs in the namespace (serverless indexes only)
+    for page in index.list(prefix=prefix, namespace=namespace):
+        ids.update(page)
+    return ids
+
+
+def delete_vectors(index, namespace: str, ids: List[str], batch_size: int = 1000):
+    """Delete vectors by ID in batches"""
+    # Pinecone accepts at most 1000 IDs per delete request
+    for start in range(0, len(ids), batch_size):
+        index.delete(ids=ids[start : start + batch_size], namespace=namespace)
+
+
+def reconcile(
+    index,
+    namespace: str,
+    keep_ids: Iterable[str],
+    existing_ids: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """
+    Delete every vector in the namespace whose ID is not in keep_ids
+
+    Args:
+        index: Pinecone index, or anything with the same list() and delete()
+        namespace: Namespace to reconcile
+        keep_ids: IDs of the vectors the knowledge base still produces
+        existing_ids: IDs in the namespace if already listed
+
+    Returns:
+        Sorted IDs of the deleted vectors
+    """
+    if existing_ids is None:
+        existing_ids = list_vector_ids(index, namespace)
+    stale_ids = sorted(set(existing_ids) - set(keep_ids))
+    delete_vectors(index, namespace, stale_ids)
+    return stale_ids
+
+
+class IngestionManifest:
+    """
+    On-disk record of file hash -> chunk hashes -> vector IDs
+
+    A file whose hash matches the manifest is skipped without being chunked.
+    A changed file is re-chunked, and only chunks whose hash is not yet
+    recorded are embedded; vectors of chunks or files that disappeared are
+    deleted. The manifest is bound to one index and namespace, and starts
+    empty if either differs from the last run.
+
+    Vector IDs whose delete has not yet succeeded are kept as pending
+    deletes, so a failed delete is retried by the next run instead of
+    leaving orphaned vectors.
+
+    Note that skipped chunks keep the chunk_index/total_chunks metadata they
+    were stored with.
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        namespace: str,
+        path: str = DEFAULT_MANIFEST_PATH,
+    ):
+        self.index_name = index_name
+        self.namespace = namespace
+        self.path = path
+        data = self._load()
+        self.files: Dict[str, Dict[str, any]] = data.get("files", {})
+        self.pending_deletes: List[str] = data.get("pending_deletes", [])
+
+    def _load(self) -> Dict[str, any]:
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable manifest {self.path}: {e}")
+            return {}
+
+        if (
+            data.get("version") != MANIFEST_VERSION
+            or data.get("index_name") != self.index_name
+            or data.get("namespace") != self.namespace
+        ):
+            print(f"Manifest {self.path} is for another index, starting fresh")
+            return {}
+
+        return data
+
+    def save(self) -> None:
+        """Atomically write the manifest to disk"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "index_name": self.index_name,
+                    "namespace": self.namespace,
+                    "files": self.files,
+                    "pending_deletes": self.pending_deletes,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self.path)
+
+    def file_hash(self, filename: str) -> Optional[str]:
+        """Recorded hash of a file, or None if it was never ingested"""
+        entry = self.files.get(filename)
+        return entry["file_hash"] if entry else None
+
+    def chunk_ids(self, filename: str) -> Dict[str, str]:
+        """Chunk hash -> vector ID for the chunks recorded for a file"""
+        entry = self.files.get(filename)
+        return dict(entry["chunks"]) if entry else {}
+
+    def diff(
+        self, filename: str, documents: List[Document], reembed: bool = False
+    ) -> Dict[str, any]:
+        """
+        Compare a file's new chunks with the recorded ones
+
+        Args:
+            filename: Knowledge base filename
+            documents: The file's chunks
+            reembed: Treat every chunk as new, e.g. after a model change
+
+        Returns:
+            Dictionary with the chunks to embed ("new", with their "new_ids"),
+            the vector IDs to delete ("stale") and the file's resulting
+            chunk hash -> vector ID map ("chunks")
+        """
+        recorded = self.chunk_ids(filename)
+        chunks = {}
+        new, new_ids = [], []
+
+        for document in documents:
+            digest = chunk_hash(document)
+            if digest in chunks:
+                # Identical chunk repeated within the file, store it once
+                continue
+
+            chunks[digest] = recorded.get(digest) or vector_id(filename, digest)
+            if reembed or digest not in recorded:
+                new.append(document)
+                new_ids.append(chunks[digest])
+
+        stale = [id_ for digest, id_ in recorded.items() if digest not in chunks]
+        return {"new": new, "new_ids": new_ids, "stale": stale, "chunks": chunks}
+
+    def record(self, filename: str, digest: str, chunks: Dict[str, str]) -> None:
+        self.files[filename] = {"file_hash": digest, "chunks": chunks}
+
+    def remove(self, filename: str) -> List[str]:
+        """Forget a file and return the vector IDs it had"""
+        entry = self.files.pop(filename, None)
+        return list(entry["chunks"].values()) if entry else []
+
+    def defer_deletes(self, ids: Iterable[str]) -> None:
+        """Add vector IDs to the pending deletes, except those still in use"""
+        in_use = self.vector_ids()
+        self.pending_deletes = sorted(
+            (set(self.pending_deletes) | set(ids)) - in_use
+        )
+
+    def vector_ids(self) -> Set[str]:
+        """Vector IDs of every recorded chunk"""
+        return {
+            id_ for entry in self.files.values() for id_ in entry["chunks"].values()
+        }
+
+    def missing(self, filenames: Iterable[str]) -> List[str]:
+        """Recorded files that are not among the given filenames"""
+        present = set(filenames)
+        return [filename for filename in self.files if filename not in present]
@@ -6,224 +6,368 @@ Processes all files in the knowledge-base folder and stores them in Pinecone wit
 
 import os
 import sys
-import re
+import json
+import multiprocessing
 import dotenv
-from typing import List, Dict, Any, Tuple
-from pinecone_client import PineconeClient
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, tee
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Tuple
+from ingestion_manifest import IngestionManifest
+from document_chunker import CorpusRecord, DocumentChunker, chunk_source_task
 from langchain.schema import Document
 
+if TYPE_CHECKING:
+    from pinecone_client import PineconeClient
+
 # Load environment variables
 dotenv.load_dotenv()
 
+# Files each chunking worker may be ahead of the embedding stage
+CHUNK_AHEAD_PER_WORKER = 4
+# Files per worker process before a chunking pool beats chunking in-process
+MIN_FILES_PER_CHUNK_WORKER = 100
+
+
+def _index_corpus(corpus_path: str) -> List[Tuple[str, int]]:
+    """
+    Find the latest line of every live document in a crawler corpus file
+
+    Only the name and byte offset of each URL's latest record are kept, so
+    memory does not grow with the size of the records.
+
+    Returns:
+        List of (name, offset) pairs
+    """
+    latest = {}
+    offset = 0
+    with open(corpus_path, "rb") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            if record:
+                latest[record["url"]] = (
+                    (record.get("filename", record["url"]), offset)
+                    if record["status"] == "ok"
+                    else None
+                )
+            offset += len(line)
+
+    return [entry for entry in latest.values() if entry]
+
+
+def load_corpus(corpus_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the current record for every document in a crawler corpus file
+
+    The corpus is JSON Lines written by the crawler's JsonlCorpusSink. Later
+    records for a URL supersede earlier ones and "removed" tombstones drop it.
+    One pass finds the latest line of each URL, then records are read back
+    from those lines one at a time.
 
-class KnowledgeBaseProcessor:
+    Args:
+        corpus_path: Path to the corpus .jsonl file
+
+    Returns:
+        Iterator over the latest record per URL
+    """
+    entries = _index_corpus(corpus_path)
+    with open(corpus_path, "rb") as f:
+        for _, offset in entries:
+            f.seek(offset)
+            yield json.loads(f.readline())
+
+
+class KnowledgeBaseProcessor(DocumentChunker):
     """Processes knowledge base files and stores them in Pinecone with source tracking"""
 
     def __init__(self, knowledge_base_folder: str = "../knowledge-base"):
+        super().__init__()
         self.knowledge_base_folder = knowledge_base_folder
-        self.pinecone_client = PineconeClient()
+        self._pinecone_client = None
         self.index_name = os.getenv("INDEX_NAME", "aven-knowledge-base")
         self.namespace = "aven-knowledge-base"
 
-        # Initialize text splitter for chunking
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""],
-        )
+    @property
+    def pinecone_client(self) -> "PineconeClient":
+        """Pinecone client, created on first use"""
+        if self._pinecone_client is None:
+            # Imported here so this module stays cheap to import in the
+            # spawned chunking workers, which re-import the main module
+            from pinecone_client import PineconeClient
+
+            self._pinecone_client = PineconeClient()
+        return self._pinecone_client
 
-    def extract_source_info(self, filename: str, content: str) -> Tuple[str, str]:
+    def _list_sources(self, corpus_path: str = None) -> List[Tuple[str, Any]]:
         """
-        Extract source information from filename and content
+        List the documents to ingest
 
         Args:
-            filename: Name of the file
-            content: Content of the file
+            corpus_path: Crawler corpus file to read instead of the folder
 
         Returns:
-            Tuple of (source_type, source_url_or_name)
+            List of (name, source) pairs, where source is a file path or
+            the CorpusRecord to read
         """
-        if filename.startswith("PDF_"):
-            # First try to extract URL from PDF content (PDFs now have URLs too)
-            url_match = re.search(r"URL: (https?://[^\n]+)", content)
-            if url_match:
-                return "pdf", url_match.group(1)
-            else:
-                # Fallback: Extract PDF name from filename like PDF_Aven-CFPBHELOCBooklet_6d37cdde.txt
-                pdf_match = re.match(r"PDF_(.+?)_[a-f0-9]+\.txt", filename)
-                if pdf_match:
-                    pdf_name = pdf_match.group(1)
-                    return "pdf", f"{pdf_name}.pdf"
-                else:
-                    return "pdf", filename
-        else:
-            # Extract URL from web content
-            url_match = re.search(r"URL: (https?://[^\n]+)", content)
-            if url_match:
-                return "web", url_match.group(1)
-            else:
-                return "web", filename
-
-    def extract_title(self, content: str) -> str:
-        """Extract title from content"""
-        title_match = re.search(r"Title: ([^\n]+)", content)
-        if title_match:
-            return title_match.group(1)
-
-        # If no title found, try to get first line of actual content
-        lines = content.split("\n")
-        for line in lines:
-            line = line.strip()
-            if (
-                line
-                and not line.startswith("URL:")
-                and not line.startswith("Title:")
-                and line != "=" * 50
-            ):
-                return line[:100] + "..." if len(line) > 100 else line
-
-        return "Untitled Document"
+        if corpus_path:
+            return [
+                (name, CorpusRecord(corpus_path, offset))
+                for name, offset in _index_corpus(corpus_path)
+            ]
 
-    def clean_content(self, content: str) -> str:
-        """Clean content by removing metadata headers"""
-        # Remove URL and Title lines
-        content = re.sub(r"URL: https?://[^\n]+\n", "", content)
-        content = re.sub(r"Title: [^\n]+\n", "", content)
-        content = re.sub(r"Source PDF: [^\n]+\n", "", content)
-
-        # Remove separator lines
-        content = re.sub(r"=+\n", "", content)
-
-        # Remove page markers for PDFs
-        content = re.sub(r"--- Page \d+ ---\n", "", content)
-
-        # Clean up extra whitespace
-        content = re.sub(r"\n\s*\n", "\n\n", content)
-        content = content.strip()
+        if not os.path.exists(self.knowledge_base_folder):
+            raise FileNotFoundError(
+                f"Knowledge base folder not found: {self.knowledge_base_folder}"
+            )
 
-        return content
+        # Get all .txt files
+        txt_files = [
+            f for f in os.listdir(self.knowledge_base_folder) if f.endswith(".txt")
+        ]
+        return [
+            (filename, os.path.join(self.knowledge_base_folder, filename))
+            for filename in txt_files
+        ]
 
-    def process_file(self, filepath: str) -> List[Document]:
+    def _chunk_sources(
+        self,
+        sources: List[Tuple[str, Any]],
+        manifest: IngestionManifest,
+        full: bool,
+        workers: int,
+    ) -> Iterator[Tuple[str, Any]]:
         """
-        Process a single file and return list of Document chunks
+        Chunk sources in a process pool, yielding results in source order
 
-        Args:
-            filepath: Path to the file to process
+        At most ``CHUNK_AHEAD_PER_WORKER`` files per worker are read and
+        chunked ahead of the consumer, so chunks are handed on as they are
+        produced and memory does not grow with the corpus.
 
         Returns:
-            List of Document objects with content and metadata
+            Iterator over (name, chunk_source result or exception) pairs
         """
-        filename = os.path.basename(filepath)
+        tasks = [
+            (name, source, None if full else manifest.file_hash(name))
+            for name, source in sources
+        ]
 
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error reading file {filename}: {e}")
-            return []
-
-        # Extract source information
-        source_type, source_reference = self.extract_source_info(filename, content)
-        title = self.extract_title(content)
-
-        # Clean content
-        cleaned_content = self.clean_content(content)
-
-        if not cleaned_content.strip():
-            print(f"Warning: No content found in {filename}")
-            return []
-
-        # Split content into chunks
-        chunks = self.text_splitter.split_text(cleaned_content)
-
-        # Create Document objects with metadata
-        documents = []
-        for i, chunk in enumerate(chunks):
-            metadata = {
-                "source_type": source_type,
-                "source_reference": source_reference,
-                "title": title,
-                "filename": filename,
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-            }
+        if workers <= 1:
+            for task in tasks:
+                try:
+                    yield task[0], self.chunk_source(*task)
+                except Exception as e:
+                    yield task[0], e
+            return
+
+        # Spawned rather than forked: the pool starts while the embedding
+        # model is loaded, and forking a process with its threads is unsafe
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            pending = deque()
+            tasks = iter(tasks)
+            for task in islice(tasks, workers * CHUNK_AHEAD_PER_WORKER):
+                pending.append((task[0], pool.submit(chunk_source_task, *task)))
+
+            while pending:
+                name, job = pending.popleft()
+                for task in islice(tasks, 1):
+                    pending.append((task[0], pool.submit(chunk_source_task, *task)))
+                try:
+                    yield name, job.result()
+                except Exception as e:
+                    yield name, e
+
+    def process_all_files(
+        self,
+        corpus_path: str = None,
+        full: bool = False,
+        reconcile: bool = True,
+        workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Sync the knowledge base folder into Pinecone
 
-            documents.append(Document(page_content=chunk, metadata=metadata))
+        Files whose hash matches the ingestion manifest are skipped; changed
+        files are re-chunked and only their new chunks are embedded and
+        upserted. Vector IDs are derived from each chunk's file and content,
+        so chunks already in the index are not embedded again even without a
+        manifest. Vectors of chunks and files that no longer exist, or no
+        longer have any content, are deleted.
 
-        return documents
+        Files are read and chunked by a pool of worker processes and their
+        new chunks stream into the embedding pipeline as they come in, so
+        reading, chunking and embedding overlap.
 
-    def process_all_files(self) -> Dict[str, Any]:
-        """
-        Process all files in the knowledge base folder
+        Args:
+            corpus_path: Read documents from this crawler corpus file (JSON
+                Lines) instead of the .txt files
+            full: Re-chunk and re-embed every file, ignoring the manifest
+            reconcile: List the namespace and delete every vector the
+                knowledge base no longer produces, not just those the
+                manifest knows about
+            workers: Processes reading and chunking files (1 chunks in
+                this process); by default one per ``MIN_FILES_PER_CHUNK_WORKER``
+                files, up to the CPU count
 
         Returns:
             Dictionary with processing results
         """
-        if not os.path.exists(self.knowledge_base_folder):
-            raise FileNotFoundError(
-                f"Knowledge base folder not found: {self.knowledge_base_folder}"
-            )
-
-        # Get all .txt files
-        txt_files = [
-            f for f in os.listdir(self.knowledge_base_folder) if f.endswith(".txt")
-        ]
+        sources = self._list_sources(corpus_path)
+        manifest = IngestionManifest(self.index_name, self.namespace)
+
+        results = {
+            "successful": 0,
+            "failed": 0,
+            "unchanged": 0,
+            "total_chunks": 0,
+            "embedded": 0,
+            "skipped": 0,
+            "deleted": 0,
+            "chunks_per_second": 0.0,
+            "errors": [],
+        }
 
-        if not txt_files:
-            print(f"No .txt files found in {self.knowledge_base_folder}")
-            return {"successful": 0, "failed": 0, "total_chunks": 0, "errors": []}
+        if not sources:
+            print(f"No documents found in {corpus_path or self.knowledge_base_folder}")
+            return results
 
-        print(f"Found {len(txt_files)} files to process")
+        print(f"Found {len(sources)} files to process")
+        workers = _chunk_worker_count(workers, len(sources))
 
         # Create Pinecone index if it doesn't exist
         print(f"Creating/checking Pinecone index: {self.index_name}")
         self.pinecone_client.create_pinecone_index(self.index_name)
 
-        # Process all files
-        all_documents = []
-        successful = 0
-        failed = 0
-        errors = []
-
-        for filename in txt_files:
-            filepath = os.path.join(self.knowledge_base_folder, filename)
-            print(f"Processing: {filename}")
-
+        existing_ids = None
+        if reconcile:
             try:
-                documents = self.process_file(filepath)
-                if documents:
-                    all_documents.extend(documents)
-                    successful += 1
-                    print(f"  ✓ Created {len(documents)} chunks")
-                else:
-                    failed += 1
-                    errors.append(f"No content extracted from {filename}")
-                    print(f"  ✗ No content extracted")
+                existing_ids = self.pinecone_client.list_vector_ids(
+                    self.index_name, self.namespace
+                )
+                print(f"Found {len(existing_ids)} vectors in the namespace")
             except Exception as e:
-                failed += 1
-                errors.append(f"Error processing {filename}: {str(e)}")
-                print(f"  ✗ Error: {e}")
+                print(f"Warning: Could not list vectors, skipping reconciliation: {e}")
 
-        # Store all documents in Pinecone
-        if all_documents:
-            print(f"\nStoring {len(all_documents)} chunks in Pinecone...")
-            try:
-                self.pinecone_client.store_embeddings(
-                    self.index_name, self.namespace, "knowledge_base", all_documents
+        stale_ids = []
+        updated = {}
+        emptied = []
+
+        def new_chunks() -> Iterator[Tuple[Document, str]]:
+            """Diff each chunked file against the manifest, yielding new chunks"""
+            for filename, result in self._chunk_sources(
+                sources, manifest, full, workers
+            ):
+                if isinstance(result, Exception):
+                    results["failed"] += 1
+                    results["errors"].append(f"Error processing {filename}: {result}")
+                    print(f"  ✗ Error processing {filename}: {result}")
+                    continue
+
+                _, digest, documents = result
+                if documents is None:
+                    chunk_count = len(manifest.chunk_ids(filename))
+                    results["successful"] += 1
+                    results["unchanged"] += 1
+                    results["skipped"] += chunk_count
+                    results["total_chunks"] += chunk_count
+                    continue
+
+                print(f"Processing: {filename}")
+                if not documents:
+                    # Nothing left to store, the file's old chunks go too
+                    emptied.append(filename)
+                    results["successful"] += 1
+                    print(f"  ✓ No content extracted, removing its chunks")
+                    continue
+
+                changes = manifest.diff(filename, documents, reembed=full)
+                if existing_ids is not None and not full:
+                    # Stored by an earlier run whose manifest was lost
+                    changes["new"], changes["new_ids"] = _not_stored(
+                        changes["new"], changes["new_ids"], existing_ids
+                    )
+                stale_ids.extend(changes["stale"])
+                updated[filename] = (digest, changes["chunks"])
+
+                results["successful"] += 1
+                results["total_chunks"] += len(changes["chunks"])
+                results["skipped"] += len(changes["chunks"]) - len(changes["new"])
+                print(
+                    f"  ✓ Created {len(documents)} chunks, "
+                    f"{len(changes['new'])} new, {len(changes['stale'])} removed"
                 )
-                print("✓ Successfully stored all embeddings in Pinecone")
-            except Exception as e:
-                errors.append(f"Error storing embeddings: {str(e)}")
-                print(f"✗ Error storing embeddings: {e}")
-
-        return {
-            "successful": successful,
-            "failed": failed,
-            "total_chunks": len(all_documents),
-            "errors": errors,
-        }
+                yield from zip(changes["new"], changes["new_ids"])
+
+        # Store new chunks in Pinecone while later files are still chunked
+        stream = new_chunks()
+        documents, ids = tee(stream)
+        try:
+            stats = self.pinecone_client.store_embeddings(
+                self.index_name,
+                self.namespace,
+                "knowledge_base",
+                (document for document, _ in documents),
+                ids=(id_ for _, id_ in ids),
+            )
+            results["embedded"] = stats["chunks"]
+            results["chunks_per_second"] = stats["chunks_per_second"]
+            if stats["chunks"]:
+                print(
+                    f"✓ Stored {stats['chunks']} new embeddings in "
+                    f"{stats['seconds']}s ({stats['chunks_per_second']} chunks/s)"
+                )
+        except Exception as e:
+            # Leave the manifest as it was so the next run retries the delta
+            results["errors"].append(f"Error storing embeddings: {str(e)}")
+            print(f"✗ Error storing embeddings: {e}")
+            return results
+        finally:
+            stream.close()
+
+        # Files that were ingested before but are gone or empty now
+        removed = manifest.missing(filename for filename, _ in sources)
+        for filename in removed + emptied:
+            print(f"Removed: {filename}")
+            stale_ids.extend(manifest.remove(filename))
+
+        for filename, (digest, chunks) in updated.items():
+            manifest.record(filename, digest, chunks)
+
+        # Save the stale IDs with the manifest before deleting them, so a
+        # failed delete is retried by the next run
+        manifest.defer_deletes(stale_ids)
+        manifest.save()
+
+        # Reconciliation would delete the vectors of files that could not be
+        # read, so it only runs when every file was chunked
+        try:
+            if existing_ids is not None and not results["failed"]:
+                print("Reconciling the namespace with the knowledge base...")
+                deleted = self.pinecone_client.reconcile(
+                    self.index_name,
+                    self.namespace,
+                    manifest.vector_ids(),
+                    existing_ids=existing_ids,
+                )
+            else:
+                deleted = manifest.pending_deletes
+                if deleted:
+                    print(f"Deleting {len(deleted)} stale vectors from Pinecone...")
+                    self.pinecone_client.delete_vectors(
+                        self.index_name, self.namespace, deleted
+                    )
+            results["deleted"] = len(deleted)
+            manifest.pending_deletes = []
+            manifest.save()
+        except Exception as e:
+            results["errors"].append(f"Error deleting stale vectors: {str(e)}")
+            print(f"✗ Error deleting stale vectors: {e}")
+
+        return results
 
     def query_with_source(self, query_text: str, k: int = 3) -> Dict[str, Any]:
         """
@@ -252,6 +396,21 @@ class KnowledgeBaseProcessor:
             }
 
 
+def _chunk_worker_count(workers: Optional[int], source_count: int) -> int:
+    """Chunking processes to use, at least 1 and no more than the sources"""
+    if workers is None:
+        workers = min(os.cpu_count() or 1, source_count // MIN_FILES_PER_CHUNK_WORKER)
+    return max(1, min(workers, source_count))
+
+
+def _not_stored(
+    documents: List[Document], ids: List[str], stored_ids: set
+) -> Tuple[List[Document], List[str]]:
+    """Drop the documents whose vector ID is already stored"""
+    kept = [(doc, id_) for doc, id_ in zip(documents, ids) if id_ not in stored_ids]
+    return [doc for doc, _ in kept], [id_ for _, id_ in kept]
+
+
 def main():
     """Main function to process knowledge base"""
     import argparse
@@ -265,6 +424,27 @@ def main():
         action="store_true",
         help="Only run test queries, skip processing",
     )
+    parser.add_argument(
+        "--corpus",
+        help="Ingest from a crawler corpus .jsonl file instead of the .txt files",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-embed every chunk instead of only new and changed ones",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes reading and chunking files (1 chunks in this process, "
+        "default: one per 100 files up to the CPU count)",
+    )
+    parser.add_argument(
+        "--no-reconcile",
+        action="store_true",
+        help="Only delete stale vectors the manifest knows about, without "
+        "listing the namespace",
+    )
     args = parser.parse_args()
 
     if args.query_only:
@@ -278,14 +458,25 @@ def main():
     processor = KnowledgeBaseProcessor()
 
     try:
-        results = processor.process_all_files()
+        results = processor.process_all_files(
+            corpus_path=args.corpus,
+            full=args.full,
+            reconcile=not args.no_reconcile,
+            workers=args.workers,
+        )
 
         print("\n" + "=" * 60)
         print("PROCESSING RESULTS")
         print("=" * 60)
         print(f"Files processed successfully: {results['successful']}")
+        print(f"Files unchanged: {results['unchanged']}")
         print(f"Files failed: {results['failed']}")
-        print(f"Total chunks created: {results['total_chunks']}")
+        print(f"Total chunks: {results['total_chunks']}")
+        print(f"Chunks embedded: {results['embedded']}")
+        print(f"Chunks skipped: {results['skipped']}")
+        print(f"Vectors deleted: {results['deleted']}")
+        if results["embedded"]:
+            print(f"Embedding throughput: {results['chunks_per_second']} chunks/s")
 
         if results["errors"]:
             print(f"\nErrors encountered:")
@@ -7,6 +7,12 @@ from sentence_transformers import SentenceTransformer
 from langchain_huggingface import HuggingFaceEmbeddings
 import google.generativeai as genai
 from prompt_manager import PromptTemplateManager
+from embedding_pipeline import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_IN_FLIGHT,
+    EmbeddingPipeline,
+)
+import ingestion_manifest
 
 dotenv.load_dotenv()
 
@@ -53,28 +59,50 @@ class PineconeClient:
     def delete_pinecone_index(self, index_name):
         return self.pinecone_client.delete_index(index_name)
 
-    def store_embeddings(self, index_name, namespace, document_name, texts):
-        index = self.pinecone_client.Index(index_name)
-        embeddings = self.model.encode([t.page_content for t in texts]).tolist()
-
-        vectors = []
-        for i, (embedding, t) in enumerate(zip(embeddings, texts)):
-            vector = {
-                "id": f"{document_name}_{i}",
-                "values": embedding,
-                "metadata": {
-                    "document_name": document_name,
-                    "text": t.page_content,
-                    "source_type": t.metadata.get("source_type", "unknown"),
-                    "source_reference": t.metadata.get("source_reference", "unknown"),
-                    "title": t.metadata.get("title", "Untitled"),
-                    "filename": t.metadata.get("filename", "unknown"),
-                    "chunk_index": t.metadata.get("chunk_index", i),
-                },
-            }
-            vectors.append(vector)
+    def store_embeddings(
+        self,
+        index_name,
+        namespace,
+        document_name,
+        texts,
+        ids=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+    ):
+        """
+        Embed and upsert chunks in batches, see EmbeddingPipeline
+
+        texts and ids may be any iterables, including generators; vector IDs
+        default to ones derived from each chunk's file and content.
+        Returns the pipeline's stats, including chunks per second.
+        """
+        pipeline = EmbeddingPipeline(
+            lambda batch: self.model.encode(
+                batch, batch_size=len(batch), show_progress_bar=False
+            ).tolist(),
+            self.pinecone_client.Index(index_name),
+            namespace,
+            document_name,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+        )
+        return pipeline.run(texts, ids)
+
+    def delete_vectors(self, index_name, namespace, ids, batch_size=1000):
+        ingestion_manifest.delete_vectors(
+            self.pinecone_client.Index(index_name), namespace, ids, batch_size
+        )
 
-        index.upsert(vectors=vectors, namespace=namespace)
+    def list_vector_ids(self, index_name, namespace, prefix=None):
+        return ingestion_manifest.list_vector_ids(
+            self.pinecone_client.Index(index_name), namespace, prefix
+        )
+
+    def reconcile(self, index_name, namespace, keep_ids, existing_ids=None):
+        """Delete every vector in the namespace whose ID is not in keep_ids"""
+        return ingestion_manifest.reconcile(
+            self.pinecone_client.Index(index_name), namespace, keep_ids, existing_ids
+        )
 
     def query_pinecone(self, index_name, namespace, query_text):
         vectorstore = PineconeVectorStore.from_existing_index(
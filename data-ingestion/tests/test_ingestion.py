@@ -0,0 +1,259 @@
+"""
+Tests for the embedding pipeline, ingestion manifest and reconciliation
+
+Run from the data-ingestion folder:
+    python -m pytest tests
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain.schema import Document  # noqa: E402
+
+from document_chunker import CorpusRecord, DocumentChunker  # noqa: E402
+from embedding_pipeline import EmbeddingPipeline  # noqa: E402
+from ingestion_manifest import (  # noqa: E402
+    IngestionManifest,
+    chunk_hash,
+    reconcile,
+    vector_id,
+)
+from knowledge_base_processor import (  # noqa: E402
+    KnowledgeBaseProcessor,
+    load_corpus,
+)
+
+
+class FakeIndex:
+    """In-memory stand-in for a Pinecone index"""
+
+    def __init__(self, ids=(), fail_upserts=0, delay=0.0):
+        self.vectors = {id_: None for id_ in ids}
+        self.fail_upserts = fail_upserts
+        self.delay = delay
+        self.upserts = 0
+        self.deletes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def upsert(self, vectors, namespace):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.fail_upserts > 0
+            if fail:
+                self.fail_upserts -= 1
+        try:
+            time.sleep(self.delay)
+            if fail:
+                raise RuntimeError("503 Service Unavailable")
+            with self._lock:
+                self.upserts += 1
+                for vector in vectors:
+                    self.vectors[vector["id"]] = vector
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def list(self, prefix=None, namespace=""):
+        ids = sorted(i for i in self.vectors if not prefix or i.startswith(prefix))
+        for start in range(0, len(ids), 2):
+            yield ids[start : start + 2]
+
+    def delete(self, ids, namespace):
+        self.deletes.append(list(ids))
+        for id_ in ids:
+            self.vectors.pop(id_, None)
+
+
+def make_documents(texts, filename="doc.txt"):
+    return [
+        Document(page_content=text, metadata={"filename": filename, "chunk_index": i})
+        for i, text in enumerate(texts)
+    ]
+
+
+def encode(texts):
+    return [[float(len(text))] for text in texts]
+
+
+def make_pipeline(index, **kwargs):
+    kwargs.setdefault("retry_backoff", 0)
+    return EmbeddingPipeline(encode, index, "ns", "knowledge_base", **kwargs)
+
+
+def test_pipeline_stores_every_chunk_in_batches():
+    index = FakeIndex()
+    documents = make_documents([f"chunk {i}" for i in range(7)])
+
+    stats = make_pipeline(index, batch_size=3).run(iter(documents))
+
+    assert stats["chunks"] == 7
+    assert stats["batches"] == 3
+    assert index.upserts == 3
+    assert len(index.vectors) == 7
+
+
+def test_pipeline_retries_failed_upserts():
+    index = FakeIndex(fail_upserts=2)
+    documents = make_documents(["a", "b", "c"])
+
+    stats = make_pipeline(index, batch_size=1, max_retries=3).run(
+        documents, ids=["1", "2", "3"]
+    )
+
+    assert stats["retries"] == 2
+    assert stats["chunks"] == 3
+    assert sorted(index.vectors) == ["1", "2", "3"]
+
+
+def test_pipeline_gives_up_after_max_retries():
+    index = FakeIndex(fail_upserts=10)
+
+    with pytest.raises(RuntimeError):
+        make_pipeline(index, max_retries=2).run(make_documents(["a"]))
+
+    assert index.fail_upserts == 7
+
+
+def test_pipeline_bounds_upserts_in_flight():
+    index = FakeIndex(delay=0.02)
+    documents = make_documents([f"chunk {i}" for i in range(12)])
+
+    stats = make_pipeline(index, batch_size=1, max_in_flight=2).run(documents)
+
+    assert stats["chunks"] == 12
+    assert index.max_in_flight == 2
+
+
+def test_pipeline_rejects_missing_ids():
+    with pytest.raises(ValueError):
+        make_pipeline(FakeIndex()).run(make_documents(["a", "b"]), ids=["1"])
+
+
+def test_manifest_diff_finds_new_stale_and_duplicate_chunks(tmp_path):
+    manifest = IngestionManifest("index", "ns", str(tmp_path / "manifest.json"))
+    kept, dropped = make_documents(["kept", "dropped"])
+    manifest.record(
+        "doc.txt",
+        "digest",
+        {
+            chunk_hash(kept): vector_id("doc.txt", chunk_hash(kept)),
+            chunk_hash(dropped): vector_id("doc.txt", chunk_hash(dropped)),
+        },
+    )
+
+    changes = manifest.diff("doc.txt", make_documents(["kept", "added", "added"]))
+
+    assert [d.page_content for d in changes["new"]] == ["added"]
+    assert changes["new_ids"] == [vector_id("doc.txt", chunk_hash(changes["new"][0]))]
+    assert changes["stale"] == [vector_id("doc.txt", chunk_hash(dropped))]
+    assert len(changes["chunks"]) == 2
+
+
+def test_manifest_diff_reembed_returns_every_chunk(tmp_path):
+    manifest = IngestionManifest("index", "ns", str(tmp_path / "manifest.json"))
+    documents = make_documents(["a", "b"])
+    changes = manifest.diff("doc.txt", documents)
+    manifest.record("doc.txt", "digest", changes["chunks"])
+
+    assert manifest.diff("doc.txt", documents)["new"] == []
+    assert len(manifest.diff("doc.txt", documents, reembed=True)["new"]) == 2
+
+
+def test_manifest_keeps_pending_deletes_across_runs(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    manifest = IngestionManifest("index", "ns", path)
+    manifest.record("doc.txt", "digest", {"hash": "doc.txt#in-use"})
+    manifest.defer_deletes(["doc.txt#old", "doc.txt#in-use"])
+    manifest.save()
+
+    reloaded = IngestionManifest("index", "ns", path)
+
+    assert reloaded.pending_deletes == ["doc.txt#old"]
+    assert IngestionManifest("other", "ns", path).pending_deletes == []
+
+
+def test_reconcile_deletes_only_vectors_no_longer_produced():
+    index = FakeIndex(ids=["a#1", "a#2", "b#1", "legacy_0", "legacy_1"])
+
+    deleted = reconcile(index, "ns", {"a#1", "b#1", "c#1"})
+
+    assert deleted == ["a#2", "legacy_0", "legacy_1"]
+    assert sorted(index.vectors) == ["a#1", "b#1"]
+
+
+def test_reconcile_uses_listed_ids():
+    index = FakeIndex(ids=["a#1", "a#2"])
+
+    deleted = reconcile(index, "ns", {"a#1"}, existing_ids=["a#1"])
+
+    assert deleted == []
+    assert index.deletes == []
+    assert sorted(index.vectors) == ["a#1", "a#2"]
+
+
+def write_corpus(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.write('{"url": "https://example.com/trunc')
+
+
+def corpus_record(url, content, status="ok"):
+    return {
+        "url": url,
+        "title": url,
+        "content": content,
+        "filename": url.rsplit("/", 1)[-1] + ".txt",
+        "status": status,
+    }
+
+
+def test_corpus_yields_the_latest_record_of_live_urls(tmp_path):
+    path = str(tmp_path / "corpus.jsonl")
+    write_corpus(
+        path,
+        [
+            corpus_record("https://example.com/a", "old"),
+            corpus_record("https://example.com/b", "gone"),
+            corpus_record("https://example.com/a", "new"),
+            corpus_record("https://example.com/b", "", status="removed"),
+            corpus_record("https://example.com/c", "café"),
+        ],
+    )
+
+    records = [(r["url"], r["content"]) for r in load_corpus(path)]
+    sources = KnowledgeBaseProcessor()._list_sources(path)
+
+    assert records == [
+        ("https://example.com/a", "new"),
+        ("https://example.com/c", "café"),
+    ]
+    assert [name for name, _ in sources] == ["a.txt", "c.txt"]
+    assert all(isinstance(source, CorpusRecord) for _, source in sources)
+    assert [source.load()["content"] for _, source in sources] == ["new", "café"]
+
+
+def test_recrawled_corpus_record_is_not_chunked_again():
+    chunker = DocumentChunker()
+    record = dict(
+        corpus_record("https://example.com/a", "Some content"),
+        crawled_at="2025-01-01T00:00:00",
+    )
+    _, digest, documents = chunker.chunk_source("a.txt", record)
+    assert documents
+
+    recrawled = dict(record, crawled_at="2025-02-01T00:00:00", method="article")
+    assert chunker.chunk_source("a.txt", recrawled, digest) == ("a.txt", digest, None)
+
+    edited = dict(record, content="Other content")
+    assert chunker.chunk_source("a.txt", edited, digest)[1] != digest